@@ -8,23 +8,24 @@ Steps:
  3. Handle a prompt alert (send text)
 """
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.alert import Alert
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-import time
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # repo root, for selenium_lab
+from selenium_lab.driver_factory import create_chrome_driver
+from selenium_lab.settle import linger
+from selenium_lab.urls import url_for
 
 # Step 1: Initialize Chrome browser
-service = Service(ChromeDriverManager().install())
-driver = webdriver.Chrome(service=service)
-driver.maximize_window()
+driver = create_chrome_driver()
 
 try:
     # Step 2: Open the test website
-    driver.get("https://the-internet.herokuapp.com/javascript_alerts")
+    driver.get(url_for("/javascript_alerts"))
     print("Opened:", driver.title)
 
     wait = WebDriverWait(driver, 10)
@@ -74,6 +75,6 @@ except AssertionError:
 except Exception as e:
     print("⚠️ Error during test:", e)
 finally:
-    time.sleep(2)
+    linger()
     driver.quit()
     print("Browser closed.")
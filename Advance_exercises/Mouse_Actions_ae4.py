@@ -10,32 +10,33 @@ Also demonstrates:
   - Chaining multiple actions
 """
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-import time
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # repo root, for selenium_lab
+from selenium_lab.driver_factory import create_chrome_driver
+from selenium_lab.settle import linger, settle
+from selenium_lab.urls import url_for
 
 # Step 1: Initialize browser
-service = Service(ChromeDriverManager().install())
-driver = webdriver.Chrome(service=service)
-driver.maximize_window()
+driver = create_chrome_driver()
 actions = ActionChains(driver)
 wait = WebDriverWait(driver, 10)
 
 try:
     # ---------- HOVER ACTION ----------
-    driver.get("https://the-internet.herokuapp.com/hovers")
+    driver.get(url_for("/hovers"))
     print("Opened:", driver.title)
 
     # Hover over the first image card
     figure = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "div.figure")))
     actions.move_to_element(figure).perform()
     print("Hovered over element ✅")
-    time.sleep(1)
+    settle(driver)
 
     # ---------- DOUBLE CLICK & RIGHT CLICK (using JS demo site) ----------
     driver.get("https://testautomationpractice.blogspot.com/")
@@ -48,25 +49,25 @@ try:
     copy_button = driver.find_element(By.XPATH, "//button[text()='Copy Text']")
     actions.double_click(copy_button).perform()
     print("Performed double click ✅")
-    time.sleep(1)
+    settle(driver)
 
     # Right click on "Copy Text" button
     actions.context_click(copy_button).perform()
     print("Performed right click ✅")
-    time.sleep(1)
+    settle(driver)
 
     # ---------- DRAG AND DROP ----------
-    driver.get("https://the-internet.herokuapp.com/drag_and_drop")
+    driver.get(url_for("/drag_and_drop"))
     print("Opened Drag and Drop Demo")
 
     source = wait.until(EC.presence_of_element_located((By.ID, "column-a")))
     target = driver.find_element(By.ID, "column-b")
     actions.drag_and_drop(source, target).perform()
     print("Drag and drop performed ✅")
-    time.sleep(1)
+    settle(driver)
 
     # ---------- CHAIN MULTIPLE ACTIONS ----------
-    driver.get("https://the-internet.herokuapp.com/login")
+    driver.get(url_for("/login"))
     print("Opened Login Page for chained actions demo")
 
     username = wait.until(EC.presence_of_element_located((By.ID, "username")))
@@ -78,6 +79,6 @@ try:
 except Exception as e:
     print("⚠️ Error during test:", e)
 finally:
-    time.sleep(2)
+    linger()
     driver.quit()
     print("Browser closed.")
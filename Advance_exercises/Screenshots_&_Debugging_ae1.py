@@ -2,75 +2,83 @@
 """
 Screenshots & Debugging demo for Selenium (VS Code copy-paste).
 Demonstrates:
- - full page screenshot
- - element screenshot
+ - viewport and whole-page screenshots
+ - element screenshot (one by one, and many from a single capture)
  - save page source to file
  - execute JavaScript (scroll, read innerHTML)
- - save debug artifacts into debug/ with timestamps
+ - save debug artifacts into debug/ in the background (selenium_lab.artifacts:
+   compressed, identical snapshots stored once)
 """
 
 import os
-import time
 import traceback
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
+import sys
 
-DEBUG_DIR = os.path.join(os.getcwd(), "debug")
-os.makedirs(DEBUG_DIR, exist_ok=True)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # repo root, for selenium_lab
+from selenium_lab.artifacts import store_for
+from selenium_lab.driver_factory import create_chrome_driver
+from selenium_lab.screenshots import element_screenshots, full_page_screenshot
+from selenium_lab.settle import linger, settle
+from selenium_lab.urls import url_for
 
-def ts():
-    return time.strftime("%Y%m%d-%H%M%S")
+artifacts = store_for()  # SELENIUM_LAB_ARTIFACT_DIR, debug/ by default
 
 def save_page_source(driver, prefix="page"):
-    filename = os.path.join(DEBUG_DIR, f"{prefix}-{ts()}.html")
     try:
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(driver.page_source)
-        print(f"[saved] page source -> {filename}")
+        entry = artifacts.put(prefix, driver.page_source, "html")
+        print(f"[queued] page source -> {entry}")
     except Exception as e:
         print("Failed to save page source:", e)
 
 def save_screenshot(driver, prefix="screenshot"):
-    filename = os.path.join(DEBUG_DIR, f"{prefix}-{ts()}.png")
     try:
-        driver.save_screenshot(filename)
-        print(f"[saved] full page screenshot -> {filename}")
+        entry = artifacts.put(prefix, driver.get_screenshot_as_base64(), "png", base64_encoded=True)
+        print(f"[queued] viewport screenshot -> {entry}")
     except Exception as e:
         print("Failed to save screenshot:", e)
 
 def save_element_screenshot(element, prefix="element"):
-    filename = os.path.join(DEBUG_DIR, f"{prefix}-{ts()}.png")
     try:
-        element.screenshot(filename)
-        print(f"[saved] element screenshot -> {filename}")
+        entry = artifacts.put(prefix, element.screenshot_as_base64, "png", base64_encoded=True)
+        print(f"[queued] element screenshot -> {entry}")
     except Exception as e:
         print("Failed to save element screenshot:", e)
 
+def save_element_screenshots(driver, targets):
+    """targets: prefix -> element or locator; one capture for all of them."""
+    try:
+        pngs = element_screenshots(driver, list(targets.values()))
+        for prefix, png in zip(targets, pngs):
+            if png is None:
+                print(f"[skipped] {prefix}: not found or empty")
+                continue
+            print(f"[queued] element screenshot -> {artifacts.put(prefix, png, 'png')}")
+    except Exception as e:
+        print("Failed to save element screenshots:", e)
+
 def main():
-    service = Service(ChromeDriverManager().install())
-    options = webdriver.ChromeOptions()
-    # options.add_argument("--headless=new")  # optionally run headless
-    driver = webdriver.Chrome(service=service, options=options)
-    driver.maximize_window()
+    # set SELENIUM_LAB_HEADLESS=1 to optionally run headless
+    driver = create_chrome_driver()
 
     wait = WebDriverWait(driver, 12)
 
     try:
-        driver.get("https://the-internet.herokuapp.com/large")
+        driver.get(url_for("/large"))
         print("Opened page:", driver.title)
 
-        # 1) Full page screenshot
-        time.sleep(1)  # short pause to ensure rendering
+        # 1) Viewport screenshot
+        settle(driver)  # wait until the page has stopped changing
         save_screenshot(driver, prefix="page_full")
 
-        # 2) Scroll down using JS, then take another screenshot
-        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(0.8)
-        save_screenshot(driver, prefix="page_scrolled")
+        # 2) The whole page in one capture (DevTools on Chrome, stitched tiles elsewhere) — no scrolling by hand
+        try:
+            entry = artifacts.put("page_whole", full_page_screenshot(driver), "png")
+            print(f"[queued] whole page screenshot -> {entry}")
+        except Exception as e:
+            print("Failed to save whole page screenshot:", e)
 
         # 3) Find an element and take an element-level screenshot
         # Use a stable locator; fallback if not present
@@ -82,6 +90,14 @@ def main():
         except Exception:
             print("Could not locate the element for element screenshot.")
 
+        # 3b) Many widgets at once: one capture, cropped locally instead of one capture per element
+        save_element_screenshots(driver, {
+            "header_batch": (By.CSS_SELECTOR, "div.example h3"),
+            "table_head": (By.CSS_SELECTOR, "#large-table thead"),
+            "table_row_1": (By.CSS_SELECTOR, "#large-table tr.row-1"),
+            "table_row_2": (By.CSS_SELECTOR, "#large-table tr.row-2"),
+        })
+
         # 4) Save page source to a file
         save_page_source(driver, prefix="page_source")
 
@@ -89,11 +105,8 @@ def main():
         try:
             el_for_js = driver.find_element(By.CSS_SELECTOR, "div.example")
             inner_html = driver.execute_script("return arguments[0].innerHTML;", el_for_js)
-            # Save innerHTML to a file
-            html_file = os.path.join(DEBUG_DIR, f"innerHTML-{ts()}.html")
-            with open(html_file, "w", encoding="utf-8") as f:
-                f.write(inner_html)
-            print(f"[saved] innerHTML -> {html_file}")
+            # Queue innerHTML for the background writer
+            print(f"[queued] innerHTML -> {artifacts.put('innerHTML', inner_html, 'html')}")
         except Exception as e:
             print("JS innerHTML extraction failed:", e)
 
@@ -111,14 +124,16 @@ def main():
         # (demonstrates taking screenshot after interaction)
         try:
             # goto a page with input
-            driver.get("https://the-internet.herokuapp.com/login")
+            driver.get(url_for("/login"))
             usr = wait.until(EC.presence_of_element_located((By.ID, "username")))
             usr.send_keys("tomsmith")
             save_element_screenshot(usr, prefix="username_input")
         except Exception as e:
             print("Input interaction screenshot failed:", e)
 
-        print("\nAll debug artifacts saved in:", DEBUG_DIR)
+        failed = artifacts.flush()
+        print("\nAll debug artifacts saved in:", artifacts.root, f"({len(failed)} failed)")
+        print("List them with: python -m selenium_lab.artifacts")
 
     except Exception as e:
         print("Exception during debug run:", e)
@@ -130,7 +145,7 @@ def main():
         except Exception:
             pass
     finally:
-        time.sleep(1)
+        linger()
         driver.quit()
         print("Browser closed.")
 
@@ -1,13 +1,42 @@
+from urllib.parse import urlsplit
+
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
 
-@pytest.fixture
-def driver():
+from login_page import LoginPage
+from selenium_lab.driver_factory import create_chrome_driver
+from selenium_lab.urls import url_for
+
+USERNAME = "tomsmith"
+PASSWORD = "SuperSecretPassword!"
+
+
+def launch():
     chrome_options = Options()
     chrome_options.add_argument("--start-maximized")
-    driver = webdriver.Chrome(service=ChromeService(ChromeDriverManager().install()), options=chrome_options)
-    yield driver
-    driver.quit()
+    return create_chrome_driver(options=chrome_options, maximize=False)
+
+
+@pytest.fixture
+def driver(ddt_rows, track_waits, track_commands, flight_recorder):
+    # rows of a @pytest.mark.ddt test share one browser, reset between rows and relaunched after a failure
+    with ddt_rows(launch) as driver:
+        with track_waits(driver), track_commands(driver), flight_recorder(driver):
+            yield driver
+
+
+def form_login(driver, username, password):
+    login_page = LoginPage(driver)
+    login_page.open()
+    login_page.login(username, password)
+
+
+def on_secure_page(driver):
+    return urlsplit(driver.current_url).path == "/secure"
+
+
+@pytest.fixture
+def logged_in_driver(driver, auth_state):
+    # the login form is used once per credentials; later tests get the saved cookies + storage
+    auth_state.login(driver, USERNAME, PASSWORD, url=url_for("/secure"), login=form_login, verify=on_secure_page)
+    return driver
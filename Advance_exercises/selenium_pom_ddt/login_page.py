@@ -2,27 +2,28 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
-class LoginPage:
-    USERNAME_INPUT = (By.ID, "username")
-    PASSWORD_INPUT = (By.ID, "password")
-    LOGIN_BUTTON = (By.CSS_SELECTOR, "button[type='submit']")
-    ERROR_MESSAGE = (By.ID, "flash")
-    SUCCESS_MESSAGE = (By.ID, "flash")
+from selenium_lab.page import BasePage, Element
 
-    def __init__(self, driver):
-        self.driver = driver
+class LoginPage(BasePage):
+    USERNAME_INPUT = Element(By.ID, "username")
+    PASSWORD_INPUT = Element(By.ID, "password")
+    LOGIN_BUTTON = Element(By.CSS_SELECTOR, "button[type='submit']")
+    ERROR_MESSAGE = Element(By.ID, "flash")
+    SUCCESS_MESSAGE = Element(By.ID, "flash")
+    PATH = "/login"  # resolved against SELENIUM_LAB_BASE_URL
 
     def login(self, username, password):
-        self.driver.find_element(*self.USERNAME_INPUT).clear()
-        self.driver.find_element(*self.USERNAME_INPUT).send_keys(username)
-        self.driver.find_element(*self.PASSWORD_INPUT).clear()
-        self.driver.find_element(*self.PASSWORD_INPUT).send_keys(password)
-        self.driver.find_element(*self.LOGIN_BUTTON).click()
+        # one find per field; the second call on each reuses the cached element
+        self.USERNAME_INPUT.clear()
+        self.USERNAME_INPUT.send_keys(username)
+        self.PASSWORD_INPUT.clear()
+        self.PASSWORD_INPUT.send_keys(password)
+        self.LOGIN_BUTTON.click()
 
     def get_error_message(self):
         try:
             error_element = WebDriverWait(self.driver, 5).until(
-                EC.visibility_of_element_located(self.ERROR_MESSAGE)
+                EC.visibility_of_element_located(LoginPage.ERROR_MESSAGE)
             )
             return error_element.text.strip().replace('×','').strip()
         except:
@@ -31,7 +32,7 @@ class LoginPage:
     def get_success_message(self):
         try:
             success_element = WebDriverWait(self.driver, 5).until(
-                EC.visibility_of_element_located(self.SUCCESS_MESSAGE)
+                EC.visibility_of_element_located(LoginPage.SUCCESS_MESSAGE)
             )
             return success_element.text.strip().replace('×','').strip()
         except:
@@ -8,10 +8,11 @@ test_data = [
     ("invalid_user", "invalid_pass", False),
 ]
 
+@pytest.mark.ddt  # all rows run in one browser session
 @pytest.mark.parametrize("username,password,should_succeed", test_data)
 def test_login_scenarios(driver, username, password, should_succeed):
-    driver.get("https://the-internet.herokuapp.com/login")
     login_page = LoginPage(driver)
+    login_page.open()
     login_page.login(username, password)
 
     if should_succeed:
@@ -22,3 +23,23 @@ def test_login_scenarios(driver, username, password, should_succeed):
         error_msg = login_page.get_error_message()
         assert "Your username is invalid!" in error_msg or "Your password is invalid!" in error_msg
         print(f"❌ Login failed as expected for: {username} - Message: {error_msg}")
+
+
+# Same scenarios streamed from a file: point the marker at a 100k-row export and
+# add sample=0.01 (or SELENIUM_LAB_DATA_SHARD=i/n per CI job) to keep runs short.
+@pytest.mark.data("login_rows.csv")
+def test_login_rows(driver, data_rows):
+    login_page = LoginPage(driver)
+    failures = []
+    for row in data_rows:
+        login_page.open()
+        login_page.login(row["username"], row["password"])
+        if row["should_succeed"] == "true":
+            message = login_page.get_success_message()
+            ok = "You logged into a secure area!" in message
+        else:
+            message = login_page.get_error_message()
+            ok = "Your username is invalid!" in message or "Your password is invalid!" in message
+        if not ok:
+            failures.append(f"{row['username']}: {message!r}")
+    assert not failures, f"{len(failures)} rows failed: " + "; ".join(failures[:10])
@@ -0,0 +1,10 @@
+from selenium.webdriver.common.by import By
+
+
+def test_secure_area_heading(logged_in_driver):
+    assert "Secure Area" in logged_in_driver.find_element(By.TAG_NAME, "h2").text
+
+
+def test_logout_returns_to_login(logged_in_driver):
+    logged_in_driver.find_element(By.CSS_SELECTOR, "a[href='/logout']").click()
+    assert "You logged out of the secure area!" in logged_in_driver.find_element(By.ID, "flash").text
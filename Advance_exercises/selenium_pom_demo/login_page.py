@@ -1,23 +1,23 @@
 from selenium.webdriver.common.by import By
 
-class LoginPage:
-    # Locators
-    USERNAME_INPUT = (By.ID, "username")
-    PASSWORD_INPUT = (By.ID, "password")
-    LOGIN_BUTTON = (By.CSS_SELECTOR, "button[type='submit']")
-    ERROR_MESSAGE = (By.ID, "flash")  # Demo site uses id="flash"
+from selenium_lab.page import BasePage, Element
 
-    def __init__(self, driver):
-        self.driver = driver
+class LoginPage(BasePage):
+    # Locators (found on first use, then cached until the page changes)
+    USERNAME_INPUT = Element(By.ID, "username")
+    PASSWORD_INPUT = Element(By.ID, "password")
+    LOGIN_BUTTON = Element(By.CSS_SELECTOR, "button[type='submit']")
+    ERROR_MESSAGE = Element(By.ID, "flash")  # Demo site uses id="flash"
+    PATH = "/login"  # resolved against SELENIUM_LAB_BASE_URL
 
     def enter_username(self, username):
-        self.driver.find_element(*self.USERNAME_INPUT).send_keys(username)
+        self.USERNAME_INPUT.send_keys(username)
 
     def enter_password(self, password):
-        self.driver.find_element(*self.PASSWORD_INPUT).send_keys(password)
+        self.PASSWORD_INPUT.send_keys(password)
 
     def click_login(self):
-        self.driver.find_element(*self.LOGIN_BUTTON).click()
+        self.LOGIN_BUTTON.click()
 
     def login(self, username, password):
         self.enter_username(username)
@@ -25,4 +25,4 @@ class LoginPage:
         self.click_login()
 
     def get_error_message(self):
-        return self.driver.find_element(*self.ERROR_MESSAGE).text
+        return self.ERROR_MESSAGE.text
@@ -1,26 +1,28 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))  # repo root, for selenium_lab
+from selenium_lab.driver_factory import create_chrome_driver
+from selenium_lab.settle import settle
+from selenium_lab.urls import url_for
 from login_page import LoginPage
-import time
 
 # --------------------------
 # SETUP
 # --------------------------
-service = Service(ChromeDriverManager().install())
-driver = webdriver.Chrome(service=service)
+driver = create_chrome_driver(maximize=False)
 
 try:
-    driver.get("https://the-internet.herokuapp.com/login")
+    driver.get(url_for("/login"))
     driver.maximize_window()
-    time.sleep(1)
+    settle(driver)
 
     # --------------------------
     # TEST: Valid login
     # --------------------------
     login_page = LoginPage(driver)
     login_page.login("tomsmith", "SuperSecretPassword!")
-    time.sleep(1)
+    settle(driver)
 
     # Verify successful login by checking URL or heading
     assert "Secure Area" in driver.title or "Secure Area" in driver.page_source
@@ -29,9 +31,9 @@ try:
     # --------------------------
     # TEST: Invalid login
     # --------------------------
-    driver.get("https://the-internet.herokuapp.com/login")
+    driver.get(url_for("/login"))
     login_page.login("invalid_user", "invalid_pass")
-    time.sleep(1)
+    settle(driver)
     error_message = login_page.get_error_message()
     print("Error message displayed:", error_message)
     assert "Your username is invalid!" in error_message
@@ -1,20 +1,21 @@
 # dynamic_content_test.py
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-import time
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # repo root, for selenium_lab
+from selenium_lab.driver_factory import create_chrome_driver
+from selenium_lab.settle import linger
+from selenium_lab import waits
+from selenium_lab.urls import url_for
+from selenium_lab.waits import ObserverWait
 
 # Step 1: Initialize Chrome browser
-service = Service(ChromeDriverManager().install())
-driver = webdriver.Chrome(service=service)
-driver.maximize_window()
+driver = create_chrome_driver()
 
 try:
     # Step 2: Open the test website
-    driver.get("https://the-internet.herokuapp.com/dynamic_loading/2")
+    driver.get(url_for("/dynamic_loading/2"))
     print("Opened:", driver.title)
 
     # Step 3: Click the "Start" button
@@ -23,13 +24,14 @@ try:
     print("Clicked Start ✅")
 
     # Step 4: Wait for loading bar to disappear (invisibility)
-    wait = WebDriverWait(driver, 15)
-    wait.until(EC.invisibility_of_element_located((By.ID, "loading")))
+    # ObserverWait watches the page instead of polling it every 0.5s
+    wait = ObserverWait(driver, 15)
+    wait.until(waits.invisibility_of_element_located((By.ID, "loading")))
     print("Loading bar disappeared ✅")
 
     # Step 5: Wait for the text "Hello World!" to appear
     finish_element = wait.until(
-        EC.visibility_of_element_located((By.CSS_SELECTOR, "#finish"))
+        waits.visibility_of_element_located((By.CSS_SELECTOR, "#finish"))
     )
 
     # Step 6: Verify and print the text
@@ -44,6 +46,6 @@ except AssertionError:
 except Exception as e:
     print("⚠️ Error during test:", e)
 finally:
-    time.sleep(2)
+    linger()
     driver.quit()
     print("Browser closed.")
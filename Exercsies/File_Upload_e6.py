@@ -9,14 +9,16 @@ Steps:
 4. Verify success message
 """
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 import os
-import time
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # repo root, for selenium_lab
+from selenium_lab.driver_factory import create_chrome_driver
+from selenium_lab.settle import linger
+from selenium_lab.urls import url_for
 
 # Step 1: Create a temporary test file
 file_name = "test_file.txt"
@@ -27,13 +29,11 @@ with open(file_path, "w") as f:
 print(f"Created test file: {file_path}")
 
 # Step 2: Initialize Chrome browser
-service = Service(ChromeDriverManager().install())
-driver = webdriver.Chrome(service=service)
-driver.maximize_window()
+driver = create_chrome_driver()
 
 try:
     # Step 3: Open upload test page
-    driver.get("https://the-internet.herokuapp.com/upload")
+    driver.get(url_for("/upload"))
     print("Opened:", driver.title)
 
     wait = WebDriverWait(driver, 10)
@@ -65,7 +65,7 @@ except AssertionError:
 except Exception as e:
     print("⚠️ Error during test:", e)
 finally:
-    time.sleep(2)
+    linger()
     driver.quit()
     print("Browser closed.")
 
@@ -1,16 +1,17 @@
 # form_filling_test.py
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.support.ui import WebDriverWait, Select
+from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-import time
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # repo root, for selenium_lab
+from selenium_lab.driver_factory import create_chrome_driver
+from selenium_lab.forms import fill_form
+from selenium_lab.settle import linger
 
 # Step 1: Initialize Chrome browser
-service = Service(ChromeDriverManager().install())
-driver = webdriver.Chrome(service=service)
-driver.maximize_window()
+driver = create_chrome_driver()
 
 try:
     # Step 2: Open the test website
@@ -19,37 +20,24 @@ try:
 
     wait = WebDriverWait(driver, 10)
 
-    # Step 3: Fill in the text input field
-    text_input = wait.until(EC.presence_of_element_located((By.NAME, "my-text")))
-    text_input.send_keys("SoochiTara")
-    print("Entered text ✅")
-
-    # Step 4: Enter password in password field
-    password_field = driver.find_element(By.NAME, "my-password")
-    password_field.send_keys("secret123")
-    print("Entered password ✅")
-
-    # Step 5: Enter text in textarea
-    textarea = driver.find_element(By.NAME, "my-textarea")
-    textarea.send_keys("This is a Selenium form-filling test.")
-    print("Entered textarea text ✅")
-
-    # Step 6: Select an option from dropdown
-    dropdown = Select(driver.find_element(By.NAME, "my-select"))
-    dropdown.select_by_visible_text("Option 2")
-    print("Selected dropdown option ✅")
-
-    # Step 7: Click checkbox
-    checkbox = driver.find_element(By.ID, "my-check-1")
-    checkbox.click()
-    print("Clicked checkbox ✅")
-
-    # Step 8: Click submit button
+    # Step 3: Wait for the form, then fill every field in one script call
+    # (text, password, textarea, dropdown and checkbox; input/change events are fired like typing would)
+    wait.until(EC.presence_of_element_located((By.NAME, "my-text")))
+    fill_form(driver, {
+        (By.NAME, "my-text"): "SoochiTara",
+        (By.NAME, "my-password"): "secret123",
+        (By.NAME, "my-textarea"): "This is a Selenium form-filling test.",
+        (By.NAME, "my-select"): "2",  # option text or value; the second option has value="2"
+        (By.ID, "my-check-1"): False,  # the old click() toggled it off (it starts checked)
+    })
+    print("Filled text, password, textarea, dropdown and checkbox ✅")
+
+    # Step 4: Click submit button
     submit_btn = driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
     submit_btn.click()
     print("Clicked submit ✅")
 
-    # Step 9: Verify success message
+    # Step 5: Verify success message
     success_msg = wait.until(EC.visibility_of_element_located((By.ID, "message")))
     msg_text = success_msg.text
     print("Success message:", msg_text)
@@ -62,6 +50,6 @@ except AssertionError:
 except Exception as e:
     print("⚠️ Error during test:", e)
 finally:
-    time.sleep(2)
+    linger()
     driver.quit()
     print("Browser closed.")
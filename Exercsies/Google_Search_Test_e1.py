@@ -1,14 +1,16 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # repo root, for selenium_lab
+from selenium_lab.driver_factory import create_chrome_driver
+from selenium_lab.waits import click_first
 
 # Initialize Chrome driver properly
-service = Service(ChromeDriverManager().install())
-driver = webdriver.Chrome(service=service)
+driver = create_chrome_driver(maximize=False)
 
 try:
     # Step 1: Navigate to Google
@@ -16,13 +18,11 @@ try:
     driver.maximize_window()
 
     # Step 2: Accept cookies or consent (if present)
-    try:
-        consent_btn = WebDriverWait(driver, 5).until(
-            EC.element_to_be_clickable((By.XPATH, "//button//*[contains(text(),'Accept') or contains(text(),'Agree')]/.."))
-        )
-        consent_btn.click()
-    except Exception:
-        pass  # no popup, continue
+    # all variants are checked together; gives up after 5 s in total if there is no popup
+    click_first(driver, [
+        (By.XPATH, "//button//*[contains(text(),'Accept') or contains(text(),'Agree')]/.."),
+        (By.XPATH, "//button[contains(., 'Accept') or contains(., 'Agree')]"),
+    ], timeout=5)
 
     # Step 3: Find search box and enter search term
     search_box = WebDriverWait(driver, 10).until(
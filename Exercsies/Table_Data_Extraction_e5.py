@@ -7,14 +7,19 @@ Exercise 5: Table Data Extraction
 - Count total number of rows
 """
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 import re
-import time
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # repo root, for selenium_lab
+from selenium_lab.columns import argmax, parse_currency_column, unique_values
+from selenium_lab.driver_factory import create_chrome_driver
+from selenium_lab.settle import linger
+from selenium_lab.tables import extract_table
+from selenium_lab.urls import url_for
 
 def parse_currency_to_float(s: str) -> float:
     """Convert currency string like '$100.00' or '$1,234.56' to float."""
@@ -36,63 +41,49 @@ def parse_currency_to_float(s: str) -> float:
     return -val if negative else val
 
 def main():
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service)
-    driver.maximize_window()
+    driver = create_chrome_driver()
 
     try:
-        driver.get("https://the-internet.herokuapp.com/tables")
+        driver.get(url_for("/tables"))
         wait = WebDriverWait(driver, 10)
         # Wait for table1 to be present
         wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "#table1")))
 
-        rows = driver.find_elements(By.CSS_SELECTOR, "#table1 tbody tr")
-        total_rows = len(rows)
+        # One execute_script reads the whole table (headers + every cell), instead of
+        # find_elements per row and .text per cell.
+        table = extract_table(driver, (By.ID, "table1"))
+        total_rows = len(table)
         print(f"Total rows found in Table 1: {total_rows}")
 
-        people = []
-        emails = []
-
-        for i, row in enumerate(rows, start=1):
-            cells = row.find_elements(By.TAG_NAME, "td")
-            # Defensive checks in case table structure changes
-            if len(cells) < 6:
-                print(f"Row {i} unexpected cell count ({len(cells)}). Skipping.")
+        # Defensive checks in case table structure changes
+        complete = []
+        for i, width in enumerate(table.widths, start=1):
+            if width < 6:
+                print(f"Row {i} unexpected cell count ({width}). Skipping.")
                 continue
+            complete.append(i - 1)
 
-            last_name = cells[0].text.strip()
-            first_name = cells[1].text.strip()
-            email = cells[2].text.strip()
-            due_raw = cells[3].text.strip()
-            website = cells[4].text.strip() if len(cells) > 4 else ""
-            action = cells[5].text.strip() if len(cells) > 5 else ""
-
-            due_value = parse_currency_to_float(due_raw)
-
-            people.append({
-                "first_name": first_name,
-                "last_name": last_name,
-                "email": email,
-                "due_raw": due_raw,
-                "due": due_value,
-                "website": website,
-                "action": action
-            })
-            emails.append(email)
-
-            print(f"Row {i}: {first_name} {last_name} | Email: {email} | Due: {due_raw} -> {due_value}")
-
-        if not people:
+        if not complete:
             print("No people parsed from the table.")
             return
 
+        last_names, first_names, emails, dues_raw = (
+            [table.column(c)[i] for i in complete] for c in range(4)
+        )
+        # Parse the whole Due column at once (same results as parse_currency_to_float per cell)
+        dues = parse_currency_column(dues_raw)
+
+        for row, first_name, last_name, email, due_raw, due_value in zip(
+                complete, first_names, last_names, emails, dues_raw, dues):
+            print(f"Row {row + 1}: {first_name} {last_name} | Email: {email} | Due: {due_raw} -> {due_value}")
+
         # Find person with highest due
-        highest = max(people, key=lambda p: p["due"])
+        h = argmax(dues)
         print("\nPerson with the highest due:")
-        print(f"{highest['first_name']} {highest['last_name']} — Email: {highest['email']} — Due: {highest['due_raw']} ({highest['due']})")
+        print(f"{first_names[h]} {last_names[h]} — Email: {emails[h]} — Due: {dues_raw[h]} ({dues[h]})")
 
         # Print all email addresses (unique)
-        unique_emails = sorted(set(emails))
+        unique_emails = unique_values(emails)
         print("\nAll email addresses (unique):")
         for e in unique_emails:
             print("-", e)
@@ -103,7 +94,7 @@ def main():
     except Exception as e:
         print("Error during extraction:", e)
     finally:
-        time.sleep(1)
+        linger()
         driver.quit()
 
 if __name__ == "__main__":
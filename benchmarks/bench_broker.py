@@ -0,0 +1,79 @@
+# bench_broker.py
+"""
+Startup-to-first-command latency: launching Chrome per script vs leasing a warm
+browser from selenium_lab.broker.
+
+Run from the repo root (needs Chrome):
+    python benchmarks/bench_broker.py [repeats]
+
+Rows:
+  launch per script           create_chrome_driver() + first command + quit, what every run paid before
+  broker lease, same process  attach to a warm browser + first command + quit (release and reset)
+  broker lease, new process   the same in a fresh interpreter, like running a script again
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # repo root, for selenium_lab
+from selenium_lab import broker
+from selenium_lab.driver_factory import create_chrome_driver
+
+CHILD = (
+    "import sys, time; t = time.perf_counter(); from selenium_lab import broker; "
+    "d = broker.attach(sys.argv[1], start=False); d.get('about:blank'); "
+    "print(time.perf_counter() - t); d.quit()"
+)
+
+
+def first_command(open_driver):
+    start = time.perf_counter()
+    driver = open_driver()
+    driver.get("about:blank")
+    elapsed = time.perf_counter() - start
+    driver.quit()
+    return elapsed
+
+
+def child_process_samples(path, repeats):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    samples = []
+    for _ in range(repeats):
+        out = subprocess.run([sys.executable, "-c", CHILD, path], cwd=root, capture_output=True, text=True, check=True)
+        samples.append(float(out.stdout.strip().splitlines()[-1]))
+    return samples
+
+
+def report(name, samples):
+    print(f"{name:<28} median={statistics.median(samples) * 1000:9.1f} ms   max={max(samples) * 1000:9.1f} ms   n={len(samples)}")
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    launch = [first_command(lambda: create_chrome_driver(maximize=False, broker=False)) for _ in range(repeats)]
+
+    with tempfile.TemporaryDirectory(prefix="selenium-lab-broker-") as tmp:
+        path = os.path.join(tmp, "broker.sock")
+        server = threading.Thread(target=broker.serve, kwargs=dict(path=path, size=1, idle_timeout=0), daemon=True)
+        server.start()
+        while not broker._ping(path):
+            time.sleep(0.05)
+        first_command(lambda: broker.attach(path, start=False))     # waits for the warm-up launch
+        leased = [first_command(lambda: broker.attach(path, start=False)) for _ in range(repeats)]
+        fresh = child_process_samples(path, repeats)
+        broker.request("stop", path)
+        server.join(30)
+
+    report("launch per script", launch)
+    report("broker lease, same process", leased)
+    report("broker lease, new process", fresh)
+    print(f"speedup (new process): {statistics.median(launch) / statistics.median(fresh):.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# bench_command_stats.py
+"""
+Cost of selenium_lab.command_stats: the same run of real WebDriver commands
+(find, read text, read an attribute on every text field of the generated
+/form?fields=N page) with and without every command being timed, plus the
+recording cost per command on its own (recorder overhead / commands).
+
+Run from the repo root:
+    SELENIUM_LAB_BASE_URL=local python benchmarks/bench_command_stats.py --fields 200 --rounds 5
+"""
+
+import argparse
+import os
+import sys
+import time
+from contextlib import nullcontext
+
+from selenium.webdriver.common.by import By
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # repo root, for selenium_lab
+from selenium_lab.command_stats import instrument
+from selenium_lab.driver_factory import create_chrome_driver
+from selenium_lab.urls import url_for
+
+
+def commands(driver, n):
+    for el in driver.find_elements(By.CSS_SELECTOR, "#big-form input[type=text]")[:n]:
+        el.get_attribute("name")
+        el.is_displayed()
+        driver.find_element(By.ID, el.get_attribute("id"))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--fields", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    driver = create_chrome_driver(headless=True)
+    try:
+        driver.get(url_for(f"/form?fields={args.fields}"))
+        commands(driver, 10)    # warm up
+        timings = {"off": [], "on": []}
+        count = overhead = 0
+        for _ in range(args.rounds):
+            for mode, tracker in (("off", lambda: nullcontext()), ("on", lambda: instrument(driver))):
+                with tracker() as log:
+                    start = time.perf_counter()
+                    commands(driver, args.fields)
+                    timings[mode].append(time.perf_counter() - start)
+                if log is not None:
+                    count, overhead = count + len(log.commands), overhead + log.overhead
+        off, on = min(timings["off"]), min(timings["on"])
+        per_round = count // args.rounds
+        print(f"{per_round} commands per round, best of {args.rounds}")
+        print(f"not recorded: {off * 1000:8.1f} ms")
+        print(f"recorded:     {on * 1000:8.1f} ms  ({100 * (on - off) / off:+.2f}%)")
+        print(f"recording:    {overhead / count * 1e6:8.1f} us per command "
+              f"({100 * overhead / sum(timings['on']):.2f}% of recorded time)")
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# bench_currency_parsing.py
+"""
+Currency column parsing: parse_currency_to_float per value + max(list of dicts)
+vs selenium_lab.columns (one bytes.translate pass + NumPy).
+The distinct-email part is the same set() in both and is only checked, not timed.
+
+Run from the repo root:
+    python benchmarks/bench_currency_parsing.py [rows ...]
+"""
+
+import importlib.util
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)  # repo root, for selenium_lab
+from selenium_lab.columns import argmax, parse_currency_column, unique_values
+
+_spec = importlib.util.spec_from_file_location(
+    "table_data_extraction_e5", os.path.join(ROOT, "Exercsies", "Table_Data_Extraction_e5.py"))
+_module = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_module)
+parse_currency_to_float = _module.parse_currency_to_float
+
+
+def make_column(n, seed=7):
+    rng = random.Random(seed)
+    dues, emails = [], []
+    for i in range(n):
+        amount = rng.uniform(0, 100000)
+        dues.append(f"(${amount:,.2f})" if rng.random() < 0.05 else ("" if rng.random() < 0.01 else f"${amount:,.2f}"))
+        emails.append(f"user{rng.randrange(n // 2 + 1)}@example.com")
+    return dues, emails
+
+
+def per_value(dues, emails):
+    people = [{"due": parse_currency_to_float(d), "email": e} for d, e in zip(dues, emails)]
+    highest = max(people, key=lambda p: p["due"])
+    return highest["due"], highest["email"]
+
+
+def columnar(dues, emails):
+    parsed = parse_currency_column(dues)
+    i = argmax(parsed)
+    return float(parsed[i]), emails[i]
+
+
+def main():
+    sizes = [int(a) for a in sys.argv[1:]] or [1000, 100000, 1000000]
+    columnar(*make_column(10))  # warm-up
+    print(f"{'rows':>9} {'per value':>12} {'columnar':>12} {'speedup':>8}")
+    for n in sizes:
+        dues, emails = make_column(n)
+        t0 = time.perf_counter()
+        expected = per_value(dues, emails)
+        t1 = time.perf_counter()
+        got = columnar(dues, emails)
+        t2 = time.perf_counter()
+        assert got == expected and unique_values(emails) == sorted(set(emails))
+        print(f"{n:>9} {(t1 - t0) * 1000:9.1f} ms {(t2 - t1) * 1000:9.1f} ms {(t1 - t0) / (t2 - t1):7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# bench_data_collection.py
+"""
+Collecting a data-driven test over 1k, 100k and 1M credential rows:
+reading the CSV into a list for ``pytest.mark.parametrize`` (one item per
+row, every row in memory) vs ``@pytest.mark.data`` + ``data_rows``
+(selenium_lab.datasource: one item per split, rows streamed when the test
+runs). Reports ``pytest --collect-only`` wall time, peak memory and items,
+then how fast the streamed rows can be read.
+
+No browser needed. Run from the repo root:
+    python benchmarks/bench_data_collection.py --rows 1000 100000 1000000
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # repo root, for selenium_lab
+from selenium_lab.datasource import DataSource, write_rows
+
+EAGER = """
+import csv
+import os
+
+import pytest
+
+with open(os.path.join(os.path.dirname(__file__), "rows.csv"), newline="") as f:
+    rows = [(r["username"], r["password"], r["should_succeed"]) for r in csv.DictReader(f)]
+
+
+@pytest.mark.parametrize("username,password,should_succeed", rows)
+def test_login(username, password, should_succeed):
+    pass
+"""
+
+STREAMED = """
+import pytest
+
+
+@pytest.mark.data("rows.csv")
+def test_login(data_rows):
+    for row in data_rows:
+        pass
+"""
+
+# run pytest in a child that reports its own peak memory (KiB on Linux)
+COLLECT = ("import resource, sys, pytest; code = pytest.main(sys.argv[1:]); "
+           "print('MAXRSS', resource.getrusage(resource.RUSAGE_SELF).ru_maxrss); sys.exit(code)")
+
+
+def collect(folder):
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, "-c", COLLECT, "--collect-only", "-q", "-p", "no:cacheprovider",
+                           "-p", "selenium_lab.pytest_plugin", folder],
+                          capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    seconds = time.perf_counter() - start
+    items = re.search(r"(\d+) tests? collected", proc.stdout)
+    rss = re.search(r"MAXRSS (\d+)", proc.stdout)
+    return seconds, int(items.group(1)) if items else 0, int(rss.group(1)) / 1024 if rss else float("nan")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 100000, 1000000])
+    args = parser.parse_args()
+
+    print(f"{'rows':>9} {'mode':<13} {'collect':>9} {'items':>9} {'peak mem':>10} {'read rows':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in args.rows:
+            for mode, module in (("parametrize", EAGER), ("data_rows", STREAMED)):
+                folder = os.path.join(tmp, f"{mode}-{n}")
+                os.makedirs(folder)
+                write_rows(os.path.join(folder, "rows.csv"),
+                           ({"username": f"user{i}", "password": f"secret-{i * 7919 % 100003}",
+                             "should_succeed": "true" if i % 3 == 0 else "false"} for i in range(n)))
+                with open(os.path.join(folder, "test_rows.py"), "w") as f:
+                    f.write(module)
+                seconds, items, rss = collect(folder)
+                read = ""
+                if mode == "data_rows":
+                    start = time.perf_counter()
+                    count = sum(1 for _ in DataSource(os.path.join(folder, "rows.csv")))
+                    read = f"{count / (time.perf_counter() - start) / 1000:8.0f}k/s"
+                print(f"{n:>9} {mode:<13} {seconds:8.2f}s {items:>9} {rss:8.0f}MB {read:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# bench_driver_resolution.py
+"""
+Driver-path resolution latency: ChromeDriverManager().install() vs selenium_lab's
+cached resolver.
+
+Run from the repo root:
+    python benchmarks/bench_driver_resolution.py [repeats]
+
+Rows:
+  webdriver_manager install()   what every script did before (per call)
+  resolver, new process         resolve_chromedriver() in a fresh interpreter (manifest hit)
+  resolver, same process        repeated calls after the first (in-process memo)
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # repo root, for selenium_lab
+from selenium_lab import driver_factory
+
+CHILD = (
+    "import time; from selenium_lab import driver_factory as f; "
+    "t = time.perf_counter(); f.resolve_chromedriver(); print(time.perf_counter() - t)"
+)
+
+
+def timed(fn, repeats):
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def child_process_samples(repeats):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    samples = []
+    for _ in range(repeats):
+        out = subprocess.run([sys.executable, "-c", CHILD], cwd=root, capture_output=True, text=True, check=True)
+        samples.append(float(out.stdout.strip().splitlines()[-1]))
+    return samples
+
+
+def report(name, samples):
+    if not samples:
+        print(f"{name:<32} skipped")
+        return
+    print(f"{name:<32} median={statistics.median(samples) * 1000:9.2f} ms   max={max(samples) * 1000:9.2f} ms   n={len(samples)}")
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    # make sure the manifest exists before timing the cached paths
+    path = driver_factory.resolve_chromedriver()
+    print("chromedriver:", path)
+    print("manifest:    ", driver_factory.manifest_path(), "\n")
+
+    try:
+        from webdriver_manager.chrome import ChromeDriverManager
+        before = timed(lambda: ChromeDriverManager().install(), repeats)
+    except Exception as e:
+        print("webdriver_manager install() failed (offline?):", e)
+        before = []
+
+    report("webdriver_manager install()", before)
+    report("resolver, new process", child_process_samples(repeats))
+    report("resolver, same process", timed(driver_factory.resolve_chromedriver, repeats * 100))
+
+
+if __name__ == "__main__":
+    main()
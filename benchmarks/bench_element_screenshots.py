@@ -0,0 +1,58 @@
+# bench_element_screenshots.py
+"""
+Screenshots of N table cells of /large: element.screenshot_as_png per cell
+(old save_element_screenshot style) vs selenium_lab.screenshots.element_screenshots
+(one rect script, one capture, crops encoded in a thread pool).
+
+Also checks that both give images of the same size.
+Run from the repo root:
+    SELENIUM_LAB_BASE_URL=local python benchmarks/bench_element_screenshots.py --elements 10 50 200
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+
+from PIL import Image
+from selenium.webdriver.common.by import By
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # repo root, for selenium_lab
+from selenium_lab.driver_factory import create_chrome_driver
+from selenium_lab.screenshots import element_screenshots
+from selenium_lab.urls import url_for
+
+
+def size(png):
+    return Image.open(io.BytesIO(png)).size
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--elements", type=int, nargs="+", default=[10, 50, 200])
+    args = parser.parse_args()
+
+    driver = create_chrome_driver(headless=True)
+    try:
+        driver.get(url_for("/large"))
+        cells = driver.find_elements(By.CSS_SELECTOR, "#large-table td")
+        print(f"{'elements':>9} {'one by one':>13} {'batched':>13} {'speedup':>9}")
+        for n in args.elements:
+            targets = cells[:n]
+            start = time.perf_counter()
+            slow = [el.screenshot_as_png for el in targets]
+            one_by_one = time.perf_counter() - start
+
+            start = time.perf_counter()
+            fast = element_screenshots(driver, targets)
+            batched = time.perf_counter() - start
+
+            assert [size(png) for png in slow] == [size(png) for png in fast]
+            print(f"{n:>9} {one_by_one * 1000:10.1f} ms {batched * 1000:10.1f} ms {one_by_one / batched:8.1f}x")
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    main()
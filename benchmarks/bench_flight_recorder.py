@@ -0,0 +1,60 @@
+# bench_flight_recorder.py
+"""
+Per-step cost of selenium_lab.flight_recorder: type into every text field of
+the generated /form?fields=N page with no recorder, with DOM-only snapshots
+and with DOM + low-res screenshot snapshots.
+
+Run from the repo root:
+    SELENIUM_LAB_BASE_URL=local python benchmarks/bench_flight_recorder.py --fields 50 200
+"""
+
+import argparse
+import os
+import sys
+import time
+from contextlib import nullcontext
+
+from selenium.webdriver.common.by import By
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # repo root, for selenium_lab
+from selenium_lab.driver_factory import create_chrome_driver
+from selenium_lab.flight_recorder import record
+from selenium_lab.urls import url_for
+
+
+def steps(driver, n):
+    """Click and type into every text input; returns the number of page-changing commands sent."""
+    driver.get(url_for(f"/form?fields={n}"))
+    inputs = driver.find_elements(By.CSS_SELECTOR, "#big-form input[type=text]")
+    for el in inputs:
+        el.click()
+        el.send_keys("x")
+    return 1 + 2 * len(inputs)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--fields", type=int, nargs="+", default=[50, 200])
+    args = parser.parse_args()
+
+    driver = create_chrome_driver(headless=True)
+    try:
+        print(f"{'fields':>7} {'mode':<18} {'per step':>10} {'overhead':>10} {'ring':>9}")
+        for n in args.fields:
+            baseline = None
+            for mode, recorder in (("off", lambda: nullcontext()),
+                                   ("dom", lambda: record(driver, screenshots=False)),
+                                   ("dom + screenshot", lambda: record(driver, screenshots=True))):
+                with recorder() as rec:
+                    start = time.perf_counter()
+                    count = steps(driver, n)
+                    per_step = (time.perf_counter() - start) / count
+                baseline = per_step if baseline is None else baseline
+                ring = f"{rec.nbytes / 1024:6.0f} KiB" if rec is not None else "-"
+                print(f"{n:>7} {mode:<18} {per_step * 1000:7.2f} ms {(per_step - baseline) * 1000:7.2f} ms {ring:>9}")
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# bench_form_fill.py
+"""
+Form filling: one control at a time (old Form_Filling_e2 style: find + send_keys /
+Select / click per field) vs selenium_lab.forms.fill_form (one execute_script).
+
+Uses the generated /form?fields=N page of the local server, which counts the
+input/change events each field received so both ways can be checked.
+Run from the repo root:
+    SELENIUM_LAB_BASE_URL=local python benchmarks/bench_form_fill.py --fields 10 100 500
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import Select
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # repo root, for selenium_lab
+from selenium_lab.driver_factory import create_chrome_driver
+from selenium_lab.forms import fill_form
+from selenium_lab.urls import url_for
+
+KINDS = ["text", "password", "email", "number", "textarea", "select", "checkbox", "radio", "date"]
+READ_SCRIPT = """
+return Array.prototype.map.call(document.querySelectorAll('#big-form [name]'), function (el) {
+  if (el.type === 'checkbox' || el.type === 'radio') { return el.checked ? el.value : ''; }
+  return el.value;
+});
+"""
+
+
+def form_values(n):
+    """locator -> value for every control of /form?fields=n (same kind cycle as the server)."""
+    values = {}
+    for i in range(n):
+        kind, name = KINDS[i % len(KINDS)], f"field-{i}"
+        values[(By.NAME, name)] = {
+            "number": str(i), "email": f"user{i}@example.com", "select": str(i % 5 + 1),
+            "checkbox": True, "radio": "b", "date": "2024-05-17",
+        }.get(kind, f"value for field {i}")
+    return values
+
+
+def one_by_one(driver, values):
+    """What Form_Filling_e2 used to do, for every field."""
+    for (by, name), value in values.items():
+        el = driver.find_element(by, name)
+        tag, kind = el.tag_name, el.get_attribute("type")
+        if tag == "select":
+            Select(el).select_by_value(value)
+        elif kind == "checkbox":
+            if el.is_selected() != value:
+                el.click()
+        elif kind == "radio":
+            driver.find_element(By.CSS_SELECTOR, f"input[name='{name}'][value='{value}']").click()
+        elif kind == "date":
+            # chrome date inputs take keystrokes in locale order; set the value the way a test would
+            driver.execute_script("arguments[0].value = arguments[1];", el, value)
+        else:
+            el.send_keys(value)
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--fields", type=int, nargs="+", default=[9, 100, 500])
+    args = parser.parse_args()
+
+    driver = create_chrome_driver(headless=True)
+    try:
+        print(f"{'fields':>7} {'one by one':>13} {'fill_form':>13} {'speedup':>9}")
+        for n in args.fields:
+            values = form_values(n)
+            driver.get(url_for(f"/form?fields={n}"))
+            slow = timed(lambda: one_by_one(driver, values))
+            expected = driver.execute_script(READ_SCRIPT)
+
+            driver.get(url_for(f"/form?fields={n}"))
+            fast = timed(lambda: fill_form(driver, values))
+            assert driver.execute_script(READ_SCRIPT) == expected
+            events = driver.execute_script("return window.formEvents;")
+            assert len(events) == n and all(e["change"] for e in events.values())
+
+            print(f"{n:>7} {slow * 1000:10.1f} ms {fast * 1000:10.1f} ms {slow / fast:8.1f}x")
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# bench_frame_search.py
+"""
+Finding an element inside nested iframes: probing frame by frame from Python
+(old Keyboard_Actions_ae5 style, made recursive so it can reach the target at
+all) vs selenium_lab.frames.find_anywhere, cold (map built) and warm (map cached).
+
+Uses the generated /frames?count=N&depth=D page of the local server.
+Run from the repo root:
+    SELENIUM_LAB_BASE_URL=local python benchmarks/bench_frame_search.py --count 10 30 60
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from selenium.webdriver.common.by import By
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # repo root, for selenium_lab
+from selenium_lab.driver_factory import create_chrome_driver
+from selenium_lab.frames import find_anywhere
+from selenium_lab.urls import url_for
+
+LOCATOR = (By.ID, "target")
+
+
+def probe(driver, path=()):
+    """Switch into every frame in turn and look for LOCATOR; returns the frame path or None."""
+    for i in range(len(driver.find_elements(By.CSS_SELECTOR, "iframe, frame"))):
+        driver.switch_to.frame(i)
+        if driver.find_elements(*LOCATOR):
+            return path + (i,)
+        found = probe(driver, path + (i,))
+        if found is not None:
+            return found
+        driver.switch_to.parent_frame()
+    return None
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, nargs="+", default=[10, 30, 60])
+    parser.add_argument("--depth", type=int, default=3)
+    args = parser.parse_args()
+
+    driver = create_chrome_driver(headless=True)
+    try:
+        print(f"{'frames':>7} {'probing':>12} {'index cold':>12} {'index warm':>12}")
+        for n in args.count:
+            driver.get(url_for(f"/frames?count={n}&depth={args.depth}"))
+            driver.switch_to.default_content()
+            slow = timed(lambda: probe(driver))
+            cold = timed(lambda: find_anywhere(driver, LOCATOR))
+            warm = timed(lambda: find_anywhere(driver, LOCATOR))
+            print(f"{n + args.depth:>7} {slow * 1000:9.1f} ms {cold * 1000:9.1f} ms {warm * 1000:9.1f} ms")
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# bench_full_page_screenshot.py
+"""
+Covering the whole /large page: the old scroll + sleep(0.8) + viewport
+screenshot loop vs selenium_lab.screenshots.full_page_screenshot, both the
+single DevTools capture and the stitched-tiles fallback.
+
+Run from the repo root:
+    SELENIUM_LAB_BASE_URL=local python benchmarks/bench_full_page_screenshot.py
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # repo root, for selenium_lab
+from selenium_lab.driver_factory import create_chrome_driver
+from selenium_lab.screenshots import full_page_screenshot
+from selenium_lab.urls import url_for
+
+
+def scroll_and_sleep(driver, pause):
+    """The old way: one viewport screenshot per scroll, with a fixed pause after each scroll."""
+    height = driver.execute_script("return document.documentElement.scrollHeight;")
+    step = driver.execute_script("return window.innerHeight;")
+    shots = []
+    for y in range(0, height, step):
+        driver.execute_script("window.scrollTo(0, arguments[0]);", y)
+        time.sleep(pause)
+        shots.append(driver.get_screenshot_as_png())
+    return shots
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pause", type=float, default=0.8, help="sleep after each scroll in the old loop")
+    args = parser.parse_args()
+
+    driver = create_chrome_driver(headless=True)
+    try:
+        driver.get(url_for("/large"))
+        rows = []
+        start = time.perf_counter()
+        shots = scroll_and_sleep(driver, args.pause)
+        rows.append(("scroll + sleep", time.perf_counter() - start, f"{len(shots)} separate PNGs"))
+        for name, tiled in (("devtools capture", False), ("stitched tiles", True)):
+            start = time.perf_counter()
+            png = full_page_screenshot(driver, tiled=tiled)
+            elapsed = time.perf_counter() - start
+            rows.append((name, elapsed, "one PNG %dx%d" % Image.open(io.BytesIO(png)).size))
+        print(f"{'method':<18} {'time':>10}  result")
+        for name, elapsed, result in rows:
+            print(f"{name:<18} {elapsed * 1000:7.0f} ms  {result}")
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    main()
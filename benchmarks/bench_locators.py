@@ -0,0 +1,100 @@
+# bench_locators.py
+"""
+Cost of each locator strategy from tests/locator_strategies.py on the
+generated /locators?nodes=N page (a product list of N elements with the
+targets after it), at 1k, 10k and 100k nodes:
+
+ - find_element latency per strategy (ID, NAME, CLASS_NAME, TAG_NAME,
+   LINK_TEXT, PARTIAL_LINK_TEXT, CSS_SELECTOR, XPATH)
+ - XPath text matching: contains(., 'Agree') vs the translate() lowercasing
+   used by the consent XPaths in tests/test_google_search.py
+ - find_elements scaling: every product (N / 11 elements) by class, CSS and
+   XPath, and every link by tag
+
+Medians are compared with a saved JSON baseline (selenium_lab.bench); the
+script exits with status 1 when a case got slower than --tolerance.
+
+Run from the repo root:
+    SELENIUM_LAB_BASE_URL=local python benchmarks/bench_locators.py --save benchmarks/locators.json
+    SELENIUM_LAB_BASE_URL=local python benchmarks/bench_locators.py --baseline benchmarks/locators.json
+"""
+
+import argparse
+import os
+import sys
+
+from selenium.webdriver.common.by import By
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # repo root, for selenium_lab
+from selenium_lab.bench import compare, load_baseline, measure, save_baseline
+from selenium_lab.driver_factory import create_chrome_driver
+from selenium_lab.urls import url_for
+
+LOWER = "translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+
+FIND = {
+    "id": (By.ID, "target-id"),
+    "name": (By.NAME, "target-name"),
+    "class_name": (By.CLASS_NAME, "target-class"),
+    "tag_name": (By.TAG_NAME, "footer"),
+    "link_text": (By.LINK_TEXT, "About"),
+    "partial_link_text": (By.PARTIAL_LINK_TEXT, "Logout"),
+    "css": (By.CSS_SELECTOR, "footer a.target-link"),
+    "xpath": (By.XPATH, "//a[@class='target-link']"),
+    "xpath_contains": (By.XPATH, "//button[contains(., 'Agree')]"),
+    "xpath_translate": (By.XPATH, f"//button[contains({LOWER}, 'agree')]"),
+    "xpath_translate_any": (By.XPATH, f"//*[contains({LOWER}, 'agree')]"),
+}
+
+FIND_ALL = {
+    "all_by_class": (By.CLASS_NAME, "inventory_item"),
+    "all_by_css": (By.CSS_SELECTOR, "div.inventory_item"),
+    "all_by_xpath": (By.XPATH, "//div[@class='inventory_item']"),
+    "all_links_by_tag": (By.TAG_NAME, "a"),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--nodes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--baseline", help="compare with this JSON baseline")
+    parser.add_argument("--save", help="write this run as a JSON baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown of the median")
+    args = parser.parse_args()
+
+    driver = create_chrome_driver(headless=True)
+    driver.implicitly_wait(0)
+    results = {}
+    try:
+        for n in args.nodes:
+            driver.get(url_for(f"/locators?nodes={n}"))
+            elements = driver.execute_script("return document.getElementsByTagName('*').length")
+            print(f"--- {n} nodes requested, {elements} elements on the page")
+            for name, locator in FIND.items():
+                results[f"{name}@{n}"] = timing = measure(lambda: driver.find_element(*locator), args.rounds)
+                print(f"{name:<22} {timing.median_ms:8.2f} ms  (min {timing.min_ms:.2f}, max {timing.max_ms:.2f})")
+            for name, locator in FIND_ALL.items():
+                matches = len(driver.find_elements(*locator))
+                results[f"{name}@{n}"] = timing = measure(lambda: driver.find_elements(*locator), args.rounds,
+                                                          matches=matches)
+                print(f"{name:<22} {timing.median_ms:8.2f} ms  {matches} matches, "
+                      f"{timing.median_ms * 1000 / max(1, matches):.1f} us per element")
+        browser = driver.capabilities.get("browserVersion")
+    finally:
+        driver.quit()
+
+    regressions = []
+    if args.baseline:
+        regressions, lines = compare(load_baseline(args.baseline), results, tolerance=args.tolerance)
+        print(f"--- against {args.baseline}")
+        for line in lines:
+            print(line)
+    if args.save:
+        save_baseline(args.save, results, browser=browser, rounds=args.rounds)
+        print(f"baseline written to {args.save}")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# bench_table_extraction.py
+"""
+Table extraction: per-cell WebDriver loop (old Table_Data_Extraction_e5) vs
+selenium_lab.tables.extract_table (one execute_script).
+
+#table1 on /tables is grown to N rows by cloning its rows in the browser.
+Run from the repo root (local pages recommended):
+    SELENIUM_LAB_BASE_URL=local python benchmarks/bench_table_extraction.py
+
+The per-cell loop is only timed up to --max-loop-rows because it needs about
+7 HTTP commands per row.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from selenium.webdriver.common.by import By
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # repo root, for selenium_lab
+from selenium_lab.driver_factory import create_chrome_driver
+from selenium_lab.tables import extract_table
+from selenium_lab.urls import url_for
+
+GROW_SCRIPT = """
+var body = document.querySelector('#table1 tbody');
+var templates = Array.prototype.slice.call(body.rows, 0, 4);
+var n = arguments[0];
+body.innerHTML = '';
+var frag = document.createDocumentFragment();
+for (var i = 0; i < n; i++) {
+  var row = templates[i % templates.length].cloneNode(true);
+  row.cells[2].textContent = 'user' + i + '@example.com';
+  frag.appendChild(row);
+}
+body.appendChild(frag);
+"""
+
+
+def per_cell_loop(driver):
+    """What Table_Data_Extraction_e5.main used to do."""
+    data = []
+    for row in driver.find_elements(By.CSS_SELECTOR, "#table1 tbody tr"):
+        cells = row.find_elements(By.TAG_NAME, "td")
+        data.append([c.text.strip() for c in cells[:6]])
+    return data
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="+", default=[4, 100, 1000, 10000])
+    parser.add_argument("--max-loop-rows", type=int, default=1000)
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    driver = create_chrome_driver(headless=True)
+    try:
+        print(f"{'rows':>7} {'per-cell loop':>15} {'extract_table':>15} {'chunked':>15} {'speedup':>9}")
+        for n in args.rows:
+            driver.get(url_for("/tables"))
+            driver.execute_script(GROW_SCRIPT, n)
+
+            loop_s = None
+            if n <= args.max_loop_rows:
+                loop_s, loop_rows = timed(lambda: per_cell_loop(driver))
+            bulk_s, table = timed(lambda: extract_table(driver, (By.ID, "table1")))
+            chunk_s, chunked = timed(lambda: extract_table(driver, (By.ID, "table1"), chunk_size=args.chunk_size))
+
+            assert len(table) == len(chunked) == n
+            if loop_s is not None:
+                assert [list(r[:6]) for r in table.rows()] == loop_rows
+
+            loop_txt = f"{loop_s * 1000:12.1f} ms" if loop_s is not None else f"{'skipped':>15}"
+            speedup = f"{loop_s / bulk_s:8.0f}x" if loop_s is not None else f"{'-':>9}"
+            print(f"{n:>7} {loop_txt} {bulk_s * 1000:12.1f} ms {chunk_s * 1000:12.1f} ms {speedup}")
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    main()
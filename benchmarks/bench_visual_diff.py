@@ -0,0 +1,77 @@
+# bench_visual_diff.py
+"""
+Checking many screenshots against baselines: decode-and-diff every pair in
+one process vs selenium_lab.visual.BaselineIndex.check_many (sha256 skip for
+unchanged files, NumPy diff of the rest in a process pool).
+
+No browser needed: synthetic page-like PNGs are generated into a temp folder.
+Run from the repo root:
+    python benchmarks/bench_visual_diff.py --shots 1000 --changed 0.05
+"""
+
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # repo root, for selenium_lab
+from selenium_lab.visual import BaselineIndex, diff_images
+
+
+def page(i, moved=False, width=800, height=600):
+    pixels = np.full((height, width, 3), 245, dtype=np.uint8)
+    pixels[20:60, 20:width - 20] = (i * 37 % 256, 80, 160)
+    for row in range(5):
+        top = 100 + row * 90
+        pixels[top:top + 60, 40:width - 40] = 200 - row * 20
+    if moved:
+        pixels[300:360, 100:300] = 0
+    out = io.BytesIO()
+    Image.fromarray(pixels).save(out, "PNG")
+    return out.getvalue()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--shots", type=int, default=1000)
+    parser.add_argument("--changed", type=float, default=0.05, help="share of screenshots that differ")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index = BaselineIndex(os.path.join(tmp, "baselines"))
+        candidates = []
+        every = max(1, int(round(1 / args.changed))) if args.changed else args.shots + 1
+        for i in range(args.shots):
+            key = BaselineIndex.key(f"tests/test_pages.py::test_{i}")
+            index.approve(key, page(i))
+            path = os.path.join(tmp, f"shot-{i}.png")
+            with open(path, "wb") as f:
+                f.write(page(i, moved=(i % every == 0)))
+            candidates.append((key, path))
+
+        start = time.perf_counter()
+        naive_changed = 0
+        for key, path in candidates:
+            with open(index.path(key), "rb") as f, open(path, "rb") as g:
+                naive_changed += not diff_images(f.read(), g.read(), key=key)
+        naive = time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = index.check_many(candidates, workers=args.workers)
+        fast = time.perf_counter() - start
+
+        changed = sum(not r for r in results)
+        assert changed == naive_changed
+        print(f"{args.shots} screenshots, {changed} changed")
+        print(f"decode + diff every pair: {naive:8.2f} s")
+        print(f"check_many:               {fast:8.2f} s  ({naive / fast:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,3 @@
+# conftest.py (repo root)
+# Shared pytest hooks and fixtures for every test folder (see selenium_lab/pytest_plugin.py).
+pytest_plugins = ["selenium_lab.pytest_plugin"]
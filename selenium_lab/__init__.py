@@ -0,0 +1,6 @@
+"""
+Shared helpers for the Selenium lab.
+
+The exercises and tests import what they need from the submodules, e.g.
+``from selenium_lab.pool import BrowserPool``.
+"""
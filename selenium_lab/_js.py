@@ -0,0 +1,53 @@
+# _js.py
+"""
+JavaScript snippets shared by the helpers that do their work in one
+execute_script / execute_async_script call instead of many WebDriver commands.
+
+FIND_ALL defines ``labFindAll(by, value, root)`` which understands the same
+(By.X, value) locator tuples the Python side uses.
+"""
+
+FIND_ALL = r"""
+function labFindAll(by, value, root) {
+  root = root || document;
+  var css = null;
+  switch (by) {
+    case "id": css = "#" + CSS.escape(value); break;
+    case "name": css = '[name="' + value.replace(/"/g, '\\"') + '"]'; break;
+    case "class name": css = "." + CSS.escape(value); break;
+    case "tag name": css = value; break;
+    case "css selector": css = value; break;
+    case "xpath":
+      var doc = root.ownerDocument || root;
+      var snap = doc.evaluate(value, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+      var found = [];
+      for (var i = 0; i < snap.snapshotLength; i++) { found.push(snap.snapshotItem(i)); }
+      return found;
+    case "link text":
+    case "partial link text":
+      return Array.prototype.filter.call(root.querySelectorAll("a"), function (a) {
+        var text = (a.innerText || a.textContent || "").trim();
+        return by === "link text" ? text === value : text.indexOf(value) !== -1;
+      });
+    default:
+      throw new Error("unsupported locator strategy: " + by);
+  }
+  return Array.prototype.slice.call(root.querySelectorAll(css));
+}
+function labFind(by, value, root) {
+  var all = labFindAll(by, value, root);
+  return all.length ? all[0] : null;
+}
+function labVisible(el) {
+  if (!el || !el.isConnected) { return false; }
+  var style = window.getComputedStyle(el);
+  if (style.display === "none" || style.visibility === "hidden" || style.opacity === "0") { return false; }
+  var rect = el.getBoundingClientRect();
+  return rect.width > 0 && rect.height > 0;
+}
+"""
+
+
+def with_helpers(body):
+    """Prefix ``body`` with the shared helper functions."""
+    return FIND_ALL + "\n" + body
@@ -0,0 +1,249 @@
+# artifacts.py
+"""
+Debug artifacts (screenshots, page source, innerHTML dumps) written in the
+background, compressed and stored once per distinct content.
+
+The scripts used to save a PNG and an HTML file synchronously on the test
+thread, with a timestamp in the name, so debug/ filled up with identical page
+sources. Here the test thread only grabs the data from the browser (that
+has to happen while the page is still there) and hands it to a small thread
+pool, which:
+
+ - hashes it (sha256) and writes it once to blobs/<ab>/<hash>.<ext>; text is
+   compressed with zstd if the ``zstandard`` package is installed, else gzip
+ - records "<name>-<timestamp>.<ext> -> blob" in index.json
+ - evicts the least recently used blobs (and their entries) once the blobs
+   take more than SELENIUM_LAB_ARTIFACT_MAX_MB
+
+    names = save_debug(driver, "login_failure")   # returns at once
+    python -m selenium_lab.artifacts                 # list what was saved
+    python -m selenium_lab.artifacts --extract login_failure-20251106-181708.412.html --to /tmp
+"""
+
+import argparse
+import atexit
+import base64
+import gzip
+import hashlib
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from selenium.common.exceptions import WebDriverException
+
+from selenium_lab import config
+from selenium_lab.locking import locked, read_json, write_json_atomic
+
+try:
+    import zstandard
+except ImportError:  # optional, gzip is used instead
+    zstandard = None
+
+COMPRESSED_KINDS = {"html", "txt", "json", "log", "svg"}   # PNGs are compressed already
+
+
+def _compress(raw):
+    if zstandard is not None:
+        return zstandard.ZstdCompressor(level=10).compress(raw), "zst"
+    return gzip.compress(raw, compresslevel=6, mtime=0), "gz"
+
+
+def _decompress(data, blob):
+    if blob.endswith(".zst"):
+        if zstandard is None:
+            raise RuntimeError(f"{blob} needs the zstandard package")
+        return zstandard.ZstdDecompressor().decompress(data)
+    if blob.endswith(".gz"):
+        return gzip.decompress(data)
+    return data
+
+
+class ArtifactStore:
+    """Content-addressed, size-capped artifact folder with a background writer."""
+
+    def __init__(self, root=None, max_bytes=None, workers=None):
+        self.root = os.path.abspath(root or config.ARTIFACT_DIR)
+        self.max_bytes = int(config.ARTIFACT_MAX_MB * 1024 * 1024) if max_bytes is None else max_bytes
+        self.errors = []    # (entry, exception) of writes that failed
+        self._pool = ThreadPoolExecutor(max_workers=workers or config.ARTIFACT_WORKERS,
+                                        thread_name_prefix="artifacts")
+        self._futures = []
+        self._lock = threading.Lock()
+
+    @property
+    def index_path(self):
+        return os.path.join(self.root, "index.json")
+
+    # -------------------------
+    # test thread side
+    # -------------------------
+    def put(self, name, data, kind, base64_encoded=False):
+        """Queue ``data`` (bytes, str, or base64 text) to be stored; returns the entry name."""
+        now = time.time()
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(now)) + f".{int(now % 1 * 1000):03d}"
+        entry = f"{name}-{stamp}.{kind}"
+        future = self._pool.submit(self._write, entry, data, kind, base64_encoded, now)
+        with self._lock:
+            self._futures = [f for f in self._futures if not f.done()] + [future]
+        return entry
+
+    def capture(self, driver, name):
+        """Queue a screenshot and the page source of ``driver``; returns the entry names.
+
+        Only the two WebDriver calls happen here; hashing, compressing and
+        writing are left to the pool.
+        """
+        entries = []
+        for kind, grab, encoded in (("png", driver.get_screenshot_as_base64, True),
+                                    ("html", lambda: driver.page_source, False)):
+            try:
+                entries.append(self.put(name, grab(), kind, base64_encoded=encoded))
+            except WebDriverException as e:
+                self.errors.append((f"{name}.{kind}", e))
+        return entries
+
+    def flush(self, timeout=None):
+        """Wait until everything queued so far is on disk; returns the failed writes."""
+        with self._lock:
+            futures, self._futures = self._futures, []
+        for future in futures:
+            future.exception(timeout=timeout)
+        return list(self.errors)
+
+    def close(self):
+        self.flush()
+        self._pool.shutdown(wait=True)
+
+    # -------------------------
+    # writer side
+    # -------------------------
+    def _write(self, entry, data, kind, base64_encoded, when):
+        try:
+            if base64_encoded:
+                raw = base64.b64decode(data)
+            else:
+                raw = data.encode("utf-8") if isinstance(data, str) else bytes(data)
+            digest = hashlib.sha256(raw).hexdigest()
+            blob = self._blob_name(digest, kind)
+            path = os.path.join(self.root, "blobs", blob)
+            if not os.path.exists(path):
+                payload, _ = _compress(raw) if kind in COMPRESSED_KINDS else (raw, None)
+                self._write_file(path, payload)
+            self._record(entry, blob, os.path.getsize(path), when)
+        except Exception as e:
+            self.errors.append((entry, e))
+            raise
+
+    @staticmethod
+    def _blob_name(digest, kind):
+        suffix = ""
+        if kind in COMPRESSED_KINDS:
+            suffix = ".zst" if zstandard is not None else ".gz"
+        return f"{digest[:2]}/{digest}.{kind}{suffix}"
+
+    @staticmethod
+    def _write_file(path, payload):
+        # same content always lands on the same name, so a racing writer is harmless
+        folder = os.path.dirname(path)
+        os.makedirs(folder, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=folder, prefix=".tmp-")
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp, path)
+
+    def _record(self, entry, blob, size, when):
+        with locked(self.index_path + ".lock"):
+            index = read_json(self.index_path, None) or {"entries": {}, "blobs": {}}
+            index["entries"][entry] = {"blob": blob, "time": when}
+            index["blobs"][blob] = {"size": size, "used": when}
+            self._evict(index, keep=blob)
+            write_json_atomic(self.index_path, index)
+
+    def _evict(self, index, keep):
+        blobs = index["blobs"]
+        total = sum(info["size"] for info in blobs.values())
+        for blob in sorted(blobs, key=lambda b: blobs[b]["used"]):
+            if total <= self.max_bytes:
+                break
+            if blob == keep:
+                continue
+            total -= blobs.pop(blob)["size"]
+            try:
+                os.remove(os.path.join(self.root, "blobs", blob))
+            except OSError:
+                pass
+        index["entries"] = {name: e for name, e in index["entries"].items() if e["blob"] in blobs}
+
+    # -------------------------
+    # reading back
+    # -------------------------
+    def entries(self):
+        """entry name -> {"blob", "time"} for everything still stored."""
+        return (read_json(self.index_path, None) or {"entries": {}})["entries"]
+
+    def load(self, entry):
+        blob = self.entries()[entry]["blob"]
+        with open(os.path.join(self.root, "blobs", blob), "rb") as f:
+            return _decompress(f.read(), blob)
+
+    def extract(self, entry, folder):
+        """Write ``entry`` as a plain file into ``folder``; returns its path."""
+        os.makedirs(folder, exist_ok=True)
+        path = os.path.join(folder, entry)
+        with open(path, "wb") as f:
+            f.write(self.load(entry))
+        return path
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def store_for(root=None):
+    """The shared ArtifactStore for ``root`` (SELENIUM_LAB_ARTIFACT_DIR by default)."""
+    key = os.path.abspath(root or config.ARTIFACT_DIR)
+    with _stores_lock:
+        if key not in _stores:
+            _stores[key] = ArtifactStore(key)
+        return _stores[key]
+
+
+@atexit.register
+def _flush_all():
+    for store in list(_stores.values()):
+        store.close()
+
+
+def save_debug(driver, name="debug", root=None):
+    """Queue a screenshot and the page source of ``driver`` under ``name``; returns the entry names."""
+    return store_for(root).capture(driver, name)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--root", help="artifact folder (default SELENIUM_LAB_ARTIFACT_DIR)")
+    parser.add_argument("--extract", nargs="+", metavar="ENTRY", help="entries to write out as plain files")
+    parser.add_argument("--to", default=".", help="folder for --extract")
+    args = parser.parse_args(argv)
+
+    store = ArtifactStore(args.root, workers=1)
+    try:
+        if args.extract:
+            for entry in args.extract:
+                print(store.extract(entry, args.to))
+            return 0
+        index = read_json(store.index_path, None) or {"entries": {}, "blobs": {}}
+        for name, entry in sorted(index["entries"].items(), key=lambda item: item[1]["time"]):
+            print(f"{name:60} {index['blobs'][entry['blob']]['size']:>10,} B  {entry['blob']}")
+        stored = sum(info["size"] for info in index["blobs"].values())
+        print(f"{len(index['entries'])} entries in {len(index['blobs'])} blobs, {stored / 1024:.0f} KiB on disk")
+        return 0
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
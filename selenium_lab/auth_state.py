@@ -0,0 +1,243 @@
+# auth_state.py
+"""
+Log in once, then start every later test already authenticated.
+
+The first ``AuthCache.login`` for a set of credentials goes through the login
+form (the ``login`` callable you pass, e.g. ``LoginPage.login``) and takes a
+snapshot of the session: the site's cookies plus localStorage and
+sessionStorage. Later calls, in this process or another worker on the same
+machine, restore the snapshot into the (fresh or pool-reset) browser and load
+the target page directly:
+
+ - Chrome: one DevTools ``Network.setCookies`` call, storage seeded by a
+   script that runs before the page's own, then the page load
+ - other browsers: load the site's origin, add the cookies, write storage,
+   then load the page
+
+Snapshots are keyed by origin + username + a hash of the password, kept in
+memory and in SELENIUM_LAB_CACHE_DIR/auth_state (readable by the owner only).
+A snapshot is dropped and the form used again when:
+ - one of its cookies has expired, or it is older than SELENIUM_LAB_AUTH_MAX_AGE
+ - ``verify(driver)`` says the restored page is not logged in (the server
+   ended the session early, e.g. a restarted fixture server)
+
+    cache = AuthCache()
+    cache.login(driver, "tomsmith", "SuperSecretPassword!", url=url_for("/secure"),
+                login=form_login, verify=lambda d: urlsplit(d.current_url).path == "/secure")
+
+where ``form_login(driver, username, password)`` opens the login page and
+submits the form (see Advance_exercises/selenium_pom_ddt/conftest.py).
+"""
+
+import hashlib
+import json
+import os
+import stat
+import threading
+import time
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+from selenium_lab import config
+from selenium_lab.locking import locked, read_json, write_json_atomic
+
+SNAPSHOT_STORAGE_SCRIPT = r"""
+function dump(storage) {
+  var out = {};
+  try { for (var i = 0; i < storage.length; i++) { var k = storage.key(i); out[k] = storage.getItem(k); } } catch (e) {}
+  return out;
+}
+return {local: dump(window.localStorage), session: dump(window.sessionStorage)};
+"""
+
+RESTORE_STORAGE_SCRIPT = r"""
+var local = arguments[0], session = arguments[1];
+Object.keys(local).forEach(function (k) { window.localStorage.setItem(k, local[k]); });
+Object.keys(session).forEach(function (k) { window.sessionStorage.setItem(k, session[k]); });
+"""
+
+# registered with Page.addScriptToEvaluateOnNewDocument: seeds storage before the page's scripts run
+SEED_STORAGE_TEMPLATE = r"""
+(function () {
+  if (location.origin !== %(origin)s) { return; }
+  var local = %(local)s, session = %(session)s;
+  try {
+    Object.keys(local).forEach(function (k) { localStorage.setItem(k, local[k]); });
+    Object.keys(session).forEach(function (k) { sessionStorage.setItem(k, session[k]); });
+  } catch (e) {}
+})();
+"""
+
+EXPIRY_MARGIN = 30      # seconds: a cookie this close to expiring counts as expired
+
+
+@dataclass
+class AuthStats:
+    logins: int = 0         # went through the login form
+    restored: int = 0       # started from a snapshot
+    expired: int = 0        # snapshots dropped because a cookie or max age ran out
+    rejected: int = 0       # snapshots the site no longer accepted
+    login_seconds: float = 0.0
+    restore_seconds: float = 0.0
+
+    def summary_lines(self):
+        avg_login = self.login_seconds / self.logins if self.logins else 0.0
+        avg_restore = self.restore_seconds / self.restored if self.restored else 0.0
+        return [
+            f"logins={self.logins} restored={self.restored} expired={self.expired} rejected={self.rejected}",
+            f"avg login={avg_login:.2f}s avg restore={avg_restore * 1000:.0f}ms, "
+            f"estimated time saved: {max(0.0, self.restored * (avg_login - avg_restore)):.1f}s",
+        ]
+
+    def reset(self):
+        self.logins = self.restored = self.expired = self.rejected = 0
+        self.login_seconds = self.restore_seconds = 0.0
+
+
+auth_stats = AuthStats()
+_stats_lock = threading.Lock()
+
+
+def _count(**deltas):
+    with _stats_lock:
+        for name, value in deltas.items():
+            setattr(auth_stats, name, getattr(auth_stats, name) + value)
+
+
+def _origin(url):
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def snapshot(driver, max_age=None):
+    """Cookies and storage of the page ``driver`` is on, with the time the snapshot stops being valid."""
+    now = time.time()
+    cookies = driver.get_cookies()
+    storage = driver.execute_script(SNAPSHOT_STORAGE_SCRIPT)
+    expiries = [c["expiry"] for c in cookies if c.get("expiry")]
+    expires = min(expiries + [now + (max_age or config.AUTH_MAX_AGE)])
+    return {"origin": _origin(driver.current_url), "cookies": cookies, "local": storage["local"],
+            "session": storage["session"], "created": now, "expires": expires}
+
+
+def _cdp_cookie(cookie, origin):
+    param = {"name": cookie["name"], "value": cookie["value"], "path": cookie.get("path", "/"),
+             "secure": cookie.get("secure", False), "httpOnly": cookie.get("httpOnly", False)}
+    domain = cookie.get("domain")
+    if domain and domain.startswith("."):
+        param["domain"] = domain
+    else:
+        param["url"] = origin + param["path"]     # host-only cookie, like the original
+    if cookie.get("expiry"):
+        param["expires"] = cookie["expiry"]
+    if cookie.get("sameSite") in ("Strict", "Lax", "None"):
+        param["sameSite"] = cookie["sameSite"]
+    return param
+
+
+def restore(driver, state, url):
+    """Put ``state`` into ``driver`` and load ``url`` (on the snapshot's site)."""
+    if hasattr(driver, "execute_cdp_cmd"):
+        driver.execute_cdp_cmd("Network.setCookies",
+                               {"cookies": [_cdp_cookie(c, state["origin"]) for c in state["cookies"]]})
+        script = None
+        if state["local"] or state["session"]:
+            source = SEED_STORAGE_TEMPLATE % {"origin": json.dumps(state["origin"]),
+                                              "local": json.dumps(state["local"]),
+                                              "session": json.dumps(state["session"])}
+            script = driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": source})
+        driver.get(url)
+        if script is not None:
+            driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": script["identifier"]})
+        return
+    # cookies can only be added for the origin that is loaded
+    driver.get(state["origin"] + "/")
+    for cookie in state["cookies"]:
+        driver.add_cookie({k: v for k, v in cookie.items() if k != "sameSite" or v in ("Strict", "Lax", "None")})
+    driver.execute_script(RESTORE_STORAGE_SCRIPT, state["local"], state["session"])
+    driver.get(url)
+
+
+class AuthCache:
+    """Session snapshots per credential set, shared by the workers on this machine."""
+
+    def __init__(self, root=None, max_age=None):
+        self.root = root or os.path.join(config.CACHE_DIR, "auth_state")
+        self.max_age = max_age or config.AUTH_MAX_AGE
+        self._states = {}
+
+    @staticmethod
+    def key(url, username, password):
+        digest = hashlib.sha256(f"{_origin(url)}\0{username}\0{password}".encode("utf-8")).hexdigest()
+        return digest[:32]
+
+    def _path(self, key):
+        return os.path.join(self.root, key + ".json")
+
+    def _fresh(self, state):
+        return state is not None and state["expires"] - EXPIRY_MARGIN > time.time()
+
+    def get(self, key):
+        """The snapshot for ``key`` if it has not expired."""
+        state = self._states.get(key)
+        if state is None:
+            state = read_json(self._path(key), None)
+        if state is not None and not self._fresh(state):
+            _count(expired=1)
+            self.invalidate(key)
+            return None
+        if state is not None:
+            self._states[key] = state
+        return state
+
+    def put(self, key, state):
+        self._states[key] = state
+        # session cookies are as good as the password: owner-only folder, and the
+        # file is owner-only before the cookies are written into it
+        os.makedirs(self.root, mode=0o700, exist_ok=True)
+        if stat.S_IMODE(os.stat(self.root).st_mode) != 0o700:
+            os.chmod(self.root, 0o700)
+        write_json_atomic(self._path(key), state, mode=0o600)
+
+    def invalidate(self, key):
+        self._states.pop(key, None)
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def login(self, driver, username, password, url, login, verify):
+        """Leave ``driver`` logged in on ``url``; returns "restored" or "login".
+
+        ``login(driver, username, password)`` fills and submits the form;
+        ``verify(driver)`` is true when the loaded page is the logged-in one.
+        """
+        key = self.key(url, username, password)
+        state = self.get(key)
+        if state is not None and self._restore(driver, key, state, url, verify):
+            return "restored"
+        # one worker logs in, the others wait for its snapshot
+        with locked(self._path(key) + ".lock"):
+            state = self.get(key)
+            if state is not None and self._restore(driver, key, state, url, verify):
+                return "restored"
+            started = time.perf_counter()
+            login(driver, username, password)
+            if not verify(driver):
+                driver.get(url)
+                if not verify(driver):
+                    raise RuntimeError(f"logging in as {username!r} did not reach {url}")
+            self.put(key, snapshot(driver, self.max_age))
+            _count(logins=1, login_seconds=time.perf_counter() - started)
+        return "login"
+
+    def _restore(self, driver, key, state, url, verify):
+        started = time.perf_counter()
+        restore(driver, state, url)
+        if verify(driver):
+            _count(restored=1, restore_seconds=time.perf_counter() - started)
+            return True
+        _count(rejected=1)
+        self.invalidate(key)
+        driver.delete_all_cookies()
+        return False
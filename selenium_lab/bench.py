@@ -0,0 +1,74 @@
+# bench.py
+"""
+Timing and baselines for the scripts in benchmarks/.
+
+``measure`` runs a callable a few times (after warm-up rounds) and keeps
+min / median / max / stddev, like pytest-benchmark does. Results of a run can
+be saved as a JSON baseline and later runs compared against it; a case is a
+regression when its median is more than ``tolerance`` (default 25%) and more
+than ``min_ms`` slower than the baseline, so sub-millisecond noise on fast
+cases does not trip it.
+
+    results = {"id@1000": measure(lambda: driver.find_element(By.ID, "x"))}
+    regressions, lines = compare(load_baseline("locators.json"), results)
+    save_baseline("locators.json", results, browser=driver.capabilities["browserVersion"])
+"""
+
+import platform
+import statistics
+import time
+from dataclasses import asdict, dataclass
+
+from selenium_lab.locking import read_json, write_json_atomic
+
+
+@dataclass
+class Timing:
+    rounds: int
+    min_ms: float
+    median_ms: float
+    max_ms: float
+    stddev_ms: float
+    extra: dict = None      # anything the benchmark wants kept with the case (e.g. matches)
+
+
+def measure(fn, rounds=10, warmup=1, **extra):
+    """Time ``fn()``; returns a Timing."""
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return Timing(rounds, min(samples), statistics.median(samples), max(samples),
+                  statistics.stdev(samples) if rounds > 1 else 0.0, extra or None)
+
+
+def save_baseline(path, results, **meta):
+    """Write ``{case: Timing}`` (plus where it was measured) as a JSON baseline."""
+    meta = dict(meta, python=platform.python_version(), machine=platform.machine(), created=time.time())
+    write_json_atomic(path, {"meta": meta, "results": {case: asdict(t) for case, t in results.items()}})
+
+
+def load_baseline(path):
+    """{case: Timing} from a saved baseline; empty if there is none."""
+    data = read_json(path, {}) or {}
+    return {case: Timing(**fields) for case, fields in data.get("results", {}).items()}
+
+
+def compare(baseline, results, tolerance=0.25, min_ms=0.5):
+    """(regressed case names, report lines) of ``results`` against ``baseline`` medians."""
+    regressions, lines = [], []
+    for case, timing in results.items():
+        before = baseline.get(case)
+        if before is None:
+            lines.append(f"{case:<36} {timing.median_ms:9.2f} ms   (new)")
+            continue
+        ratio = timing.median_ms / before.median_ms if before.median_ms else float("inf")
+        slower = ratio > 1 + tolerance and timing.median_ms - before.median_ms > min_ms
+        if slower:
+            regressions.append(case)
+        lines.append(f"{case:<36} {timing.median_ms:9.2f} ms  vs {before.median_ms:9.2f} ms  "
+                     f"{ratio:5.2f}x{'  REGRESSION' if slower else ''}")
+    return regressions, lines
@@ -0,0 +1,449 @@
+# broker.py
+"""
+Keep warm browsers in a background process and lend them to scripts.
+
+Every exercise script launches chromedriver + Chrome at import and quits it at
+the end, so each run of a script pays a browser cold start (seconds). The
+broker is a small local daemon that keeps a BrowserPool of live sessions and
+leases them over a Unix socket; a script attaches to the leased session's
+chromedriver directly (no new-session call) and ``driver.quit()`` hands the
+browser back, where it gets the pool's fast reset for the next script.
+
+    SELENIUM_LAB_BROKER=1 python Exercsies/Form_Filling_e2.py
+
+With SELENIUM_LAB_BROKER=1, ``create_chrome_driver()`` asks the broker for a
+browser and starts the broker in the background when none is running (the
+first run still waits for a launch, later runs attach in milliseconds). It
+falls back to launching its own Chrome when the broker cannot serve one.
+
+    python -m selenium_lab.broker             # run the broker in the foreground
+    python -m selenium_lab.broker --status    # leases, counters, saved time
+    python -m selenium_lab.broker --stop
+
+Leaks and idle browsers:
+ - a lease lives as long as the script's connection to the broker; a script
+   that exits (or is killed) without quit() closes it, the lease is counted
+   as leaked and the browser is reset for the next script
+ - a lease held longer than SELENIUM_LAB_BROKER_LEASE_TIMEOUT is taken back
+   and its browser quit, so a hung script cannot block the pool
+ - with no lease for SELENIUM_LAB_BROKER_IDLE seconds the broker quits its
+   browsers and exits
+
+The protocol is one JSON object per line each way: {"op": "lease" | "release"
+| "status" | "stop", ...}. The socket is readable by the owner only (a leased
+browser is as good as the user's session). Without Unix sockets (Windows)
+scripts always launch their own Chrome.
+"""
+
+import argparse
+import itertools
+import json
+import os
+import socket
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
+
+from selenium_lab import config
+from selenium_lab.locking import locked
+from selenium_lab.pool import BrowserPool
+
+START_TIMEOUT = 30      # seconds a script waits for a broker it started to listen
+LEASE_WAIT = 60         # seconds a script waits for a free browser before launching its own
+
+
+class BrokerError(RuntimeError):
+    """The broker answered a request with an error."""
+
+
+def executor_url(driver):
+    """URL of the chromedriver serving ``driver``'s session."""
+    executor = driver.command_executor
+    return getattr(executor, "_url", None) or executor.client_config.remote_server_addr
+
+
+# -------------------------
+# daemon
+# -------------------------
+@dataclass
+class BrokerStats:
+    leases: int = 0
+    released: int = 0
+    leaked: int = 0         # connection closed without quit(): script exited or was killed
+    expired: int = 0        # held longer than the lease timeout, taken back
+    dead: int = 0           # browsers found closed at lease time and replaced
+    lease_seconds: float = 0.0
+
+    def summary_lines(self):
+        avg_lease = self.lease_seconds / self.leases if self.leases else 0.0
+        return [
+            f"leases={self.leases} released={self.released} leaked={self.leaked} "
+            f"expired={self.expired} dead={self.dead}",
+            f"avg lease={avg_lease * 1000:.0f}ms",
+        ]
+
+
+@dataclass
+class Lease:
+    id: int
+    driver: object
+    pid: int
+    script: str
+    conn: object
+    started: float          # time.monotonic()
+    expired: bool = False
+
+    def info(self):
+        return {"lease": self.id, "pid": self.pid, "script": self.script,
+                "held_seconds": round(time.monotonic() - self.started, 1)}
+
+
+class Broker:
+    """The pool of warm browsers and the leases handed out from it."""
+
+    def __init__(self, launch=None, size=None, idle_timeout=None, lease_timeout=None):
+        self.pool = BrowserPool(launch or _launch, size=size or config.BROKER_SIZE, implicit_wait=0)
+        self.idle_timeout = config.BROKER_IDLE if idle_timeout is None else idle_timeout
+        self.lease_timeout = config.BROKER_LEASE_TIMEOUT if lease_timeout is None else lease_timeout
+        self.stats = BrokerStats()
+        self._leases = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._last_used = time.monotonic()
+        self._stop = threading.Event()
+
+    def lease(self, pid, script, wait=LEASE_WAIT, conn=None):
+        """Hand out a live browser; raises TimeoutError when none frees up within ``wait``."""
+        started = time.perf_counter()
+        for _ in range(3):
+            driver = self.pool.acquire(timeout=wait)
+            try:
+                driver.window_handles       # closed by hand or crashed since its last use?
+                break
+            except WebDriverException:
+                with self._lock:
+                    self.stats.dead += 1
+                self.pool.release(driver, failed=True)
+        else:
+            raise RuntimeError("the broker's browsers keep dying at lease time")
+        with self._lock:
+            lease = Lease(next(self._ids), driver, pid, script, conn, time.monotonic())
+            self._leases[lease.id] = lease
+            self._last_used = time.monotonic()
+            self.stats.leases += 1
+            self.stats.lease_seconds += time.perf_counter() - started
+        return lease
+
+    def release(self, lease, leaked=False):
+        """Take ``lease``'s browser back; a second release of the same lease does nothing."""
+        with self._lock:
+            if self._leases.pop(lease.id, None) is None:
+                return
+            self._last_used = time.monotonic()
+            if lease.expired:
+                self.stats.expired += 1
+            elif leaked:
+                self.stats.leaked += 1
+            else:
+                self.stats.released += 1
+        if leaked and not lease.expired:
+            print(f"lease {lease.id} ({lease.script}, pid {lease.pid}) was not released; resetting its browser",
+                  flush=True)
+        # an expired lease may still be in use by a hung script: quit it so the next one gets a fresh browser
+        self.pool.release(lease.driver, failed=lease.expired)
+
+    def status(self):
+        with self._lock:
+            leases = [lease.info() for lease in self._leases.values()]
+        return {"pid": os.getpid(), "leases": leases,
+                "summary": self.stats.summary_lines() + self.pool.stats.summary_lines()}
+
+    def reap(self, now=None):
+        """Take back expired leases; returns True when the broker has been idle too long."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            leases = list(self._leases.values())
+            idle = not leases and self.idle_timeout and now - self._last_used > self.idle_timeout
+        for lease in leases:
+            if self.lease_timeout and not lease.expired and now - lease.started > self.lease_timeout:
+                print(f"lease {lease.id} ({lease.script}, pid {lease.pid}) held for more than "
+                      f"{self.lease_timeout:.0f}s; taking the browser back", flush=True)
+                lease.expired = True
+                if lease.conn is not None:
+                    try:
+                        lease.conn.shutdown(socket.SHUT_RDWR)   # the connection's handler releases it
+                    except OSError:
+                        pass
+                else:
+                    self.release(lease)
+        return bool(idle)
+
+    def run_reaper(self, on_idle, interval=1.0):
+        while not self._stop.wait(interval):
+            if self.reap():
+                print(f"no lease for {self.idle_timeout:.0f}s; shutting down", flush=True)
+                on_idle()
+                return
+
+    def close(self):
+        self._stop.set()
+        with self._lock:
+            leases = list(self._leases.values())
+        for lease in leases:
+            self.release(lease)
+        self.pool.close()
+
+
+def _launch():
+    # the broker's own browsers must not be leased from itself
+    from selenium_lab.driver_factory import create_chrome_driver
+    return create_chrome_driver(maximize=False, broker=False)
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """One client connection; a lease taken on it lasts until release or disconnect."""
+
+    def handle(self):
+        broker = self.server.broker
+        lease = None
+        try:
+            for line in self.rfile:
+                try:
+                    request = json.loads(line)
+                    op = request.get("op")
+                    if op == "lease" and lease is None:
+                        lease = broker.lease(request.get("pid"), request.get("script", "?"),
+                                             request.get("wait", LEASE_WAIT), self.connection)
+                        driver = lease.driver
+                        reply = {"lease": lease.id, "executor": executor_url(driver),
+                                 "session_id": driver.session_id, "capabilities": driver.capabilities}
+                    elif op == "release" and lease is not None:
+                        broker.release(lease)
+                        lease = None
+                        reply = {"ok": True}
+                    elif op == "status":
+                        reply = broker.status()
+                    elif op == "stop":
+                        threading.Thread(target=self.server.shutdown, daemon=True).start()
+                        reply = {"ok": True}
+                    else:
+                        reply = {"error": f"unexpected request {op!r}"}
+                except Exception as e:  # bad request, no browser free, launch failed, ...
+                    reply = {"error": f"{type(e).__name__}: {e}"}
+                self.wfile.write((json.dumps(reply) + "\n").encode("utf-8"))
+        except OSError:
+            pass
+        finally:
+            if lease is not None:
+                broker.release(lease, leaked=True)
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def serve(path=None, size=None, idle_timeout=None, lease_timeout=None, launch=None):
+    """Run a broker on ``path`` until it is stopped or idle; returns the exit code."""
+    path = path or config.BROKER_SOCKET
+    if _ping(path):
+        print(f"a broker is already running on {path}")
+        return 1
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    try:
+        os.remove(path)         # left behind by a broker that did not exit cleanly
+    except FileNotFoundError:
+        pass
+    broker = Broker(launch, size, idle_timeout, lease_timeout)
+    server = _Server(path, _Handler)
+    server.broker = broker
+    os.chmod(path, 0o600)
+    print(f"broker pid {os.getpid()} on {path}: warming {broker.pool.size} browser(s)", flush=True)
+    threading.Thread(target=broker.pool.start, daemon=True).start()
+    threading.Thread(target=broker.run_reaper, args=(server.shutdown,), daemon=True).start()
+    try:
+        server.serve_forever(poll_interval=0.5)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        broker.close()
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        print("\n".join(broker.stats.summary_lines() + broker.pool.stats.summary_lines()), flush=True)
+    return 0
+
+
+# -------------------------
+# client
+# -------------------------
+def _request(conn, message):
+    conn.sendall((json.dumps(message) + "\n").encode("utf-8"))
+    data = b""
+    while not data.endswith(b"\n"):
+        chunk = conn.recv(65536)
+        if not chunk:
+            raise ConnectionError("the broker closed the connection")
+        data += chunk
+    reply = json.loads(data)
+    if "error" in reply:
+        raise BrokerError(reply["error"])
+    return reply
+
+
+def _connect(path, timeout=None):
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    conn.settimeout(timeout)
+    try:
+        conn.connect(path)
+    except OSError:
+        conn.close()
+        return None
+    return conn
+
+
+def _ping(path):
+    if not hasattr(socket, "AF_UNIX"):
+        return False
+    conn = _connect(path, timeout=2)
+    if conn is None:
+        return False
+    conn.close()
+    return True
+
+
+def spawn(path=None):
+    """Start a broker in the background (logging to SELENIUM_LAB_CACHE_DIR/broker.log)."""
+    path = path or config.BROKER_SOCKET
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, SELENIUM_LAB_BROKER_SOCKET=path,
+               PYTHONPATH=os.pathsep.join(p for p in (root, os.environ.get("PYTHONPATH")) if p))
+    os.makedirs(config.CACHE_DIR, exist_ok=True)
+    with open(os.path.join(config.CACHE_DIR, "broker.log"), "a", encoding="utf-8") as log:
+        return subprocess.Popen([sys.executable, "-m", "selenium_lab.broker"], env=env, cwd=root,
+                                stdin=subprocess.DEVNULL, stdout=log, stderr=subprocess.STDOUT,
+                                start_new_session=True)
+
+
+def _connect_or_spawn(path):
+    conn = _connect(path)
+    if conn is not None:
+        return conn
+    # one script starts the broker, the others wait for it to listen
+    with locked(path + ".lock"):
+        conn = _connect(path)
+        if conn is not None:
+            return conn
+        spawn(path)
+        deadline = time.monotonic() + START_TIMEOUT
+        while time.monotonic() < deadline:
+            time.sleep(0.05)
+            conn = _connect(path)
+            if conn is not None:
+                return conn
+    return None
+
+
+class LeasedDriver(RemoteWebDriver):
+    """A WebDriver on a session the broker started; ``quit()`` gives the browser back."""
+
+    def __init__(self, conn, lease):
+        self._lease_conn = conn
+        self._lease = lease
+        super().__init__(command_executor=lease["executor"], options=webdriver.ChromeOptions())
+
+    def start_session(self, capabilities):
+        # attach to the running session instead of creating one
+        self.session_id = self._lease["session_id"]
+        self.caps = self._lease["capabilities"]
+
+    def execute_cdp_cmd(self, cmd, cmd_args):
+        return self.execute("executeCdpCommand", {"cmd": cmd, "params": cmd_args})["value"]
+
+    def quit(self):
+        conn, self._lease_conn = self._lease_conn, None
+        if conn is None:
+            return
+        try:
+            _request(conn, {"op": "release"})
+        except (OSError, BrokerError):
+            pass        # the broker resets the browser when the connection closes anyway
+        finally:
+            conn.close()
+            self.command_executor.close()
+
+
+def attach(path=None, wait=LEASE_WAIT, start=True):
+    """A LeasedDriver from the broker on ``path``, or None when no broker can serve one.
+
+    start: launch a broker in the background when none is listening.
+    The lease-to-driver time is kept on the driver as ``attach_ms``.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    path = path or config.BROKER_SOCKET
+    started = time.perf_counter()
+    conn = _connect_or_spawn(path) if start else _connect(path)
+    if conn is None:
+        return None
+    conn.settimeout(wait + START_TIMEOUT)       # a cold broker may still be launching its first browser
+    try:
+        lease = _request(conn, {"op": "lease", "pid": os.getpid(), "script": os.path.basename(sys.argv[0]),
+                                "wait": wait})
+        conn.settimeout(None)
+        driver = LeasedDriver(conn, lease)
+    except (OSError, ValueError, BrokerError):
+        conn.close()
+        return None
+    driver.attach_ms = (time.perf_counter() - started) * 1000
+    return driver
+
+
+def request(op, path=None):
+    """Send one request (e.g. "status", "stop") to the running broker; None if there is none."""
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    conn = _connect(path or config.BROKER_SOCKET, timeout=10)
+    if conn is None:
+        return None
+    try:
+        return _request(conn, {"op": op})
+    finally:
+        conn.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--status", action="store_true", help="show the running broker's leases and counters")
+    parser.add_argument("--stop", action="store_true", help="stop the running broker")
+    parser.add_argument("--size", type=int, default=None, help="warm browsers (default SELENIUM_LAB_BROKER_SIZE)")
+    parser.add_argument("--idle", type=float, default=None,
+                        help="exit after this many seconds without a lease (default SELENIUM_LAB_BROKER_IDLE, 0 = never)")
+    args = parser.parse_args(argv)
+    if not hasattr(socket, "AF_UNIX"):
+        print("the broker needs Unix domain sockets, which this platform does not have")
+        return 1
+    if args.status or args.stop:
+        reply = request("stop" if args.stop else "status")
+        if reply is None:
+            print(f"no broker is running on {config.BROKER_SOCKET}")
+            return 1
+        if args.status:
+            print(f"broker pid {reply['pid']} on {config.BROKER_SOCKET}")
+            for lease in reply["leases"]:
+                print(f"  lease {lease['lease']}: {lease['script']} (pid {lease['pid']}) for {lease['held_seconds']}s")
+            print("\n".join(reply["summary"]))
+        return 0
+    return serve(size=args.size, idle_timeout=args.idle)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
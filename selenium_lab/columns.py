@@ -0,0 +1,118 @@
+# columns.py
+"""
+Column-at-a-time parsing and aggregates for extracted table data (NumPy).
+
+``parse_currency_to_float`` in Exercsies/Table_Data_Extraction_e5.py runs a
+regex and ``float()`` per cell. Here a whole column is cleaned with one
+``bytes.translate`` over the joined text, validated with NumPy byte counts and
+converted with one ``astype(float64)``; the results are identical to the
+per-value function:
+
+    '$1,234.56' -> 1234.56      '($50.00)' -> -50.0      '' / None / 'n/a' -> 0.0
+
+Usage:
+    dues = parse_currency_column(table.columns["Due"])
+    i = argmax(dues)                    # index of the largest due (first one on ties)
+    total(dues)
+    unique_values(table.columns["Email"])
+"""
+
+import re
+
+import numpy as np
+
+_SEP = "\x00"
+_ALLOWED = b"0123456789.-"
+# bytes.translate() deletes everything else in one C pass; multi-byte UTF-8
+# characters are >= 0x80 so they can never survive as digits
+_DELETE = bytes(b for b in range(256) if b not in _ALLOWED and b != 0)
+_NOT_NUMERIC = re.compile(r"[^0-9.\-]")
+_DASH, _DOT, _OPEN = ord("-"), ord("."), ord("(")
+
+
+def _is_parenthesized(text):
+    text = text.strip()
+    return text.startswith("(") and text.endswith(")")
+
+
+def _parse_per_value(texts):
+    """Slow path, only used when a value contains NUL (the separator of the fast path)."""
+    negative = np.array([_is_parenthesized(t) for t in texts], dtype=bool)
+    parsed = []
+    for t in texts:
+        cleaned = _NOT_NUMERIC.sub("", t)
+        try:
+            parsed.append(float(cleaned) if cleaned else 0.0)
+        except ValueError:
+            parsed.append(0.0)
+    parsed = np.array(parsed, dtype=np.float64)
+    return np.where(negative, -parsed, parsed)
+
+
+def parse_currency_column(values):
+    """Parse a sequence of currency/number strings into a float64 array.
+
+    Same rules as parse_currency_to_float: surrounding whitespace is ignored,
+    '(...)' means negative, every character other than digits/'.'/'-' is
+    dropped, and anything that is then not a valid number (or None) is 0.0.
+    """
+    texts = ["" if v is None else v for v in values] if None in values else list(values)
+    n = len(texts)
+    if n == 0:
+        return np.empty(0, dtype=np.float64)
+
+    raw = _SEP.join(texts).encode("utf-8", "surrogatepass")
+    raw_bytes = np.frombuffer(raw, dtype=np.uint8)
+    separators = np.flatnonzero(raw_bytes == 0)
+    if len(separators) != n - 1:
+        return _parse_per_value(texts)
+
+    # 1) keep only [0-9.-] (and the separators) for the whole column at once
+    cleaned = raw.translate(None, _DELETE)
+    buf = np.frombuffer(cleaned, dtype=np.uint8)
+    is_sep = buf == 0
+    item = np.cumsum(is_sep)  # which value every byte belongs to
+
+    # 2) validity per value, from byte counts: what float() accepts once only
+    #    [0-9.-] is left is an optional leading '-', at most one '.', >= 1 digit
+    dashes = np.bincount(item, weights=buf == _DASH, minlength=n)
+    dots = np.bincount(item, weights=buf == _DOT, minlength=n)
+    lengths = np.bincount(item, weights=~is_sep, minlength=n)
+    starts = np.concatenate(([0], np.flatnonzero(is_sep) + 1))
+    first = np.zeros(n, dtype=np.uint8)
+    in_range = starts < len(buf)
+    first[in_range] = buf[starts[in_range]]
+    valid = ((lengths - dashes - dots) > 0) & (dots <= 1) & (
+        (dashes == 0) | ((dashes == 1) & (first == _DASH))
+    )
+
+    # 3) one conversion for the whole column; invalid values become 0.0
+    parts = np.array(cleaned.split(b"\x00"), dtype="S")
+    parts[~valid] = b"0"
+    parsed = parts.astype(np.float64)
+
+    # 4) '(...)' negatives: only values that contain '(' need a closer look
+    opens = np.flatnonzero(raw_bytes == _OPEN)
+    negative = np.zeros(n, dtype=bool)
+    for i in np.unique(np.searchsorted(separators, opens)):
+        negative[i] = _is_parenthesized(texts[i])
+    return np.where(negative, -parsed, parsed)
+
+
+def argmax(array):
+    """Index of the largest value; the first one wins on ties, like max()."""
+    if len(array) == 0:
+        raise ValueError("argmax of an empty column")
+    return int(np.argmax(array))
+
+
+def total(array):
+    return float(np.sum(array))
+
+
+def unique_values(values):
+    """Sorted distinct strings, same as sorted(set(values)).
+
+    A hash set beats np.unique here: NumPy has to sort every fixed-width string.
+    """
+    return sorted(set(values))
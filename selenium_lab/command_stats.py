@@ -0,0 +1,203 @@
+# command_stats.py
+"""
+Latency of every WebDriver command a test sends.
+
+``instrument(driver)`` wraps the driver's command executor (the object that
+turns a command into an HTTP request to chromedriver) and records, per
+command: its W3C name (findElement, getElementText, executeScript,
+takeScreenshot, ...), how long the round trip took, the approximate JSON size
+of the request and of the response, and which test or page-object method
+sent it (the first caller outside selenium and selenium_lab, e.g.
+``LoginPage.login``).
+
+The per-command cost is one perf_counter pair, two size estimates and a short
+stack walk; benchmarks/bench_command_stats.py measures it against real
+commands.
+
+    with instrument(driver, test="tests/test_login.py::test_ok") as log:
+        ...
+    for line in log.histogram_lines(): print(line)
+    for line in slowest([log, ...]): print(line)
+    export([log, ...], "commands.json")     # or .csv
+"""
+
+import bisect
+import csv
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+import selenium
+
+# histogram bucket upper bounds, milliseconds
+BUCKETS_MS = [0.5, 1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 2048, float("inf")]
+
+_LIBRARY_DIRS = (
+    os.path.dirname(selenium.__file__) + os.sep,
+    os.path.dirname(os.path.abspath(__file__)) + os.sep,
+)
+_relpaths = {}      # co_filename -> path shown in reports; relpath is the slowest part of a lookup
+
+
+def _size(value):
+    """Approximate JSON length of a command's params or result, without serialising it."""
+    if isinstance(value, str):
+        return len(value) + 2
+    if isinstance(value, dict):
+        return 2 + sum(len(k) + 4 + _size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return 2 + sum(_size(v) + 1 for v in value)
+    return 0 if value is None else 6
+
+
+def _caller():
+    """(qualified name, file:line) of the first frame outside selenium and selenium_lab."""
+    frame = sys._getframe(2)
+    while frame is not None:
+        code = frame.f_code
+        filename = code.co_filename
+        if not filename.startswith(_LIBRARY_DIRS):
+            if filename not in _relpaths:
+                _relpaths[filename] = os.path.relpath(filename)
+            return getattr(code, "co_qualname", code.co_name), f"{_relpaths[filename]}:{frame.f_lineno}"
+        frame = frame.f_back
+    return "?", "?"
+
+
+@dataclass
+class CommandLog:
+    """Commands of one test: (command, seconds, request bytes, response bytes, caller, where, failed)."""
+
+    test: str = ""
+    commands: list = field(default_factory=list)
+    overhead: float = 0.0       # seconds spent recording, not waiting on the browser
+
+    @property
+    def total(self):
+        return sum(c[1] for c in self.commands)
+
+    def histogram(self):
+        """command -> bucket counts (see BUCKETS_MS)."""
+        counts = defaultdict(lambda: [0] * len(BUCKETS_MS))
+        for name, seconds, *_ in self.commands:
+            counts[name][bisect.bisect_left(BUCKETS_MS, seconds * 1000)] += 1
+        return dict(counts)
+
+    def histogram_lines(self):
+        labels = [f"<{b:g}" for b in BUCKETS_MS[:-1]] + [f">{BUCKETS_MS[-2]:g}"]
+        used = [i for i in range(len(BUCKETS_MS)) if any(c[i] for c in self.histogram().values())]
+        if not used:
+            return [f"{self.test}: no commands"]
+        lines = [f"{self.test}: {len(self.commands)} commands, {self.total:.2f}s",
+                 f"  {'command (ms)':<26}" + "".join(f"{labels[i]:>7}" for i in used)]
+        for name, counts in sorted(self.histogram().items(), key=lambda item: -sum(item[1])):
+            lines.append(f"  {name:<26}" + "".join(f"{counts[i] or '':>7}" for i in used))
+        return lines
+
+    def as_dict(self):
+        return {
+            "test": self.test,
+            "commands": len(self.commands),
+            "seconds": round(self.total, 4),
+            "overhead": round(self.overhead, 6),
+            "histogram_ms": {"buckets": BUCKETS_MS[:-1] + ["inf"], "counts": self.histogram()},
+        }
+
+
+class _Recorder:
+    def __init__(self, executor, log):
+        self.log = log
+        self.original_execute = executor.execute
+
+    def execute(self, command, params):
+        entered = time.perf_counter()
+        request = _size(params)      # before the executor takes the session id out of params
+        started = time.perf_counter()
+        failed = True
+        response = None
+        try:
+            response = self.original_execute(command, params)
+            failed = isinstance(response, dict) and response.get("status") not in (None, 0)
+            return response
+        finally:
+            elapsed = time.perf_counter() - started
+            name, where = _caller()
+            value = response.get("value") if isinstance(response, dict) else response
+            self.log.commands.append((command, elapsed, request, _size(value), name, where, failed))
+            self.log.overhead += time.perf_counter() - entered - elapsed
+
+
+@contextmanager
+def instrument(driver, test=""):
+    """Record every command ``driver`` sends inside the block."""
+    log = CommandLog(test=test)
+    executor = driver.command_executor
+    recorder = _Recorder(executor, log)
+    previous = vars(executor).get("execute")
+    executor.execute = recorder.execute
+    try:
+        yield log
+    finally:
+        if previous is None:
+            del executor.execute
+        else:
+            executor.execute = previous
+
+
+def slowest(logs, top=10):
+    """Report lines: commands by total time, then the slowest single calls with their caller."""
+    by_command = defaultdict(lambda: [0, 0.0, 0.0, 0, 0])   # count, total, max, request, response
+    calls = []
+    for log in logs:
+        for name, seconds, request, response, caller, where, failed in log.commands:
+            entry = by_command[name]
+            entry[0] += 1
+            entry[1] += seconds
+            entry[2] = max(entry[2], seconds)
+            entry[3] += request
+            entry[4] += response
+            calls.append((seconds, name, caller, where, log.test))
+    if not calls:
+        return ["no commands recorded"]
+    lines = [f"{'total':>9} {'count':>6} {'mean':>8} {'max':>8} {'sent':>9} {'received':>9}  command"]
+    for name, (count, total, worst, sent, received) in sorted(by_command.items(), key=lambda i: -i[1][1])[:top]:
+        lines.append(f"{total:8.2f}s {count:>6} {total / count * 1000:6.1f}ms {worst * 1000:6.0f}ms "
+                     f"{sent / 1024:7.0f}KB {received / 1024:7.0f}KB  {name}")
+    lines.append("slowest calls:")
+    for seconds, name, caller, where, test in sorted(calls, reverse=True)[:top]:
+        lines.append(f"{seconds * 1000:8.0f}ms  {name:<22} {caller} ({where})  {test}")
+    overhead = sum(log.overhead for log in logs)
+    total = sum(seconds for seconds, *_ in calls)
+    share = 100 * overhead / total if total else 0.0
+    lines.append(f"recording overhead: {overhead * 1000:.1f} ms ({share:.2f}% of command time)")
+    return lines
+
+
+def export(logs, path):
+    """Write every command as JSON (one object per test, with histograms) or CSV (one row per command)."""
+    folder = os.path.dirname(os.path.abspath(path))
+    os.makedirs(folder, exist_ok=True)
+    if path.endswith(".csv"):
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["test", "command", "ms", "request_bytes", "response_bytes", "caller", "where", "failed"])
+            for log in logs:
+                for name, seconds, request, response, caller, where, failed in log.commands:
+                    writer.writerow([log.test, name, round(seconds * 1000, 3), request, response, caller, where, int(failed)])
+        return path
+    data = {"created": time.time(), "tests": []}
+    for log in logs:
+        entry = log.as_dict()
+        entry["calls"] = [
+            {"command": name, "ms": round(seconds * 1000, 3), "request_bytes": request,
+             "response_bytes": response, "caller": caller, "where": where, "failed": failed}
+            for name, seconds, request, response, caller, where, failed in log.commands
+        ]
+        data["tests"].append(entry)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=1)
+    return path
@@ -0,0 +1,127 @@
+# config.py
+"""
+Settings shared by the lab helpers.
+Every value can be overridden with an environment variable so the same
+scripts and tests run unchanged on a laptop and in CI.
+"""
+
+import os
+
+
+def _env_int(name, default):
+    value = os.environ.get(name)
+    return int(value) if value not in (None, "") else default
+
+
+def _env_float(name, default):
+    value = os.environ.get(name)
+    return float(value) if value not in (None, "") else default
+
+
+def _env_bool(name, default):
+    value = os.environ.get(name)
+    if value in (None, ""):
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+# -------------------------
+# Browser
+# -------------------------
+HEADLESS = _env_bool("SELENIUM_LAB_HEADLESS", False)
+IMPLICIT_WAIT = _env_float("SELENIUM_LAB_IMPLICIT_WAIT", 10)  # seconds, same as the old fixture
+
+# -------------------------
+# Driver resolution (selenium_lab/driver_factory.py)
+# -------------------------
+CACHE_DIR = os.environ.get("SELENIUM_LAB_CACHE_DIR") or os.path.join(
+    os.path.expanduser("~"), ".cache", "selenium_lab"
+)
+CHROME_BINARY = os.environ.get("SELENIUM_LAB_CHROME_BINARY")          # skip browser discovery
+PINNED_CHROMEDRIVER = os.environ.get("SELENIUM_LAB_CHROMEDRIVER")     # local fallback when offline
+OFFLINE = _env_bool("SELENIUM_LAB_OFFLINE", False)                    # never call webdriver_manager
+
+# -------------------------
+# Pages under test (selenium_lab/urls.py, selenium_lab/fixture_server)
+# -------------------------
+BASE_URL = os.environ.get("SELENIUM_LAB_BASE_URL") or "https://the-internet.herokuapp.com"  # or "local"
+FIXTURE_DELAY = _env_float("SELENIUM_LAB_FIXTURE_DELAY", 5.0)             # dynamic_loading delay, seconds
+FIXTURE_SESSION_TTL = _env_float("SELENIUM_LAB_FIXTURE_SESSION_TTL", 3600)  # login session lifetime, seconds
+
+# -------------------------
+# Browser pool (tests/conftest.py)
+# -------------------------
+POOL_SIZE = _env_int("SELENIUM_LAB_POOL_SIZE", 1)          # browsers kept warm per session
+POOL_MAX_USES = _env_int("SELENIUM_LAB_POOL_MAX_USES", 25)  # recycle a browser after this many tests
+
+# -------------------------
+# Login state cache (selenium_lab/auth_state.py)
+# -------------------------
+AUTH_MAX_AGE = _env_float("SELENIUM_LAB_AUTH_MAX_AGE", 1800)  # reuse a login snapshot at most this long, seconds
+
+# -------------------------
+# Browser broker (selenium_lab/broker.py, selenium_lab/driver_factory.py)
+# -------------------------
+BROKER = _env_bool("SELENIUM_LAB_BROKER", False)      # scripts lease a warm browser from the broker
+BROKER_SOCKET = os.environ.get("SELENIUM_LAB_BROKER_SOCKET") or os.path.join(CACHE_DIR, "broker.sock")
+BROKER_SIZE = _env_int("SELENIUM_LAB_BROKER_SIZE", 2)                        # warm browsers the broker keeps
+BROKER_IDLE = _env_float("SELENIUM_LAB_BROKER_IDLE", 900)                    # exit after this long without a lease (0 = never)
+BROKER_LEASE_TIMEOUT = _env_float("SELENIUM_LAB_BROKER_LEASE_TIMEOUT", 600)  # take a browser back after this (0 = never)
+
+# -------------------------
+# Parallel workers (selenium_lab/parallel.py)
+# -------------------------
+PARALLEL_WORKERS = _env_int("SELENIUM_LAB_PARALLEL_WORKERS", 0)        # 0 = from CPU cores and memory
+WORKER_MEMORY_MB = _env_int("SELENIUM_LAB_WORKER_MEMORY_MB", 600)      # browser + driver + pytest, per worker
+DURATIONS_FILE = os.environ.get("SELENIUM_LAB_DURATIONS_FILE") or os.path.join(CACHE_DIR, "test_durations.json")
+
+# -------------------------
+# Data-driven rows (selenium_lab/ddt.py, selenium_lab/datasource.py, selenium_lab/pytest_plugin.py)
+# -------------------------
+DDT = _env_bool("SELENIUM_LAB_DDT", True)     # rows of @pytest.mark.ddt tests share one browser
+DATA_SPLIT_KB = _env_int("SELENIUM_LAB_DATA_SPLIT_KB", 256)   # CSV / JSONL bytes per data_rows test
+DATA_SHARD = os.environ.get("SELENIUM_LAB_DATA_SHARD")        # "index/count": this job's share of every data file
+
+# -------------------------
+# Wait budget (selenium_lab/wait_budget.py, selenium_lab/pytest_plugin.py)
+# -------------------------
+ZERO_IMPLICIT_IN_EXPLICIT = _env_bool("SELENIUM_LAB_ZERO_IMPLICIT_IN_EXPLICIT", False)  # implicit 0 inside WebDriverWait
+WAIT_BUDGET = _env_float("SELENIUM_LAB_WAIT_BUDGET", 0)     # warn when a test wastes more seconds than this (0 = off)
+WAIT_REPORT_TOP = _env_int("SELENIUM_LAB_WAIT_REPORT_TOP", 10)  # rows in the end-of-run wait report
+
+# -------------------------
+# Settling instead of sleeping (selenium_lab/settle.py)
+# -------------------------
+SETTLE_QUIET_MS = _env_int("SELENIUM_LAB_SETTLE_QUIET_MS", 200)  # DOM must be unchanged this long
+SETTLE_TIMEOUT = _env_float("SELENIUM_LAB_SETTLE_TIMEOUT", 10)   # give up (and carry on) after this
+LINGER = _env_float("SELENIUM_LAB_LINGER", 0)                    # keep demo browsers open this long before quit
+
+# -------------------------
+# Debug artifacts (selenium_lab/artifacts.py)
+# -------------------------
+ARTIFACT_DIR = os.environ.get("SELENIUM_LAB_ARTIFACT_DIR") or os.path.join(os.getcwd(), "debug")
+ARTIFACT_MAX_MB = _env_float("SELENIUM_LAB_ARTIFACT_MAX_MB", 200)  # oldest-used blobs are evicted beyond this
+ARTIFACT_WORKERS = _env_int("SELENIUM_LAB_ARTIFACT_WORKERS", 2)    # background writer threads
+
+# -------------------------
+# Flight recorder (selenium_lab/flight_recorder.py, selenium_lab/pytest_plugin.py)
+# -------------------------
+FLIGHT_RECORDER = _env_bool("SELENIUM_LAB_FLIGHT_RECORDER", False)               # opt-in: snapshot every step
+FLIGHT_RECORDER_SIZE = _env_int("SELENIUM_LAB_FLIGHT_RECORDER_SIZE", 20)         # snapshots kept per test
+FLIGHT_RECORDER_MAX_MB = _env_float("SELENIUM_LAB_FLIGHT_RECORDER_MAX_MB", 16)   # memory cap of one ring
+FLIGHT_RECORDER_SCREENSHOTS = _env_bool("SELENIUM_LAB_FLIGHT_RECORDER_SCREENSHOTS", True)
+
+# -------------------------
+# Visual regression (selenium_lab/visual.py)
+# -------------------------
+VISUAL_BASELINE_DIR = os.environ.get("SELENIUM_LAB_VISUAL_BASELINE_DIR") or os.path.join(os.getcwd(), "visual_baselines")
+VISUAL_TOLERANCE = _env_int("SELENIUM_LAB_VISUAL_TOLERANCE", 8)   # per-channel difference still counted as equal
+VISUAL_WORKERS = _env_int("SELENIUM_LAB_VISUAL_WORKERS", 0)       # diff processes (0 = one per CPU)
+
+# -------------------------
+# Command latency (selenium_lab/command_stats.py, selenium_lab/pytest_plugin.py)
+# -------------------------
+COMMAND_STATS = _env_bool("SELENIUM_LAB_COMMAND_STATS", True)          # time every WebDriver command
+COMMAND_REPORT_TOP = _env_int("SELENIUM_LAB_COMMAND_REPORT_TOP", 10)  # rows in the end-of-run command report
+COMMAND_HISTOGRAMS = _env_int("SELENIUM_LAB_COMMAND_HISTOGRAMS", 3)   # per-test histograms printed (slowest tests)
+COMMAND_EXPORT = os.environ.get("SELENIUM_LAB_COMMAND_EXPORT")         # write every command to this .json / .csv
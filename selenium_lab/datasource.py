@@ -0,0 +1,194 @@
+# datasource.py
+"""
+Stream data-driven test rows from CSV, JSONL or Parquet files of any size.
+
+``pytest.mark.parametrize`` builds one test item (and keeps every row) per
+case at collection time, which does not scale to 100k+ exported rows. A
+DataSource never holds more than one batch of rows: it cuts the file into
+splits without reading it (byte ranges of ~SELENIUM_LAB_DATA_SPLIT_KB for
+CSV / JSONL, where a row belongs to the split its line starts in; row groups
+for Parquet) and reads a split's rows lazily when a test asks for them.
+
+With the pytest plugin, a test marked ``data`` that takes the ``data_rows``
+fixture becomes one test per split, so collecting a 1M-row file costs a
+file stat and a few hundred items:
+
+    @pytest.mark.data("credentials.csv", sample=0.01, where=lambda row: row["region"] == "eu")
+    def test_login_rows(driver, data_rows):
+        for row in data_rows:
+            ...
+
+Options:
+    sample  keep this fraction of rows (0..1); which rows is decided by a hash
+            of the row's position and ``seed``, so reruns and shards agree
+    where   keep only rows for which ``where(row)`` is true
+    shard   (index, count): only every count-th split starting at index, e.g.
+            one CI job of eight; SELENIUM_LAB_DATA_SHARD=index/count sets it
+            for every source
+
+Outside pytest a source is a plain iterator (``for row in DataSource(path)``);
+``head(n)`` takes the first n rows.
+
+CSV and JSONL rows must be one line each (no newlines inside quoted fields).
+Parquet needs pyarrow.
+"""
+
+import csv
+import json
+import os
+import zlib
+from collections import namedtuple
+
+from selenium_lab import config
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:  # optional, only Parquet sources need it
+    pq = None
+
+FORMATS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl", ".parquet": "parquet"}
+
+
+class Split(namedtuple("Split", "index start stop")):
+    """Byte range [start, stop) of a text file, or row group ``index`` of a Parquet file."""
+
+    __slots__ = ()
+
+    def __str__(self):
+        return f"part{self.index}"
+
+
+def parse_shard(value):
+    """"2/8" -> (2, 8); empty -> None."""
+    if not value:
+        return None
+    index, count = (int(part) for part in value.split("/"))
+    if not 0 <= index < count:
+        raise ValueError(f"shard index {index} is not in 0..{count - 1}")
+    return index, count
+
+
+class DataSource:
+    """Rows of one data file, read lazily split by split."""
+
+    def __init__(self, path, fmt=None, sample=None, seed=0, where=None, shard=None, split_bytes=None):
+        self.path = os.path.abspath(path)
+        self.fmt = fmt or FORMATS.get(os.path.splitext(path)[1].lower())
+        if self.fmt not in ("csv", "jsonl", "parquet"):
+            raise ValueError(f"unknown data format for {path!r} (use .csv, .jsonl or .parquet)")
+        if self.fmt == "parquet" and pq is None:
+            raise RuntimeError("reading Parquet data needs pyarrow")
+        if sample is not None and not 0 <= sample <= 1:
+            raise ValueError("sample is a fraction between 0 and 1")
+        self.sample = sample
+        self.seed = seed
+        self.where = where
+        self.shard = shard if shard is not None else parse_shard(config.DATA_SHARD)
+        self.split_bytes = split_bytes or config.DATA_SPLIT_KB * 1024
+        self._header = None
+        self._header_end = 0
+
+    # -------------------------
+    # splits
+    # -------------------------
+    def splits(self):
+        """The splits of this source's shard; only the file size (or Parquet footer) is read."""
+        if self.fmt == "parquet":
+            groups = pq.ParquetFile(self.path).metadata.num_row_groups
+            splits = [Split(i, 0, 0) for i in range(groups)]
+        else:
+            size = os.path.getsize(self.path)
+            count = max(1, -(-size // self.split_bytes))
+            step = -(-size // count) if size else 1
+            splits = [Split(i, i * step, min(size, (i + 1) * step)) for i in range(count)]
+        if self.shard is not None:
+            index, count = self.shard
+            splits = splits[index::count]
+        return splits
+
+    # -------------------------
+    # rows
+    # -------------------------
+    def _keep(self, position):
+        if self.sample is None:
+            return True
+        key = f"{self.seed}:{position}".encode()
+        return zlib.crc32(key) < self.sample * 2 ** 32
+
+    def _read_header(self):
+        if self._header is None:
+            with open(self.path, "rb") as f:
+                first = f.readline()
+            self._header_end = len(first)
+            self._header = next(csv.reader([first.decode("utf-8-sig")]))
+        return self._header
+
+    def _lines(self, split):
+        """(byte offset, line) of every line that starts inside ``split``."""
+        with open(self.path, "rb") as f:
+            position = split.start
+            if position > 0:
+                f.seek(position - 1)
+                position += len(f.readline()) - 1      # the line in progress belongs to the split before
+            while position < split.stop:
+                line = f.readline()
+                if not line:
+                    break
+                yield position, line
+                position += len(line)
+
+    def _raw_rows(self, split):
+        if self.fmt == "parquet":
+            offset = split.index << 32
+            for batch in pq.ParquetFile(self.path).iter_batches(row_groups=[split.index], batch_size=4096):
+                for row in batch.to_pylist():
+                    if self._keep(offset):
+                        yield row
+                    offset += 1
+            return
+        if self.fmt == "csv":
+            header = self._read_header()
+            lines = ((pos, line) for pos, line in self._lines(split)
+                     if pos >= self._header_end and line.strip() and self._keep(pos))
+            text = (line.decode("utf-8") for _, line in lines)
+            for values in csv.reader(text):
+                yield dict(zip(header, values))
+            return
+        for pos, line in self._lines(split):
+            if line.strip() and self._keep(pos):
+                yield json.loads(line)
+
+    def rows(self, split):
+        """Rows of one split, sampled and filtered."""
+        rows = self._raw_rows(split)
+        return rows if self.where is None else filter(self.where, rows)
+
+    def __iter__(self):
+        for split in self.splits():
+            yield from self.rows(split)
+
+    def head(self, limit):
+        """The first ``limit`` rows (of this shard, after sampling and filtering)."""
+        out = []
+        for row in self:
+            if len(out) >= limit:
+                break
+            out.append(row)
+        return out
+
+
+def write_rows(path, rows, fieldnames=None):
+    """Write dict rows as CSV or JSONL (by extension), streaming; for fixtures and benchmarks."""
+    fmt = FORMATS.get(os.path.splitext(path)[1].lower())
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        if fmt == "jsonl":
+            for row in rows:
+                f.write(json.dumps(row) + "\n")
+            return path
+        writer = None
+        for row in rows:
+            if writer is None:
+                writer = csv.DictWriter(f, fieldnames=fieldnames or list(row), lineterminator="\n")
+                writer.writeheader()
+            writer.writerow(row)
+    return path
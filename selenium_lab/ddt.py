@@ -0,0 +1,107 @@
+# ddt.py
+"""
+Data-driven rows in one browser session.
+
+A parametrized test marked ``@pytest.mark.ddt`` runs its rows back to back in
+one browser instead of launching and quitting Chrome per row. Between rows the
+browser gets the pool's fast reset (alerts, extra windows, storage, cookies,
+then the start URL); a row that fails has its browser quit and the next row
+gets a fresh one. Every row is still its own test in the report.
+
+Each group of rows (same test function, any parameters) gets a BrowserPool of
+size one that is closed once the last row of the group has run; the plugin
+keeps the rows of a group next to each other, also when a parallel worker
+reorders its shard.
+
+    @pytest.mark.ddt
+    @pytest.mark.parametrize("username,password,should_succeed", test_data)
+    def test_login_scenarios(driver, username, password, should_succeed): ...
+
+and in the conftest's driver fixture:
+
+    with ddt_rows(launch) as driver:
+        yield driver
+"""
+
+import threading
+from dataclasses import dataclass
+
+from selenium_lab.pool import BrowserPool
+
+
+def row_group(item):
+    """Group key of a ``ddt``-marked parametrized test item (its id without parameters), else None."""
+    if item is None or not hasattr(item, "callspec") or item.get_closest_marker("ddt") is None:
+        return None
+    return item.nodeid.split("[", 1)[0]
+
+
+def keep_rows_together(items):
+    """Reorder ``items`` in place so every row group runs contiguously, where its first row was."""
+    groups = {}
+    for item in items:
+        groups.setdefault(row_group(item) or id(item), []).append(item)
+    items[:] = [item for group in groups.values() for item in group]
+
+
+@dataclass
+class DdtStats:
+    rows: int = 0
+    groups: int = 0
+    launches: int = 0
+    relaunches: int = 0     # browsers replaced because a row failed
+    resets: int = 0
+    reset_seconds: float = 0.0
+    launch_seconds: float = 0.0
+
+    def summary_lines(self):
+        avg_launch = self.launch_seconds / self.launches if self.launches else 0.0
+        avg_reset = self.reset_seconds / self.resets if self.resets else 0.0
+        saved = max(0.0, (self.rows - self.launches) * avg_launch - self.reset_seconds)
+        return [
+            f"rows={self.rows} in groups={self.groups}: launches={self.launches} "
+            f"(relaunched after failure={self.relaunches}) instead of {self.rows}",
+            f"avg launch={avg_launch:.2f}s avg reset={avg_reset * 1000:.0f}ms, "
+            f"estimated time saved: {saved:.1f}s",
+        ]
+
+
+ddt_stats = DdtStats()
+
+
+class RowGroups:
+    """The live one-browser pool of every row group that has started and not finished."""
+
+    def __init__(self):
+        self._pools = {}
+        self._lock = threading.Lock()
+
+    def pool(self, key, launch, start_url="about:blank", implicit_wait=None):
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = self._pools[key] = BrowserPool(launch, size=1, max_uses=10 ** 9,
+                                                      implicit_wait=implicit_wait, start_url=start_url)
+                ddt_stats.groups += 1
+            ddt_stats.rows += 1
+            return pool
+
+    def close(self, key):
+        with self._lock:
+            pool = self._pools.pop(key, None)
+        if pool is None:
+            return
+        pool.close()
+        stats = pool.stats
+        ddt_stats.launches += stats.launches
+        ddt_stats.relaunches += stats.recycled
+        ddt_stats.resets += len(stats.reset_seconds)
+        ddt_stats.reset_seconds += sum(stats.reset_seconds)
+        ddt_stats.launch_seconds += sum(stats.launch_seconds)
+
+    def close_all(self):
+        for key in list(self._pools):
+            self.close(key)
+
+
+row_groups = RowGroups()
@@ -0,0 +1,229 @@
+# driver_factory.py
+"""
+One place to create Chrome for every script, conftest and demo.
+
+``ChromeDriverManager().install()`` checks the installed browser version and
+the remote driver index on every call, and it fails without network. Here the
+chromedriver path is resolved once per browser version and written to a small
+JSON manifest that every process shares:
+
+    <cache dir>/drivers.json
+    {
+      "browsers": {"/usr/bin/google-chrome": {"mtime": ..., "version": "120.0.6099.109"}},
+      "drivers":  {"120.0.6099.109": {"path": "...", "resolved_at": "..."}}
+    }
+
+Lookup order:
+ 1. in-process memo (free after the first call)
+ 2. manifest entry for the current browser version (a stat + a small JSON read)
+ 3. under a file lock: ChromeDriverManager().install(), then record it
+ 4. offline: a driver recorded for the same major version, the pinned binary
+    (SELENIUM_LAB_CHROMEDRIVER), or a chromedriver on PATH; it is recorded as a
+    fallback, so later processes use it from step 2 and only try the network
+    again after FALLBACK_RETRY seconds (or with refresh=True)
+
+Usage:
+    from selenium_lab.driver_factory import create_chrome_driver
+    driver = create_chrome_driver()
+"""
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import time
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+
+from selenium_lab import config
+from selenium_lab.locking import locked, read_json, write_json_atomic
+
+CHROME_CANDIDATES = [
+    "google-chrome",
+    "google-chrome-stable",
+    "chromium",
+    "chromium-browser",
+    "chrome",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+    r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+    r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+]
+
+_VERSION_RE = re.compile(r"(\d+)\.(\d+)\.(\d+)\.(\d+)")
+
+FALLBACK_RETRY = 24 * 3600  # seconds before a process tries the network again after an offline fallback
+
+_resolved_path = None  # in-process memo
+
+
+class DriverResolutionError(RuntimeError):
+    """No chromedriver could be found online or offline."""
+
+
+def manifest_path():
+    return os.path.join(config.CACHE_DIR, "drivers.json")
+
+
+def find_chrome_binary():
+    """Return the path of the installed Chrome/Chromium, or None."""
+    if config.CHROME_BINARY:
+        return config.CHROME_BINARY
+    for candidate in CHROME_CANDIDATES:
+        path = shutil.which(candidate) or (candidate if os.path.isfile(candidate) else None)
+        if path:
+            return os.path.realpath(path)
+    return None
+
+
+def detect_browser_version(binary):
+    """Ask the browser for its version (slow: starts a subprocess)."""
+    if binary and not sys.platform.startswith("win"):
+        try:
+            out = subprocess.run([binary, "--version"], capture_output=True, text=True, timeout=15).stdout
+            match = _VERSION_RE.search(out)
+            if match:
+                return match.group(0)
+        except (OSError, subprocess.SubprocessError):
+            pass
+    try:
+        from webdriver_manager.chrome import ChromeDriverManager
+        return ChromeDriverManager().driver.get_browser_version_from_os()
+    except Exception:
+        return None
+
+
+def _known_browser_version(manifest, binary):
+    """Version recorded for ``binary`` if the binary has not changed since (mtime check)."""
+    if not binary:
+        return None
+    entry = manifest.get("browsers", {}).get(binary)
+    try:
+        mtime = os.stat(binary).st_mtime
+    except OSError:
+        return None
+    if entry and entry.get("mtime") == mtime:
+        return entry.get("version") or "unknown"    # detection failed for this binary before: don't retry
+    return None
+
+
+def _usable(entry):
+    return bool(entry) and os.path.isfile(entry.get("path", ""))
+
+
+def _current(entry):
+    """Usable, and not an offline fallback that is due for another online attempt."""
+    return _usable(entry) and not (entry.get("fallback") and time.time() - entry.get("checked", 0) > FALLBACK_RETRY)
+
+
+def _offline_fallback(manifest, version):
+    """Best driver we can use without network."""
+    drivers = manifest.get("drivers", {})
+    major = version.split(".")[0] if version else None
+    same_major = [
+        e for v, e in drivers.items() if major and v.split(".")[0] == major and _usable(e)
+    ]
+    if same_major:
+        return max(same_major, key=lambda e: e.get("resolved_at", ""))["path"]
+    if config.PINNED_CHROMEDRIVER and os.path.isfile(config.PINNED_CHROMEDRIVER):
+        return config.PINNED_CHROMEDRIVER
+    on_path = shutil.which("chromedriver")
+    if on_path:
+        return on_path
+    return None
+
+
+def resolve_chromedriver(refresh=False):
+    """Return a chromedriver path for the installed browser, touching the network at most once."""
+    global _resolved_path
+    if _resolved_path and not refresh and os.path.isfile(_resolved_path):
+        return _resolved_path
+
+    path = manifest_path()
+    binary = find_chrome_binary()
+
+    # fast path: no lock, no subprocess, no network
+    if not refresh:
+        manifest = read_json(path, {})
+        version = _known_browser_version(manifest, binary)
+        entry = manifest.get("drivers", {}).get(version) if version else None
+        if _current(entry):
+            _resolved_path = entry["path"]
+            return _resolved_path
+
+    with locked(path + ".lock"):
+        # another process may have resolved it while we waited for the lock
+        manifest = read_json(path, {})
+        before = json.dumps(manifest, sort_keys=True)
+        manifest.setdefault("browsers", {})
+        manifest.setdefault("drivers", {})
+        version = _known_browser_version(manifest, binary)
+        if version is None:
+            version = detect_browser_version(binary)
+            if binary:
+                manifest["browsers"][binary] = {"mtime": os.stat(binary).st_mtime, "version": version}
+        key = version or "unknown"
+
+        entry = manifest["drivers"].get(key)
+        if _current(entry) and not refresh:
+            driver_path = entry["path"]
+        else:
+            driver_path = None
+            error = None
+            if not config.OFFLINE:
+                try:
+                    from webdriver_manager.chrome import ChromeDriverManager
+                    driver_path = ChromeDriverManager().install()
+                except Exception as e:  # offline, rate limited, webdriver_manager missing, ...
+                    error = e
+            if driver_path:
+                manifest["drivers"][key] = {
+                    "path": driver_path,
+                    "resolved_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                }
+            else:
+                driver_path = _offline_fallback(manifest, version)
+                if driver_path is None:
+                    raise DriverResolutionError(
+                        f"could not resolve chromedriver for Chrome {key} "
+                        f"(set SELENIUM_LAB_CHROMEDRIVER to a local binary): {error}"
+                    )
+                manifest["drivers"][key] = {
+                    "path": driver_path,
+                    "resolved_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                    "fallback": True,
+                    "checked": time.time(),
+                }
+        if json.dumps(manifest, sort_keys=True) != before:
+            write_json_atomic(path, manifest)
+
+    _resolved_path = driver_path
+    return driver_path
+
+
+def create_chrome_driver(headless=None, implicit_wait=None, maximize=True, options=None, broker=None):
+    """Start Chrome with the cached driver path.
+
+    headless: None uses SELENIUM_LAB_HEADLESS.
+    implicit_wait: seconds, or None to leave Selenium's default (0).
+    broker: lease a warm browser from selenium_lab.broker instead of launching
+    one (None uses SELENIUM_LAB_BROKER); not with custom ``options``. quit()
+    gives a leased browser back.
+    """
+    driver = None
+    if (config.BROKER if broker is None else broker) and options is None and headless in (None, config.HEADLESS):
+        from selenium_lab.broker import attach  # the broker launches its own browsers through this function
+        driver = attach()
+    if driver is None:
+        if options is None:
+            options = webdriver.ChromeOptions()
+        if config.HEADLESS if headless is None else headless:
+            options.add_argument("--headless=new")
+        driver = webdriver.Chrome(service=Service(resolve_chromedriver()), options=options)
+    if maximize:
+        driver.maximize_window()
+    if implicit_wait is not None:
+        driver.implicitly_wait(implicit_wait)
+    return driver
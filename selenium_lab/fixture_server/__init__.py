@@ -0,0 +1,15 @@
+"""
+Local stand-in for the-internet.herokuapp.com.
+
+    from selenium_lab.fixture_server import FixtureServer
+    with FixtureServer() as server:
+        driver.get(server.url + "/tables")
+
+Or run it on a fixed port for the standalone scripts:
+    python -m selenium_lab.fixture_server --port 8000
+    SELENIUM_LAB_BASE_URL=http://127.0.0.1:8000 python Exercsies/File_Upload_e6.py
+"""
+
+from selenium_lab.fixture_server.server import FixtureServer, shared_server
+
+__all__ = ["FixtureServer", "shared_server"]
@@ -0,0 +1,27 @@
+# python -m selenium_lab.fixture_server
+import argparse
+import time
+
+from selenium_lab.fixture_server.server import FixtureServer
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve local copies of the lab's the-internet pages.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--delay", type=float, default=None, help="dynamic loading delay in seconds")
+    args = parser.parse_args()
+
+    server = FixtureServer(host=args.host, port=args.port, dynamic_delay=args.delay).start()
+    print(f"Serving fixture pages at {server.url} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
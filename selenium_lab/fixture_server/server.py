@@ -0,0 +1,534 @@
+# server.py
+"""
+In-process stand-in for the the-internet.herokuapp.com pages used by the lab.
+
+Pages live in pages/*.html (content only, wrapped in layout.html). They are
+rendered and gzip-compressed once and then served from memory; variants that
+depend on the query (?delay=, ?fields=, ?nodes=, ...) are compressed the
+first time they are asked for and kept in a small LRU of the last
+VARIANT_CACHE_SIZE, so sweeping a parameter cannot grow the server's memory.
+
+Behaviour kept from the real site:
+ - /login -> POST /authenticate -> /secure with the same flash messages
+ - /secure requires the session cookie, /logout clears it
+ - /dynamic_loading/1 and /2 with a configurable delay (?delay=seconds)
+ - POST /upload echoes the uploaded file name
+ - /windows opens /windows/new in a new tab
+ - /javascript_alerts, /key_presses, /hovers, /drag_and_drop, /iframe, /large, /tables
+
+Extra pages that the real site does not have:
+ - /form?fields=N  a generated form with N mixed controls (default 200)
+ - /frames?count=N&depth=D  N widget iframes, the last one nesting D levels down
+   to an <input id="target"> (defaults 30 and 3)
+ - /locators?nodes=N  a product list of about N elements with one target per
+   locator strategy after it (default 1000)
+Query values that are not numbers get a 400 answer; sizes are clamped to
+QUERY_LIMITS so a typo cannot build a gigabyte page.
+
+Usage:
+    with FixtureServer() as server:
+        driver.get(server.url + "/login")
+"""
+
+import gzip
+import hashlib
+import html
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from email import policy
+from email.parser import BytesParser
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from selenium_lab import config
+
+PAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pages")
+
+USERNAME = "tomsmith"
+PASSWORD = "SuperSecretPassword!"
+SESSION_COOKIE = "rack.session"
+# query parameters of the generated / delayed pages: (type, minimum, maximum); values outside are clamped
+QUERY_LIMITS = {
+    "delay": (float, 0.0, 60.0),
+    "fields": (int, 1, 5000),
+    "count": (int, 1, 500),
+    "depth": (int, 0, 10),
+    "nodes": (int, 1, 200_000),
+}
+VARIANT_CACHE_SIZE = 32     # rendered query-dependent pages kept, least recently used dropped first
+
+FLASHES = {
+    "logged_in": ("success", "You logged into a secure area!"),
+    "logged_out": ("success", "You logged out of the secure area!"),
+    "invalid_username": ("error", "Your username is invalid!"),
+    "invalid_password": ("error", "Your password is invalid!"),
+    "login_required": ("error", "You must login to view the secure area!"),
+}
+
+# path -> template for pages that need no request data
+STATIC_ROUTES = {
+    "/": "index.html",
+    "/login": "login.html",
+    "/upload": "upload.html",
+    "/tables": "tables.html",
+    "/windows": "windows.html",
+    "/windows/new": "windows_new.html",
+    "/iframe": "iframe.html",
+    "/javascript_alerts": "javascript_alerts.html",
+    "/key_presses": "key_presses.html",
+    "/hovers": "hovers.html",
+    "/drag_and_drop": "drag_and_drop.html",
+    "/dynamic_loading": "dynamic_loading.html",
+}
+
+CONTENT_TYPES = {
+    ".html": "text/html; charset=utf-8",
+    ".svg": "image/svg+xml",
+}
+
+
+class Asset:
+    """A response body kept both raw and gzip-compressed."""
+
+    __slots__ = ("raw", "gz", "etag", "content_type")
+
+    def __init__(self, raw, content_type="text/html; charset=utf-8"):
+        self.raw = raw
+        self.gz = gzip.compress(raw, compresslevel=6, mtime=0)
+        self.etag = '"%s"' % hashlib.sha1(raw).hexdigest()[:16]
+        self.content_type = content_type
+
+
+class BadRequest(ValueError):
+    """A query parameter that is not a number; answered with 400."""
+
+
+def query_params(query, *names):
+    """{name: value} of ``names`` present in ``query``, parsed and clamped to QUERY_LIMITS."""
+    params = {}
+    for name in names:
+        if name not in query:
+            continue
+        kind, low, high = QUERY_LIMITS[name]
+        try:
+            value = kind(query[name][0])
+        except ValueError:
+            raise BadRequest(f"{name} must be a number, not {query[name][0]!r}") from None
+        if value != value:      # nan
+            raise BadRequest(f"{name} must be a number")
+        params[name] = min(max(value, low), high)
+    return params
+
+
+class Response:
+    def __init__(self, status=200, asset=None, headers=None):
+        self.status = status
+        self.asset = asset
+        self.headers = headers or []
+
+
+def build_large_dom(depth=50, columns=50, rows=50):
+    """Content of /large: nested sibling divs plus a rows x columns table."""
+    parts = ['<div class="example">', "  <h3>Large &amp; Deep DOM</h3>",
+             "  <p>Some pages are large and deeply nested. This page has a deep tree of siblings "
+             "and a large table.</p>", '  <div id="siblings">']
+    for level in range(1, depth + 1):
+        parts.append(f'<div id="sibling-{level}.1" class="parent">{level}.1'
+                     f'<div id="sibling-{level}.2" class="child">{level}.2</div>'
+                     f'<div id="sibling-{level}.3" class="child">{level}.3</div>')
+    parts.append("</div>" * depth)
+    parts.append("  </div>")
+    parts.append('  <table id="large-table"><thead><tr>')
+    parts.extend(f'<th class="header column-{c}">{c}</th>' for c in range(1, columns + 1))
+    parts.append("</tr></thead><tbody>")
+    for r in range(1, rows + 1):
+        cells = "".join(f'<td class="column-{c}">{r}.{c}</td>' for c in range(1, columns + 1))
+        parts.append(f'<tr class="row-{r}">{cells}</tr>')
+    parts.append("</tbody></table>")
+    parts.append("</div>")
+    return "\n".join(parts)
+
+
+def build_form(fields=200):
+    """Content of /form: ``fields`` controls cycling through every kind fill_form handles.
+
+    input/change events are counted per field name in ``window.formEvents`` and
+    submitting shows "Received!" in #message, like selenium's web-form page.
+    """
+    kinds = ["text", "password", "email", "number", "textarea", "select", "checkbox", "radio", "date"]
+    parts = ['<div class="example">', "  <h3>Generated Form</h3>", '  <form id="big-form">']
+    for i in range(fields):
+        kind, name = kinds[i % len(kinds)], f"field-{i}"
+        label = f'<label for="{name}">{kind} {i}</label>'
+        if kind == "textarea":
+            control = f'<textarea id="{name}" name="{name}"></textarea>'
+        elif kind == "select":
+            options = "".join(f'<option value="{o}">Option {o}</option>' for o in range(1, 6))
+            control = f'<select id="{name}" name="{name}"><option value="">Open this select menu</option>{options}</select>'
+        elif kind == "checkbox":
+            control = f'<input type="checkbox" id="{name}" name="{name}" value="on">'
+        elif kind == "radio":
+            control = "".join(f'<input type="radio" id="{name}-{o}" name="{name}" value="{o}">' for o in "abc")
+        else:
+            control = f'<input type="{kind}" id="{name}" name="{name}">'
+        parts.append(f'    <p class="field {kind}">{label}{control}</p>')
+    parts.append('    <button type="submit">Submit</button>')
+    parts.append("  </form>")
+    parts.append('  <p id="message"></p>')
+    parts.append("""  <script>
+    window.formEvents = {};
+    var form = document.getElementById("big-form");
+    ["input", "change"].forEach(function (type) {
+      form.addEventListener(type, function (e) {
+        var counts = window.formEvents[e.target.name] = window.formEvents[e.target.name] || {input: 0, change: 0};
+        counts[type]++;
+      });
+    });
+    form.addEventListener("submit", function (e) {
+      e.preventDefault();
+      document.getElementById("message").textContent = "Received!";
+    });
+  </script>""")
+    parts.append("</div>")
+    return "\n".join(parts)
+
+
+def build_frames(count=30, depth=3):
+    """Content of /frames: ``count`` srcdoc "widget" iframes, like an ad-heavy page.
+
+    The last widget holds ``depth`` nested iframes with <input id="target">
+    in the innermost one.
+    """
+    inner = '<p>innermost frame</p><input id="target" type="text">'
+    for level in range(depth, 0, -1):
+        inner = f'<p>frame level {level}</p><iframe name="level-{level}" srcdoc="{html.escape(inner)}"></iframe>'
+    parts = ['<div class="example">', "  <h3>Nested Frames</h3>"]
+    for i in range(count - 1):
+        widget = f'<div class="ad">Widget {i}</div>'
+        parts.append(f'  <iframe class="widget" name="widget-{i}" width="120" height="60" '
+                     f'srcdoc="{html.escape(widget)}"></iframe>')
+    parts.append(f'  <iframe class="widget" name="widget-{count - 1}" srcdoc="{html.escape(inner)}"></iframe>')
+    parts.append("</div>")
+    return "\n".join(parts)
+
+
+def build_locators(nodes=1000):
+    """Content of /locators: a saucedemo-like product list of about ``nodes`` elements.
+
+    Every item repeats the classes, names and link texts the targets use, so a
+    strategy has to look at the whole list; the targets (one per strategy,
+    see benchmarks/bench_locators.py) come after it, in a consent-style footer.
+    """
+    parts = ['<div class="example">', "  <h3>Locator Strategies</h3>", '  <div id="inventory" class="inventory_list">']
+    for i in range(max(1, (nodes - 20) // 11)):    # 11 elements per item
+        parts.append(
+            f'<div class="inventory_item" id="item-{i}">'
+            f'<div class="inventory_item_img"><img alt="Product {i}" src="/img/avatar-blank.svg"></div>'
+            f'<div class="inventory_item_description"><div class="inventory_item_label">'
+            f'<a href="#item-{i}" class="item-link"><div class="inventory_item_name">Product {i}</div></a>'
+            f'<div class="inventory_item_desc">About product {i}</div></div>'
+            f'<div class="pricebar"><div class="inventory_item_price">${i % 100}.99</div>'
+            f'<button class="btn btn_inventory" name="add-to-cart-{i}">Add to cart</button></div></div></div>'
+        )
+    parts.append("  </div>")
+    parts.append("""  <footer id="target-id" class="consent target-class">
+    <input type="text" name="target-name">
+    <a href="#about" class="target-link">About</a>
+    <a href="#logout" class="target-link">Logout now</a>
+    <button class="consent-agree">I Agree</button>
+  </footer>""")
+    parts.append("</div>")
+    return "\n".join(parts)
+
+
+GENERATORS = {"large": build_large_dom, "form": build_form, "frames": build_frames, "locators": build_locators}
+
+
+class FixtureServer:
+    """Serve the local copies of the lab pages from a background thread."""
+
+    def __init__(self, host="127.0.0.1", port=0, dynamic_delay=None, session_ttl=None):
+        self.host = host
+        self.port = port
+        self.dynamic_delay = config.FIXTURE_DELAY if dynamic_delay is None else dynamic_delay
+        self.session_ttl = config.FIXTURE_SESSION_TTL if session_ttl is None else session_ttl
+        self.sessions = {}   # token -> expiry (epoch seconds)
+        self.uploads = []    # (filename, size) of every accepted upload
+        self._templates = {}
+        self._cache = {}            # pages rendered at start-up, kept for the server's life
+        self._variants = OrderedDict()
+        self._variants_lock = threading.Lock()
+        self._pinning = True
+        self._httpd = None
+        self._thread = None
+        self._load_templates()
+        self._precompress()
+        self._pinning = False
+
+    # -------------------------
+    # lifecycle
+    # -------------------------
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}"
+
+    def start(self):
+        self._httpd = ThreadingHTTPServer((self.host, self.port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.app = self
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="fixture-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # -------------------------
+    # rendering
+    # -------------------------
+    def _load_templates(self):
+        for name in os.listdir(PAGES_DIR):
+            with open(os.path.join(PAGES_DIR, name), "rb") as f:
+                self._templates[name] = f.read()
+
+    def _precompress(self):
+        for template in set(STATIC_ROUTES.values()):
+            self.render(template)
+        for key in FLASHES:
+            self.render("login.html", flash=key)
+        self.render("secure.html", flash="logged_in")
+        self.render("dynamic_loading_1.html", delay_ms=int(self.dynamic_delay * 1000))
+        self.render("dynamic_loading_2.html", delay_ms=int(self.dynamic_delay * 1000))
+        self.render_generated("large")
+        self.render_generated("form")
+        self.render_generated("frames")
+        self.render_generated("locators")
+        self.static_asset("avatar-blank.svg")
+
+    def _page(self, content, flash=None):
+        if content.lstrip().startswith("<!DOCTYPE"):
+            return content
+        flash_html = ""
+        if flash:
+            kind, message = FLASHES[flash]
+            flash_html = (self._templates["flash.html"].decode("utf-8")
+                          .replace("{{kind}}", kind).replace("{{message}}", message))
+        layout = self._templates["layout.html"].decode("utf-8")
+        return layout.replace("{{flash}}", flash_html).replace("{{content}}", content)
+
+    def _cached(self, key, build):
+        asset = self._cache.get(key)
+        if asset is not None:
+            return asset
+        with self._variants_lock:
+            asset = self._variants.get(key)
+            if asset is not None:
+                self._variants.move_to_end(key)
+                return asset
+        asset = build()
+        if self._pinning:
+            self._cache[key] = asset
+            return asset
+        with self._variants_lock:
+            self._variants[key] = asset
+            while len(self._variants) > VARIANT_CACHE_SIZE:
+                self._variants.popitem(last=False)
+        return asset
+
+    def render(self, template, flash=None, cache=True, **values):
+        def build():
+            content = self._templates[template].decode("utf-8")
+            for name, value in values.items():
+                content = content.replace("{{%s}}" % name, str(value))
+            return Asset(self._page(content, flash).encode("utf-8"))
+
+        if not cache:
+            return build()
+        return self._cached((template, flash, tuple(sorted(values.items()))), build)
+
+    def render_generated(self, name, **params):
+        return self._cached(("generated", name, tuple(sorted(params.items()))),
+                            lambda: Asset(self._page(GENERATORS[name](**params)).encode("utf-8")))
+
+    def static_asset(self, name):
+        ext = os.path.splitext(name)[1]
+        return self._cached(("static", name),
+                            lambda: Asset(self._templates[name], CONTENT_TYPES.get(ext, "application/octet-stream")))
+
+    # -------------------------
+    # request handling
+    # -------------------------
+    def handle(self, method, target, headers, body):
+        parts = urlsplit(target)
+        path = parts.path.rstrip("/") or "/"
+        query = parse_qs(parts.query)
+        cookies = SimpleCookie(headers.get("Cookie", ""))
+        flash = cookies["flash"].value if "flash" in cookies and cookies["flash"].value in FLASHES else None
+
+        if method == "POST":
+            if path == "/authenticate":
+                return self._authenticate(body)
+            if path == "/upload":
+                return self._upload(headers, body)
+            return Response(405, Asset(b"Method Not Allowed", "text/plain"))
+
+        try:
+            response = self._get(path, query, cookies, flash)
+        except BadRequest as e:
+            return Response(400, Asset(f"<h1>Bad Request</h1><p>{html.escape(str(e))}</p>".encode("utf-8")))
+        if flash and response.status == 200:
+            # flash messages are shown once, like the real site
+            response.headers.append(("Set-Cookie", "flash=; Max-Age=0; Path=/"))
+        return response
+
+    def _get(self, path, query, cookies, flash):
+        if path == "/secure":
+            if not self._valid_session(cookies):
+                return self._redirect("/login", flash="login_required")
+            return Response(200, self.render("secure.html", flash=flash))
+        if path == "/logout":
+            if SESSION_COOKIE in cookies:
+                self.sessions.pop(cookies[SESSION_COOKIE].value, None)
+            return self._redirect("/login", flash="logged_out",
+                                  extra=[("Set-Cookie", f"{SESSION_COOKIE}=; Max-Age=0; Path=/")])
+        if path in ("/dynamic_loading/1", "/dynamic_loading/2"):
+            delay = query_params(query, "delay").get("delay", self.dynamic_delay)
+            template = "dynamic_loading_%s.html" % path[-1]
+            return Response(200, self.render(template, delay_ms=int(delay * 1000)))
+        if path == "/large":
+            return Response(200, self.render_generated("large"))
+        if path == "/form":
+            return Response(200, self.render_generated("form", **query_params(query, "fields")))
+        if path == "/frames":
+            return Response(200, self.render_generated("frames", **query_params(query, "count", "depth")))
+        if path == "/locators":
+            return Response(200, self.render_generated("locators", **query_params(query, "nodes")))
+        if path.startswith("/img/"):
+            name = path[len("/img/"):]
+            if name in self._templates:
+                return Response(200, self.static_asset(name))
+        if path in STATIC_ROUTES:
+            page_flash = flash if path == "/login" else None
+            return Response(200, self.render(STATIC_ROUTES[path], flash=page_flash))
+        return Response(404, Asset(b"<h1>Not Found</h1>"))
+
+    def _authenticate(self, body):
+        form = parse_qs(body.decode("utf-8"))
+        username = form.get("username", [""])[0]
+        password = form.get("password", [""])[0]
+        if username != USERNAME:
+            return self._redirect("/login", flash="invalid_username")
+        if password != PASSWORD:
+            return self._redirect("/login", flash="invalid_password")
+        token = secrets.token_hex(16)
+        self.sessions[token] = time.time() + self.session_ttl
+        cookie = f"{SESSION_COOKIE}={token}; Path=/; HttpOnly; Max-Age={int(self.session_ttl)}"
+        return self._redirect("/secure", flash="logged_in", extra=[("Set-Cookie", cookie)])
+
+    def _valid_session(self, cookies):
+        if SESSION_COOKIE not in cookies:
+            return False
+        token = cookies[SESSION_COOKIE].value
+        expires = self.sessions.get(token)
+        if expires is None or expires < time.time():
+            self.sessions.pop(token, None)
+            return False
+        return True
+
+    def _upload(self, headers, body):
+        content_type = headers.get("Content-Type", "")
+        message = BytesParser(policy=policy.HTTP).parsebytes(
+            b"Content-Type: " + content_type.encode("latin-1") + b"\r\n\r\n" + body
+        )
+        filename, data = None, b""
+        if message.is_multipart():
+            for part in message.iter_parts():
+                if part.get_param("name", header="content-disposition") == "file":
+                    filename = part.get_filename()
+                    data = part.get_payload(decode=True) or b""
+        if not filename:
+            # the real site answers a submit without a file with a 500 page
+            return Response(500, Asset(b"Internal Server Error", "text/plain"))
+        self.uploads.append((filename, len(data)))
+        return Response(200, self.render("uploaded.html", cache=False, filename=html.escape(filename)))
+
+    def _redirect(self, location, flash=None, extra=None):
+        headers = [("Location", location)]
+        if flash:
+            headers.append(("Set-Cookie", f"flash={flash}; Path=/"))
+        headers.extend(extra or [])
+        return Response(302, None, headers)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive: the browser reuses one connection
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_HEAD(self):
+        self._dispatch("HEAD")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def _dispatch(self, method):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        response = self.server.app.handle(method, self.path, self.headers, body)
+
+        asset = response.asset
+        if asset is not None and response.status == 200 and self.headers.get("If-None-Match") == asset.etag:
+            self.send_response(304)
+            self.send_header("ETag", asset.etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        payload = b""
+        self.send_response(response.status)
+        for name, value in response.headers:
+            self.send_header(name, value)
+        if asset is not None:
+            payload = asset.raw
+            if "gzip" in self.headers.get("Accept-Encoding", ""):
+                payload = asset.gz
+                self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Type", asset.content_type)
+            self.send_header("ETag", asset.etag)
+            self.send_header("Vary", "Accept-Encoding")
+            self.send_header("Cache-Control", "no-cache")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        if method != "HEAD":
+            self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass  # keep test output clean
+
+
+_shared = None
+_shared_lock = threading.Lock()
+
+
+def shared_server():
+    """Process-wide server started on first use (SELENIUM_LAB_BASE_URL=local)."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = FixtureServer().start()
+        return _shared
@@ -0,0 +1,235 @@
+# flight_recorder.py
+"""
+Keep the last few page states of a test in memory and write them out only if
+the test fails.
+
+By the time an ``except`` block saves a screenshot the page has often moved
+on (an error page replaced the form, a dialog closed). ``record(driver)``
+wraps one driver and, after every command that can change the page (get,
+click, send_keys, clear, actions, back / forward / refresh, window and alert
+switches), takes a light snapshot:
+
+ - URL, title and an FNV-1a hash of the DOM, computed in the page
+ - the DOM itself only when the hash changed, zlib-compressed
+ - a low-resolution screenshot: a scaled JPEG through the DevTools protocol on
+   Chrome, else a PNG scaled down with Pillow if it is installed
+
+Snapshots go into a ring of SELENIUM_LAB_FLIGHT_RECORDER_SIZE entries that
+also drops its oldest entries when it holds more than
+SELENIUM_LAB_FLIGHT_RECORDER_MAX_MB. ``dump()`` hands the ring to
+selenium_lab.artifacts (one .html / .jpg per snapshot plus a timeline with a
+unified diff between consecutive DOMs). The time spent snapshotting is
+counted so the per-step cost shows up in the pytest summary.
+
+    with record(driver) as recorder:
+        ...
+    if failed:
+        recorder.dump("test_login")
+"""
+
+import base64
+import difflib
+import io
+import json
+import threading
+import time
+import zlib
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.command import Command
+
+from selenium_lab import config
+from selenium_lab.artifacts import store_for
+
+try:
+    from PIL import Image
+except ImportError:  # optional, full-size PNGs are kept instead
+    Image = None
+
+# commands after which the page may look different
+BOUNDARY_COMMANDS = {
+    Command.GET, Command.CLICK_ELEMENT, Command.SEND_KEYS_TO_ELEMENT, Command.CLEAR_ELEMENT,
+    Command.W3C_ACTIONS, Command.GO_BACK, Command.GO_FORWARD, Command.REFRESH,
+    Command.SWITCH_TO_WINDOW, Command.NEW_WINDOW, Command.W3C_ACCEPT_ALERT, Command.W3C_DISMISS_ALERT,
+}
+
+SNAPSHOT_SCRIPT = r"""
+var last = arguments[0];
+var html = document.documentElement ? document.documentElement.outerHTML : "";
+var h = 0x811c9dc5;
+for (var i = 0; i < html.length; i++) { h ^= html.charCodeAt(i); h = Math.imul(h, 16777619); }
+h = (h >>> 0).toString(16);
+return {url: location.href, title: document.title, hash: h, html: h === last ? null : html,
+        width: window.innerWidth, height: window.innerHeight};
+"""
+
+
+@dataclass
+class Snapshot:
+    seq: int
+    time: float
+    command: str
+    url: str = ""
+    title: str = ""
+    dom_hash: str = ""
+    dom: bytes = None           # zlib-compressed DOM, None when unchanged since the previous snapshot
+    screenshot: bytes = None
+    image_kind: str = ""        # "jpg" or "png"
+    error: str = ""
+
+    @property
+    def nbytes(self):
+        return len(self.dom or b"") + len(self.screenshot or b"")
+
+
+@dataclass
+class RecorderStats:
+    """Process-wide totals, printed by the pytest plugin."""
+
+    steps: int = 0              # boundary commands seen
+    snapshots: int = 0
+    seconds: float = 0.0        # time spent taking snapshots
+    peak_bytes: int = 0         # largest ring seen
+    dumps: int = 0
+
+    def summary_lines(self):
+        per_step = 1000.0 * self.seconds / self.snapshots if self.snapshots else 0.0
+        return [f"snapshots={self.snapshots} over {self.steps} steps, {per_step:.1f} ms per snapshot "
+                f"({self.seconds:.2f}s total), peak ring {self.peak_bytes / 1024:.0f} KiB, dumped for {self.dumps} failed tests"]
+
+    def reset(self):
+        self.steps = self.snapshots = self.peak_bytes = self.dumps = 0
+        self.seconds = 0.0
+
+
+recorder_stats = RecorderStats()
+_stats_lock = threading.Lock()
+
+
+class FlightRecorder:
+    def __init__(self, driver, size=None, max_bytes=None, screenshots=None, scale=0.25):
+        self.driver = driver
+        self.size = size or config.FLIGHT_RECORDER_SIZE
+        self.max_bytes = int(config.FLIGHT_RECORDER_MAX_MB * 1024 * 1024) if max_bytes is None else max_bytes
+        self.screenshots = config.FLIGHT_RECORDER_SCREENSHOTS if screenshots is None else screenshots
+        self.scale = scale
+        self.ring = deque()
+        self.nbytes = 0
+        self.seq = 0
+        self._last_hash = None
+        self._busy = False
+        self.original_execute = driver.execute
+
+    def execute(self, command, params=None):
+        if command not in BOUNDARY_COMMANDS or self._busy:
+            return self.original_execute(command, params)
+        try:
+            return self.original_execute(command, params)
+        finally:
+            # also after a failed command: that is the state worth seeing
+            self.snapshot(command)
+
+    # -------------------------
+    # taking snapshots
+    # -------------------------
+    def snapshot(self, command="manual"):
+        started = time.perf_counter()
+        self._busy = True
+        self.seq += 1
+        snap = Snapshot(self.seq, time.time(), command)
+        try:
+            raw = self.driver.execute_script(SNAPSHOT_SCRIPT, self._last_hash)
+            snap.url, snap.title, snap.dom_hash = raw["url"], raw["title"], raw["hash"]
+            if raw["html"] is not None:
+                snap.dom = zlib.compress(raw["html"].encode("utf-8"), 1)
+            self._last_hash = snap.dom_hash
+            if self.screenshots:
+                snap.screenshot, snap.image_kind = self._screenshot(raw["width"], raw["height"])
+        except WebDriverException as e:
+            # an open alert or a closed window; the command itself decides what happens next
+            snap.error = e.msg or type(e).__name__
+        finally:
+            self._busy = False
+        self._push(snap)
+        elapsed = time.perf_counter() - started
+        with _stats_lock:
+            recorder_stats.steps += command != "manual"
+            recorder_stats.snapshots += 1
+            recorder_stats.seconds += elapsed
+            recorder_stats.peak_bytes = max(recorder_stats.peak_bytes, self.nbytes)
+        return snap
+
+    def _screenshot(self, width, height):
+        if hasattr(self.driver, "execute_cdp_cmd"):
+            clip = {"x": 0, "y": 0, "width": width, "height": height, "scale": self.scale}
+            shot = self.driver.execute_cdp_cmd(
+                "Page.captureScreenshot", {"format": "jpeg", "quality": 40, "clip": clip})
+            return base64.b64decode(shot["data"]), "jpg"
+        png = self.driver.get_screenshot_as_png()
+        if Image is None:
+            return png, "png"
+        image = Image.open(io.BytesIO(png))
+        image = image.resize((max(1, int(image.width * self.scale)), max(1, int(image.height * self.scale))))
+        out = io.BytesIO()
+        image.save(out, "PNG", optimize=False)
+        return out.getvalue(), "png"
+
+    def _push(self, snap):
+        self.ring.append(snap)
+        self.nbytes += snap.nbytes
+        while len(self.ring) > self.size or (self.nbytes > self.max_bytes and len(self.ring) > 1):
+            old = self.ring.popleft()
+            self.nbytes -= old.nbytes
+            if self.ring[0].dom is None and old.dom is not None:
+                # the new oldest entry showed the same DOM: keep it so the dump still has it
+                self.ring[0].dom = old.dom
+                self.nbytes += len(old.dom)
+
+    # -------------------------
+    # writing out
+    # -------------------------
+    def timeline(self):
+        """One dict per snapshot (oldest first) with a unified diff against the previous DOM."""
+        entries, previous = [], None
+        for snap in self.ring:
+            entry = {"seq": snap.seq, "time": snap.time, "command": snap.command, "url": snap.url,
+                     "title": snap.title, "dom_hash": snap.dom_hash, "error": snap.error}
+            if snap.dom is not None:
+                dom = zlib.decompress(snap.dom).decode("utf-8")
+                if previous is not None:
+                    entry["diff"] = "".join(difflib.unified_diff(
+                        previous.splitlines(True), dom.splitlines(True), "before", "after", n=1))
+                previous = dom
+            entries.append(entry)
+        return entries
+
+    def dump(self, name, root=None):
+        """Queue every snapshot and the timeline to the artifact store; returns the entry names."""
+        store = store_for(root)
+        names = [store.put(f"{name}-timeline", json.dumps(self.timeline(), indent=2), "json")]
+        for snap in self.ring:
+            if snap.dom is not None:
+                names.append(store.put(f"{name}-{snap.seq:03d}-dom", zlib.decompress(snap.dom), "html"))
+            if snap.screenshot is not None:
+                names.append(store.put(f"{name}-{snap.seq:03d}-screen", snap.screenshot, snap.image_kind))
+        with _stats_lock:
+            recorder_stats.dumps += 1
+        return names
+
+
+@contextmanager
+def record(driver, **options):
+    """Take snapshots of ``driver`` at command boundaries inside the block."""
+    recorder = FlightRecorder(driver, **options)
+    previous = vars(driver).get("execute")  # e.g. the wait-budget wrapper
+    driver.execute = recorder.execute
+    try:
+        yield recorder
+    finally:
+        if previous is None:
+            del driver.execute
+        else:
+            driver.execute = previous
@@ -0,0 +1,158 @@
+# forms.py
+"""
+Fill a whole form in one WebDriver call.
+
+Filling control by control costs a find plus one send_keys / click / Select
+round trip per field, and send_keys types character by character. Here one
+injected script sets every field and fires the events a user would cause
+(input + change), so frameworks that listen for them still see the change.
+
+    fill_form(driver, {
+        (By.NAME, "my-text"): "SoochiTara",          # text, password, textarea, date, ...
+        (By.NAME, "my-select"): "Option 2",           # <select>: option text or value (list for multiple)
+        (By.ID, "my-check-1"): True,                  # checkbox: the state you want, not a toggle
+        (By.NAME, "my-radio"): "radio-2",             # radio group: value to pick (or True on one radio)
+        (By.NAME, "my-file"): "/tmp/pic.png",         # file inputs always use send_keys
+    })
+
+native=True types real keystrokes, but only for the fields that need them:
+ones with inline key handlers (onkeydown / onkeypress / onkeyup), ones marked
+``data-native-input``, fields wrapped in ``Native(value)`` and fields whose
+value did not stick after the script set it (a page script rewrote it).
+"""
+
+from dataclasses import dataclass, field
+
+from selenium_lab._js import with_helpers
+
+FILL_SCRIPT = with_helpers(r"""
+var entries = arguments[0], native = arguments[1];
+var result = {set: 0, native: [], errors: []};
+
+function fire(el, type) {
+  el.dispatchEvent(new Event(type, {bubbles: true}));
+}
+function setValue(el, value) {
+  // the element's own prototype setter, so React-style value trackers notice the change
+  for (var proto = Object.getPrototypeOf(el); proto; proto = Object.getPrototypeOf(proto)) {
+    var desc = Object.getOwnPropertyDescriptor(proto, "value");
+    if (desc) {
+      if (desc.set) { desc.set.call(el, value); return; }
+      break;
+    }
+  }
+  el.value = value;
+}
+function wantsKeys(el) {
+  return el.hasAttribute("data-native-input") || el.hasAttribute("onkeydown") ||
+         el.hasAttribute("onkeypress") || el.hasAttribute("onkeyup");
+}
+function selectOptions(el, wanted, index) {
+  var values = Array.isArray(wanted) ? wanted.map(String) : [String(wanted)];
+  var matched = 0;
+  Array.prototype.forEach.call(el.options, function (o) {
+    var hit = values.indexOf(o.text.trim()) !== -1 || values.indexOf(o.value) !== -1;
+    if (hit) { matched++; }
+    if (el.multiple || hit) { o.selected = hit; }
+  });
+  if (matched < values.length) {
+    result.errors.push([index, "no option " + JSON.stringify(wanted)]);
+    return false;
+  }
+  return true;
+}
+
+function fillOne(entry, index) {
+  var by = entry[0], locator = entry[1], value = entry[2], forceNative = entry[3];
+  var found = labFindAll(by, locator);
+  if (!found.length) { result.errors.push([index, "not found"]); return; }
+  var el = found[0], tag = el.tagName, type = (el.type || "").toLowerCase();
+
+  if (tag === "INPUT" && type === "radio") {
+    var radio = value === true ? el : null;
+    if (!radio) {
+      var group = found.length > 1 ? found : document.getElementsByName(el.name);
+      radio = Array.prototype.filter.call(group, function (r) { return r.value === String(value); })[0];
+    }
+    if (!radio) { result.errors.push([index, "no radio with value " + JSON.stringify(value)]); return; }
+    if (!radio.checked) { radio.checked = true; fire(radio, "input"); fire(radio, "change"); }
+    result.set++;
+    return;
+  }
+  if (el.disabled || el.readOnly) { result.errors.push([index, "disabled or read-only"]); return; }
+  if (tag === "INPUT" && type === "checkbox") {
+    if (el.checked !== Boolean(value)) { el.checked = Boolean(value); fire(el, "input"); fire(el, "change"); }
+    result.set++;
+    return;
+  }
+  if (tag === "SELECT") {
+    if (selectOptions(el, value, index)) { fire(el, "input"); fire(el, "change"); result.set++; }
+    return;
+  }
+  if (tag === "INPUT" && type === "file") { result.native.push([index, el, true]); return; }
+  if (native && (forceNative || wantsKeys(el))) { result.native.push([index, el, false]); return; }
+
+  var text = value === null || value === undefined ? "" : String(value);
+  if (el.isContentEditable) {
+    el.textContent = text;
+    fire(el, "input");
+  } else {
+    el.focus();
+    setValue(el, text);
+    fire(el, "input");
+    fire(el, "change");
+    el.blur();
+    if (native && el.value !== text) { result.native.push([index, el, false]); return; }
+  }
+  result.set++;
+}
+
+entries.forEach(function (entry, index) {
+  // one bad field must not abort the others already filled in this call
+  try { fillOne(entry, index); } catch (e) { result.errors.push([index, String(e && e.message || e)]); }
+});
+return result;
+""")
+
+
+class Native:
+    """Wrap a value to have it typed with real keystrokes when fill_form(native=True)."""
+
+    def __init__(self, value):
+        self.value = value
+
+
+@dataclass
+class FillResult:
+    scripted: int = 0                               # fields set by the script
+    typed: list = field(default_factory=list)       # locators filled with send_keys
+
+    def __len__(self):
+        return self.scripted + len(self.typed)
+
+
+def fill_form(driver, fields, native=False):
+    """Set every (locator -> value) in ``fields`` with one execute_script.
+
+    Raises LookupError naming every field that was not found, had no matching
+    option, was disabled or could not be set; the other fields are still filled.
+    """
+    locators = list(fields)
+    entries = []
+    for locator in locators:
+        value = fields[locator]
+        force = isinstance(value, Native)
+        entries.append([locator[0], locator[1], value.value if force else value, force])
+
+    raw = driver.execute_script(FILL_SCRIPT, entries, native)
+    result = FillResult(scripted=raw["set"])
+    for index, element, is_file in raw["native"]:
+        if not is_file:
+            element.clear()
+        element.send_keys(str(entries[index][2]))
+        result.typed.append(locators[index])
+
+    if raw["errors"]:
+        problems = ", ".join(f"{locators[index]}: {message}" for index, message in raw["errors"])
+        raise LookupError(f"could not fill {len(raw['errors'])} field(s): {problems}")
+    return result
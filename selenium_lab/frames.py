@@ -0,0 +1,181 @@
+# frames.py
+"""
+Find an element in whichever (nested) frame it lives in.
+
+Probing frames from Python (switch into each iframe, find_elements, switch
+back) costs three round trips per frame and usually only looks one level
+deep. Here one injected script walks the whole frame tree of the page,
+recording for every frame its path (the window.frames index at each level,
+which is what switch_to.frame(int) takes) and which of the asked-for
+locators it contains. Cross-origin frames cannot be read from the parent, so
+those are entered once each and the same script is run inside them.
+
+The map is cached per driver together with the page URL and a "frame
+generation": a counter the script keeps in the page that goes up whenever an
+iframe is added, removed, gets a new src or loads a new document. While both
+match, finding an element costs one small script call, the frame switches
+and the find itself:
+
+    el = find_anywhere(driver, (By.ID, "target"))   # driver is now inside its frame
+"""
+
+import weakref
+from collections import namedtuple
+
+from selenium.common.exceptions import NoSuchElementException, WebDriverException
+
+from selenium_lab._js import with_helpers
+
+# bump() is shared by every same-origin document of the page, so the counter
+# lives on the window the walk started from
+FRAME_INDEX_SCRIPT = with_helpers(r"""
+var locators = arguments[0];
+var state = window.__labFrames;
+if (!state) { state = window.__labFrames = {generation: 0}; }
+function bump() { state.generation++; }
+function isFrame(node) { return node.tagName === "IFRAME" || node.tagName === "FRAME"; }
+function touchesFrames(node) {
+  return node.nodeType === 1 && (isFrame(node) || !!node.querySelector("iframe, frame"));
+}
+function watch(doc) {
+  if (doc.__labFramesWatched) { return; }
+  doc.__labFramesWatched = true;
+  new MutationObserver(function (records) {
+    for (var i = 0; i < records.length; i++) {
+      var r = records[i];
+      if (r.type === "attributes" ? isFrame(r.target) :
+          Array.prototype.some.call(r.addedNodes, touchesFrames) ||
+          Array.prototype.some.call(r.removedNodes, touchesFrames)) { bump(); return; }
+    }
+  }).observe(doc, {subtree: true, childList: true, attributes: true, attributeFilter: ["src", "srcdoc"]});
+}
+function hitsIn(doc) {
+  var hits = [];
+  locators.forEach(function (l, i) {
+    try { if (labFindAll(l[0], l[1], doc).length) { hits.push(i); } } catch (e) { /* bad selector for this doc */ }
+  });
+  return hits;
+}
+var frames = [];
+function walk(win, doc, path) {
+  watch(doc);
+  Array.prototype.forEach.call(doc.querySelectorAll("iframe, frame"), function (el) {
+    if (!el.__labFramesHooked) { el.__labFramesHooked = true; el.addEventListener("load", bump); }
+    var child = el.contentWindow, index = -1;
+    if (!child) { return; }
+    for (var k = 0; k < win.frames.length; k++) { if (win.frames[k] === child) { index = k; break; } }
+    if (index < 0) { return; }
+    var childDoc = null;
+    try { childDoc = el.contentDocument; } catch (e) { /* cross-origin */ }
+    var entry = {path: path.concat([index]), name: el.name || el.id || "", src: el.getAttribute("src") || "",
+                 opaque: !childDoc, hits: childDoc ? hitsIn(childDoc) : []};
+    frames.push(entry);
+    if (childDoc) { walk(child, childDoc, entry.path); }
+  });
+}
+walk(window, document, []);
+return {url: location.href, generation: state.generation, hits: hitsIn(document), frames: frames};
+""")
+
+STATE_SCRIPT = "var s = window.__labFrames; return [location.href, s ? s.generation : -1];"
+
+Frame = namedtuple("Frame", "path name src opaque")
+
+
+class FrameIndex:
+    """The frame tree of one page load and where each locator asked about was found."""
+
+    def __init__(self, url, generation):
+        self.url = url
+        self.generation = generation
+        self.frames = []      # Frame for every frame below the top document
+        self.hits = {}        # locator -> [path, ...] of the documents that contain it ([] is the top)
+
+    def paths(self, locator):
+        return self.hits.get(tuple(locator))
+
+
+_indexes = weakref.WeakKeyDictionary()   # driver -> FrameIndex of the page it showed last
+
+
+def switch_to_path(driver, path):
+    """Switch from the top document into the frame at ``path``."""
+    driver.switch_to.default_content()
+    for index in path:
+        driver.switch_to.frame(index)
+
+
+def build_index(driver, locators):
+    """Map every frame of the current page and which of ``locators`` each one contains."""
+    locators = [tuple(locator) for locator in locators]
+    driver.switch_to.default_content()
+    raw = driver.execute_script(FRAME_INDEX_SCRIPT, [list(locator) for locator in locators])
+    index = FrameIndex(raw["url"], raw["generation"])
+    index.hits = {locator: [] for locator in locators}
+    _merge(driver, index, raw, [], locators)
+    driver.switch_to.default_content()
+    _indexes[driver] = index
+    return index
+
+
+def _merge(driver, index, raw, prefix, locators):
+    for i in raw["hits"]:
+        index.hits[locators[i]].append(prefix)
+    for entry in raw["frames"]:
+        path = prefix + entry["path"]
+        index.frames.append(Frame(path, entry["name"], entry["src"], entry["opaque"]))
+        for i in entry["hits"]:
+            index.hits[locators[i]].append(path)
+        if entry["opaque"]:
+            # the parent cannot look inside: go in once and walk that subtree from there
+            try:
+                switch_to_path(driver, path)
+                inner = driver.execute_script(FRAME_INDEX_SCRIPT, [list(locator) for locator in locators])
+            except WebDriverException:
+                continue
+            _merge(driver, index, inner, path, locators)
+
+
+def cached_index(driver):
+    """The cached FrameIndex if the page is still the one it was built for, else None."""
+    index = _indexes.get(driver)
+    if index is None:
+        return None
+    driver.switch_to.default_content()
+    url, generation = driver.execute_script(STATE_SCRIPT)
+    return index if (url, generation) == (index.url, index.generation) else None
+
+
+def find_anywhere(driver, locator):
+    """Find ``locator`` in the page or any nested frame and leave the driver switched into that frame.
+
+    Raises NoSuchElementException if no document of the page contains it.
+    """
+    locator = tuple(locator)
+    index = cached_index(driver)
+    if index is not None and index.paths(locator):
+        element = _find_in(driver, locator, index.paths(locator))
+        if element is not None:
+            return element
+    # not cached, or the frame changed without a new frame generation (e.g. inside a
+    # cross-origin frame): map again, keeping the other locators already asked about
+    previous = _indexes.get(driver)
+    known = list(previous.hits) if previous is not None else []
+    index = build_index(driver, [locator] + [other for other in known if other != locator])
+    element = _find_in(driver, locator, index.paths(locator))
+    if element is None:
+        driver.switch_to.default_content()
+        raise NoSuchElementException(f"{locator} is not in the page or any of its {len(index.frames)} frames")
+    return element
+
+
+def _find_in(driver, locator, paths):
+    for path in paths:
+        try:
+            switch_to_path(driver, path)
+            found = driver.find_elements(*locator)
+        except WebDriverException:
+            continue
+        if found:
+            return found[0]
+    return None
@@ -0,0 +1,157 @@
+# page.py
+"""
+Page-object base class with lazy, cached, stale-aware element attributes.
+
+The usual page object calls ``driver.find_element(*self.USERNAME_INPUT)``
+every time it touches a field, often twice in a row (clear, then
+send_keys). Here the locator attributes are descriptors:
+
+    class LoginPage(BasePage):
+        USERNAME_INPUT = Element(By.ID, "username")
+
+        def login(self, username):
+            self.USERNAME_INPUT.clear()           # first use: one find_element
+            self.USERNAME_INPUT.send_keys(username)  # cached, no find
+
+ - nothing is looked up until the element is first used
+ - the element is then cached on the page object until the page changes under
+   it; a command that fails with StaleElementReferenceException re-finds the
+   element and is retried once, so "cached per page load" needs no bookkeeping
+ - on the class, ``LoginPage.USERNAME_INPUT`` is still the plain (By, value)
+   tuple, so it can go straight into expected_conditions
+
+``element_stats`` counts finds done, finds saved and stale re-finds for the
+whole process; the pytest plugin prints it at the end of the run.
+"""
+
+import threading
+from dataclasses import dataclass
+
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.remote.webelement import WebElement
+
+from selenium_lab.urls import url_for
+
+
+@dataclass
+class ElementStats:
+    finds: int = 0      # find_element round trips made by page-object attributes
+    saved: int = 0      # attribute uses served from the cache instead of a find
+    stale: int = 0      # cached elements that went stale and were found again
+
+    def summary_lines(self):
+        total = self.finds + self.saved
+        share = 100.0 * self.saved / total if total else 0.0
+        return [f"finds={self.finds} saved={self.saved} ({share:.0f}% of lookups) stale re-finds={self.stale}"]
+
+    def reset(self):
+        self.finds = self.saved = self.stale = 0
+
+
+element_stats = ElementStats()
+_stats_lock = threading.Lock()
+
+
+def _count(field, n=1):
+    with _stats_lock:
+        setattr(element_stats, field, getattr(element_stats, field) + n)
+
+
+class LazyElement(WebElement):
+    """A WebElement that finds itself on first use and again when it goes stale."""
+
+    def __init__(self, parent, locator):
+        # WebElement.__init__ is not called: the id is only known after the first find
+        self._parent = parent
+        self._locator = tuple(locator)
+        self._element_id = None
+
+    @property
+    def _id(self):
+        if self._element_id is None:
+            self._resolve()
+        return self._element_id
+
+    @property
+    def resolved(self):
+        return self._element_id is not None
+
+    @property
+    def locator(self):
+        return self._locator
+
+    def _resolve(self):
+        found = self._parent.find_element(*self._locator)
+        _count("finds")
+        self._element_id = found.id
+
+    def _refind(self):
+        _count("stale")
+        self._element_id = None
+        self._resolve()
+
+    def _execute(self, command, params=None):
+        try:
+            return super()._execute(command, dict(params) if params else None)
+        except StaleElementReferenceException:
+            self._refind()
+            return super()._execute(command, dict(params) if params else None)
+
+    # these two go through execute_script instead of _execute
+    def get_attribute(self, name):
+        try:
+            return super().get_attribute(name)
+        except StaleElementReferenceException:
+            self._refind()
+            return super().get_attribute(name)
+
+    def is_displayed(self):
+        try:
+            return super().is_displayed()
+        except StaleElementReferenceException:
+            self._refind()
+            return super().is_displayed()
+
+    def __repr__(self):
+        return f"<LazyElement {self._locator} id={self._element_id}>"
+
+
+class Element(tuple):
+    """Descriptor for one element of a page object; a (By, value) tuple on the class."""
+
+    def __new__(cls, by, value):
+        return super().__new__(cls, (by, value))
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, page, owner=None):
+        if page is None:
+            return self
+        cache = page.__dict__.setdefault("_elements", {})
+        element = cache.get(self.name)
+        if element is None or element._parent is not page.driver:
+            element = cache[self.name] = LazyElement(page.driver, self)
+        elif element.resolved:
+            _count("saved")
+        return element
+
+    def __set__(self, page, value):
+        raise AttributeError(f"{self.name} is a locator; assign the tuple on the class instead")
+
+
+class BasePage:
+    """Base for page objects; subclasses declare ``Element`` attributes and a ``PATH``."""
+
+    PATH = None
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    def open(self):
+        """Load ``PATH`` (resolved against SELENIUM_LAB_BASE_URL)."""
+        self.driver.get(url_for(self.PATH))
+
+    def forget_elements(self):
+        """Drop every cached element (e.g. after navigating away and back)."""
+        self.__dict__.pop("_elements", None)
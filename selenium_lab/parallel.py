@@ -0,0 +1,236 @@
+# parallel.py
+"""
+Run the pytest suites in several worker processes, longest tests first.
+
+    python -m selenium_lab.parallel tests Advance_exercises/selenium_pom_ddt
+    python -m selenium_lab.parallel -n 4 tests -k login
+
+How it works:
+ 1. the test ids are collected once (``pytest --collect-only``)
+ 2. every test gets its expected duration from the history the pytest plugin
+    keeps (SELENIUM_LAB_CACHE_DIR/test_durations.json, a moving average per
+    test id; tests never run before count as the median)
+ 3. longest-first sharding: tests are handed out longest first, each to the
+    worker with the least expected work so far, so the workers finish at
+    about the same time instead of one slow test landing last on a busy one;
+    the rows of a ddt test stay together, so their browser is launched once
+ 4. each worker is a normal pytest process on its shard (SELENIUM_LAB_SHARD
+    names a file of test ids that the plugin keeps, in that order) with its
+    own session-scoped browser pool behind the ``driver`` fixture, its own
+    artifact folder (debug/worker-N) and a log in debug/worker-N.log
+
+The number of workers defaults to one per CPU core, fewer when the available
+memory does not fit SELENIUM_LAB_WORKER_MEMORY_MB per worker (a browser plus
+its driver and pytest), and never more than there are tests.
+"""
+
+import argparse
+import heapq
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from selenium_lab import config
+from selenium_lab.locking import locked, read_json, write_json_atomic
+
+SHARD_ENV = "SELENIUM_LAB_SHARD"        # set by the runner: file with this worker's test ids
+WORKER_ENV = "SELENIUM_LAB_WORKER"      # set by the runner: worker number
+COLLECT_ENV = "SELENIUM_LAB_COLLECT"    # set by the runner: file the plugin writes collected ids + groups to
+
+_NODE_ID_RE = re.compile(r"^[^\s:][^:]*\.py::\S")
+
+
+class DurationHistory:
+    """Moving average of every test's duration (setup + call + teardown), keyed by test id."""
+
+    def __init__(self, path=None, weight=0.5):
+        self.path = path or config.DURATIONS_FILE
+        self.weight = weight        # share of the newest run in the average
+        self.data = read_json(self.path, {}) or {}
+
+    def expected(self, test_ids):
+        """test id -> expected seconds; tests without history get the median of the rest (1s if none)."""
+        known = [self.data[t]["seconds"] for t in test_ids if t in self.data]
+        default = statistics.median(known) if known else 1.0
+        return {t: self.data[t]["seconds"] if t in self.data else default for t in test_ids}
+
+    def _add(self, data, test_id, seconds):
+        entry = data.get(test_id)
+        if entry is None:
+            data[test_id] = {"seconds": seconds, "runs": 1}
+        else:
+            entry["seconds"] += self.weight * (seconds - entry["seconds"])
+            entry["runs"] += 1
+
+    def save(self, durations):
+        """Merge ``{test id: seconds}`` of this run into the file (workers save concurrently)."""
+        if not durations:
+            return
+        with locked(self.path + ".lock"):
+            data = read_json(self.path, {}) or {}
+            for test_id, seconds in durations.items():
+                self._add(data, test_id, seconds)
+            write_json_atomic(self.path, data)
+        self.data = data
+
+
+def shard(expected, workers, groups=None):
+    """Split ``{test id: seconds}`` into ``workers`` lists, longest first onto the least loaded worker.
+
+    groups: ``{test id: group key}``; the tests of a group (the rows of a ddt
+    test) go to one worker together, as one unit of their summed duration.
+    Returns (shards, expected seconds per shard).
+    """
+    units = {}
+    for test_id in expected:
+        units.setdefault((groups or {}).get(test_id, test_id), []).append(test_id)
+    cost = {key: sum(expected[t] for t in ids) for key, ids in units.items()}
+    shards = [[] for _ in range(workers)]
+    loads = [0.0] * workers
+    heap = [(0.0, i) for i in range(workers)]
+    for key in sorted(units, key=lambda k: -cost[k]):
+        load, i = heapq.heappop(heap)
+        shards[i].extend(units[key])
+        loads[i] = load + cost[key]
+        heapq.heappush(heap, (loads[i], i))
+    return shards, loads
+
+
+def available_memory():
+    """Bytes of memory available for new processes, or None if unknown."""
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def auto_workers(tests=None):
+    """One worker per usable core, limited by memory and the number of tests."""
+    cores = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else (os.cpu_count() or 1)
+    workers = cores
+    memory = available_memory()
+    if memory is not None:
+        workers = min(workers, memory // (config.WORKER_MEMORY_MB * 1024 * 1024))
+    if tests is not None:
+        workers = min(workers, tests)
+    return max(1, int(workers))
+
+
+def shard_ids():
+    """Test ids this process should run (in order), or None when it is not a parallel worker."""
+    path = os.environ.get(SHARD_ENV)
+    if not path:
+        return None
+    with open(path, encoding="utf-8") as f:
+        return [line.rstrip("\n") for line in f if line.strip()]
+
+
+def collect(pytest_args):
+    """``{test id: group key}`` of the tests pytest would run for ``pytest_args``, in collection order.
+
+    The pytest plugin writes the ids with their ddt row group to the file named
+    by COLLECT_ENV; without the plugin the ids are read from pytest's output
+    (its node-id block only) and every test is its own group.
+    """
+    with tempfile.TemporaryDirectory(prefix="selenium-lab-collect-") as tmp:
+        path = os.path.join(tmp, "collected.json")
+        proc = subprocess.run([sys.executable, "-m", "pytest", "--collect-only", "-q", *pytest_args],
+                              capture_output=True, text=True, env=dict(os.environ, **{COLLECT_ENV: path}))
+        if proc.returncode not in (0, 5):   # 5: nothing collected
+            sys.stderr.write(proc.stdout + proc.stderr)
+            raise RuntimeError(f"collecting tests failed (pytest exit code {proc.returncode})")
+        collected = read_json(path, None)
+    if collected is not None:
+        return dict(collected)
+    ids = []
+    for line in proc.stdout.splitlines():
+        if not line.strip():
+            break           # end of the node ids; summary and warnings follow
+        if _NODE_ID_RE.match(line):
+            ids.append(line.strip())
+    return {test_id: test_id for test_id in ids}
+
+
+def _worker_env(i, shard_path):
+    env = dict(os.environ)
+    env[SHARD_ENV] = shard_path
+    env[WORKER_ENV] = str(i)
+    env["SELENIUM_LAB_ARTIFACT_DIR"] = os.path.join(config.ARTIFACT_DIR, f"worker-{i}")
+    if config.COMMAND_EXPORT:
+        root, ext = os.path.splitext(config.COMMAND_EXPORT)
+        env["SELENIUM_LAB_COMMAND_EXPORT"] = f"{root}-worker-{i}{ext}"
+    return env
+
+
+def run(pytest_args, workers=None):
+    """Run ``pytest_args`` split over ``workers`` processes; returns the exit code for the whole run."""
+    groups = collect(pytest_args)
+    test_ids = list(groups)
+    if not test_ids:
+        print("no tests collected")
+        return 5
+    expected = DurationHistory().expected(test_ids)
+    units = len(set(groups.values()))
+    workers = workers or config.PARALLEL_WORKERS or auto_workers(units)
+    shards, loads = shard(expected, min(workers, units), groups)
+    print(f"{len(test_ids)} tests on {len(shards)} workers, longest first "
+          f"(expected {sum(expected.values()):.0f}s of work, {max(loads):.0f}s per worker)")
+
+    os.makedirs(config.ARTIFACT_DIR, exist_ok=True)
+    started = time.perf_counter()
+    with tempfile.TemporaryDirectory(prefix="selenium-lab-shards-") as tmp:
+        procs = []
+        for i, ids in enumerate(shards):
+            shard_path = os.path.join(tmp, f"shard-{i}.txt")
+            with open(shard_path, "w", encoding="utf-8") as f:
+                f.write("\n".join(ids) + "\n")
+            log_path = os.path.join(config.ARTIFACT_DIR, f"worker-{i}.log")
+            log = open(log_path, "w", encoding="utf-8")
+            proc = subprocess.Popen([sys.executable, "-m", "pytest", *pytest_args], env=_worker_env(i, shard_path),
+                                    stdout=log, stderr=subprocess.STDOUT)
+            procs.append((i, proc, log, log_path))
+
+        finished = {}
+        while len(finished) < len(procs):
+            for i, proc, log, log_path in procs:
+                if i not in finished and proc.poll() is not None:
+                    finished[i] = time.perf_counter() - started
+                    log.close()
+            time.sleep(0.2)
+
+    codes = []
+    print(f"{'worker':>6} {'tests':>6} {'expected':>9} {'took':>8}  result")
+    for i, proc, log, log_path in procs:
+        code = proc.returncode
+        codes.append(0 if code == 5 else code)
+        with open(log_path, encoding="utf-8", errors="replace") as f:
+            lines = [line.strip() for line in f if line.strip()]
+        result = lines[-1].strip("= ") if lines else f"exit code {code}"
+        print(f"{i:>6} {len(shards[i]):>6} {loads[i]:8.0f}s {finished[i]:7.0f}s  {result}"
+              + (f"  (log: {log_path})" if code not in (0, 5) else ""))
+    print(f"wall time {time.perf_counter() - started:.1f}s")
+    return max(codes)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0],
+                                     usage="python -m selenium_lab.parallel [-n N] [pytest args ...]")
+    parser.add_argument("-n", "--workers", type=int, default=None,
+                        help="worker processes (default SELENIUM_LAB_PARALLEL_WORKERS, else from cores and memory)")
+    args, pytest_args = parser.parse_known_args(argv)
+    return run(pytest_args, args.workers)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,270 @@
+# pool.py
+"""
+Warm browser pool.
+
+Starting Chrome is the slowest step of almost every test in this repo, so the
+pool launches a few browsers up front, hands them out one test at a time and
+resets them in between instead of quitting them.
+
+A browser is thrown away (and a replacement launched in the background) when:
+ - it has served ``max_uses`` tests, or
+ - the test that used it failed, or
+ - resetting it raised a WebDriver error.
+
+Usage:
+    pool = BrowserPool(launch_chrome, size=2, max_uses=25, implicit_wait=10)
+    pool.start()
+    driver = pool.acquire()
+    ...
+    pool.release(driver, failed=False)
+    pool.close()
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+
+from selenium.common.exceptions import NoAlertPresentException, WebDriverException
+
+# Storage can only be cleared for the origin that is currently loaded, so this
+# runs before the browser is sent back to about:blank.
+CLEAR_STORAGE_SCRIPT = """
+try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+"""
+
+
+@dataclass
+class PoolStats:
+    """Counters the pool keeps so we can see how much startup time it saves."""
+
+    hits: int = 0          # acquire() returned an already running browser
+    misses: int = 0        # acquire() had to wait for a launch
+    launches: int = 0
+    recycled: int = 0      # browsers quit because of max_uses / failure / broken reset
+    launch_seconds: list = field(default_factory=list)
+    reset_seconds: list = field(default_factory=list)
+
+    @property
+    def avg_launch(self):
+        return sum(self.launch_seconds) / len(self.launch_seconds) if self.launch_seconds else 0.0
+
+    @property
+    def avg_reset(self):
+        return sum(self.reset_seconds) / len(self.reset_seconds) if self.reset_seconds else 0.0
+
+    @property
+    def saved_seconds(self):
+        """Estimated startup time saved: every hit avoided a launch but paid a reset."""
+        return max(0.0, self.hits * (self.avg_launch - self.avg_reset))
+
+    def summary_lines(self):
+        return [
+            f"hits={self.hits} misses={self.misses} launches={self.launches} recycled={self.recycled}",
+            f"avg launch={self.avg_launch:.2f}s avg reset={self.avg_reset * 1000:.0f}ms "
+            f"(resets={len(self.reset_seconds)})",
+            f"estimated startup time saved: {self.saved_seconds:.1f}s",
+        ]
+
+
+class BrowserPool:
+    """Thread-safe pool of live WebDriver sessions created by ``factory()``."""
+
+    def __init__(self, factory, size=1, max_uses=25, implicit_wait=None, start_url="about:blank"):
+        if size < 1:
+            raise ValueError("pool size must be at least 1")
+        self.factory = factory
+        self.size = size
+        self.max_uses = max_uses
+        self.implicit_wait = implicit_wait
+        self.start_url = start_url
+        self.stats = PoolStats()
+
+        self._cond = threading.Condition()
+        self._idle = []          # browsers ready to hand out
+        self._uses = {}          # driver -> number of tests served
+        self._rects = {}         # driver -> window rect at launch, restored by reset()
+        self._total = 0          # idle + busy + launching
+        self._closed = False
+        self._launch_error = None
+
+    # -------------------------
+    # lifecycle
+    # -------------------------
+    def start(self):
+        """Pre-launch ``size`` browsers in parallel so the first tests are hits."""
+        with self._cond:
+            missing = self.size - self._total
+            self._total += missing
+        threads = [threading.Thread(target=self._launch_into_idle, daemon=True) for _ in range(missing)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return self
+
+    def close(self):
+        """Quit every idle browser; busy ones are quit when they are released."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+        for driver in idle:
+            self._quit(driver)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # -------------------------
+    # checkout / checkin
+    # -------------------------
+    def acquire(self, timeout=None):
+        """Return a clean browser, launching one if none is idle and the pool has room."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        waited = False
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("browser pool is closed")
+                if self._idle:
+                    driver = self._idle.pop()
+                    if waited:
+                        self.stats.misses += 1
+                    else:
+                        self.stats.hits += 1
+                    self._uses[driver] = self._uses.get(driver, 0) + 1
+                    return driver
+                if self._total < self.size:
+                    self._total += 1
+                    self.stats.misses += 1
+                    break
+                if self._launch_error is not None:
+                    error, self._launch_error = self._launch_error, None
+                    raise error
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(f"no browser available after {timeout}s")
+                waited = True
+                self._cond.wait(remaining)
+
+        # launch outside the lock so other workers are not blocked
+        try:
+            driver = self._launch()
+        except Exception:
+            with self._cond:
+                self._total -= 1
+                self._cond.notify_all()
+            raise
+        with self._cond:
+            self._uses[driver] = 1
+        return driver
+
+    def release(self, driver, failed=False):
+        """Reset ``driver`` and make it available again, or recycle it."""
+        with self._cond:
+            uses = self._uses.get(driver, 0)
+            closed = self._closed
+        recycle = closed or failed or uses >= self.max_uses
+        if not recycle:
+            try:
+                self.reset(driver)
+            except WebDriverException:
+                recycle = True
+
+        if recycle:
+            with self._cond:
+                self._uses.pop(driver, None)
+                self._rects.pop(driver, None)
+                replace = not self._closed
+                if replace:
+                    self.stats.recycled += 1
+                else:
+                    self._total -= 1
+            self._quit(driver)
+            if replace:
+                # keep the slot reserved and warm a replacement in the background
+                threading.Thread(target=self._launch_into_idle, daemon=True).start()
+            return
+
+        with self._cond:
+            self._idle.append(driver)
+            self._cond.notify()
+
+    def reset(self, driver):
+        """Bring a used browser back to a blank state: alerts, windows, frames, window size, cookies, storage."""
+        started = time.perf_counter()
+        try:
+            driver.switch_to.alert.dismiss()
+        except NoAlertPresentException:
+            pass
+
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        driver.switch_to.default_content()
+        rect = self._rects.get(driver)
+        if rect is not None:
+            # a test that resized the window must not hand its viewport to the next one
+            driver.set_window_rect(rect["x"], rect["y"], rect["width"], rect["height"])
+
+        driver.execute_script(CLEAR_STORAGE_SCRIPT)
+        try:
+            # clears cookies for every domain, not only the current one
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        except (AttributeError, WebDriverException):
+            driver.delete_all_cookies()
+
+        driver.get(self.start_url)
+        if self.implicit_wait is not None:
+            driver.implicitly_wait(self.implicit_wait)
+        with self._cond:
+            self.stats.reset_seconds.append(time.perf_counter() - started)
+
+    # -------------------------
+    # internals
+    # -------------------------
+    def _launch(self):
+        started = time.perf_counter()
+        driver = self.factory()
+        if self.implicit_wait is not None:
+            driver.implicitly_wait(self.implicit_wait)
+        try:
+            rect = driver.get_window_rect()
+        except WebDriverException:
+            rect = None
+        with self._cond:
+            self._rects[driver] = rect
+            self.stats.launches += 1
+            self.stats.launch_seconds.append(time.perf_counter() - started)
+        return driver
+
+    def _launch_into_idle(self):
+        """Launch into a slot that the caller already reserved in ``_total``."""
+        try:
+            driver = self._launch()
+        except Exception as e:
+            with self._cond:
+                self._total -= 1
+                self._launch_error = e
+                self._cond.notify_all()
+            return
+        with self._cond:
+            if self._closed:
+                self._total -= 1
+            else:
+                self._uses[driver] = 0
+                self._idle.append(driver)
+                self._cond.notify()
+                return
+        self._quit(driver)
+
+    def _quit(self, driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
@@ -0,0 +1,278 @@
+# pytest_plugin.py
+"""
+pytest hooks shared by every test folder; loaded from the root conftest.py.
+
+Fixtures:
+    track_waits      context manager that records a driver's wait time for the current
+                     test (selenium_lab/wait_budget.py); the driver fixtures use it
+    flight_recorder  context manager that keeps the last snapshots of a driver and
+                     writes them to the artifact store if the test fails
+                     (selenium_lab/flight_recorder.py, SELENIUM_LAB_FLIGHT_RECORDER=1)
+    track_commands   context manager that times every WebDriver command a driver sends
+                     during the test (selenium_lab/command_stats.py)
+    ddt_rows         context manager that gives a driver fixture its browser: one per
+                     test, or one shared by the rows of a ``@pytest.mark.ddt``
+                     parametrized test and reset between them (selenium_lab/ddt.py)
+    auth_state       session-wide AuthCache: ``auth_state.login(driver, user, password, url=...,
+                     login=..., verify=...)`` logs in through the form once per credential
+                     set and restores cookies + storage afterwards (selenium_lab/auth_state.py)
+    data_rows        the rows of one split of the file named by ``@pytest.mark.data(path,
+                     sample=..., where=..., shard=...)``, streamed; the test runs once
+                     per split (selenium_lab/datasource.py)
+
+Every test's duration is added to the history selenium_lab/parallel.py uses to
+shard the suite; when the process is one of its workers (SELENIUM_LAB_SHARD is
+set) only the tests of that shard run, in the order given.
+
+Each phase's report is kept on the item as ``rep_setup`` / ``rep_call`` /
+``rep_teardown`` so fixtures can tell whether the test failed.
+
+At the end of the run the worst tests and lines of code by wasted wait time
+are printed, followed by every fixed time.sleep that ran and what it cost,
+how many find_element calls the page-object element cache saved, and what
+the flight recorder cost per step. The command report lists the slowest
+WebDriver commands and calls (with the test or page-object method that sent
+them) and latency histograms of the slowest tests; SELENIUM_LAB_COMMAND_EXPORT
+writes every command to a .json or .csv file. Each test's numbers are also
+attached to the junit-xml report as the ``waits`` and ``commands`` properties.
+"""
+
+import os
+import re
+import warnings
+from contextlib import contextmanager
+
+import pytest
+
+from selenium_lab import command_stats
+from selenium_lab.auth_state import AuthCache, auth_stats
+from selenium_lab import config as lab_config  # pytest hooks take an argument called config
+from selenium_lab.datasource import DataSource
+from selenium_lab.ddt import ddt_stats, keep_rows_together, row_group, row_groups
+from selenium_lab.flight_recorder import record, recorder_stats
+from selenium_lab.locking import write_json_atomic
+from selenium_lab.page import element_stats
+from selenium_lab.parallel import COLLECT_ENV, SHARD_ENV, DurationHistory, shard_ids
+from selenium_lab.sleep_audit import summarize
+from selenium_lab.wait_budget import instrument, ranking
+
+_WAITS_KEY = pytest.StashKey[list]()
+_COMMANDS_KEY = pytest.StashKey[list]()
+_DURATIONS_KEY = pytest.StashKey[dict]()
+
+
+class WaitBudgetWarning(UserWarning):
+    """A test spent more than SELENIUM_LAB_WAIT_BUDGET seconds in waits that bought nothing."""
+
+
+def pytest_configure(config):
+    config.stash[_WAITS_KEY] = []
+    config.stash[_COMMANDS_KEY] = []
+    config.stash[_DURATIONS_KEY] = {}
+    config.addinivalue_line("markers", "ddt: run the parametrized rows of this test in one browser session")
+    config.addinivalue_line("markers", "data(path, **options): stream data_rows from a CSV / JSONL / Parquet file")
+
+
+def pytest_generate_tests(metafunc):
+    # one test per split of the data file; rows are only read when the test runs
+    marker = metafunc.definition.get_closest_marker("data")
+    if marker is None or "data_rows" not in metafunc.fixturenames:
+        return
+    path = os.path.join(os.path.dirname(str(metafunc.definition.path)), *marker.args)
+    source = DataSource(path, **marker.kwargs)
+    splits = source.splits()
+    metafunc.parametrize("data_rows", [(source, split) for split in splits],
+                         ids=[str(split) for split in splits], indirect=True)
+
+
+def pytest_collection_modifyitems(config, items):
+    # a parallel worker runs only its shard, longest test first; ddt rows stay together
+    ids = shard_ids()
+    if ids is not None:
+        order = {test_id: i for i, test_id in enumerate(ids)}
+        config.hook.pytest_deselected(items=[item for item in items if item.nodeid not in order])
+        items[:] = sorted((item for item in items if item.nodeid in order), key=lambda item: order[item.nodeid])
+    if lab_config.DDT:
+        keep_rows_together(items)
+
+
+def pytest_collection_finish(session):
+    # parallel.py collecting: hand it the final ids with their ddt row group, so a group is sharded whole
+    path = os.environ.get(COLLECT_ENV)
+    if path:
+        write_json_atomic(path, [[item.nodeid, row_group(item) or item.nodeid] for item in session.items])
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_teardown(item, nextitem):
+    yield
+    # the shared browser of a ddt row group goes once its last row is done
+    key = row_group(item)
+    if key is not None and key != row_group(nextitem):
+        row_groups.close(key)
+
+
+def pytest_sessionfinish(session):
+    row_groups.close_all()
+    DurationHistory().save(session.config.stash[_DURATIONS_KEY])
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    # keep each phase's report on the item so fixtures can see if the test failed,
+    # and add up its duration for the history parallel.py shards by
+    outcome = yield
+    rep = outcome.get_result()
+    setattr(item, "rep_" + rep.when, rep)
+    # plain unit-test runs stay out of the history: only browser tests, or every test of a parallel worker
+    if "driver" in item.fixturenames or os.environ.get(SHARD_ENV):
+        durations = item.config.stash[_DURATIONS_KEY]
+        durations[item.nodeid] = durations.get(item.nodeid, 0.0) + rep.duration
+
+
+@pytest.fixture
+def track_waits(request):
+    """Usage in a driver fixture: ``with track_waits(driver, implicit_wait=10): yield driver``."""
+
+    @contextmanager
+    def track(driver, implicit_wait=None):
+        with instrument(
+            driver,
+            implicit_wait=implicit_wait,
+            zero_implicit=lab_config.ZERO_IMPLICIT_IN_EXPLICIT,
+            test=request.node.nodeid,
+        ) as record:
+            yield record
+        request.config.stash[_WAITS_KEY].append(record)
+        request.node.user_properties.append(("waits", record.as_dict()))
+        if lab_config.WAIT_BUDGET and record.wasted > lab_config.WAIT_BUDGET:
+            warnings.warn(WaitBudgetWarning(
+                f"{record.wasted:.1f}s of wasted wait time (budget {lab_config.WAIT_BUDGET:g}s): {record.summary()}"
+            ))
+
+    return track
+
+
+@pytest.fixture
+def flight_recorder(request):
+    """Usage in a driver fixture: ``with flight_recorder(driver): yield driver``; off unless enabled."""
+
+    @contextmanager
+    def recording(driver):
+        if not lab_config.FLIGHT_RECORDER:
+            yield None
+            return
+        with record(driver) as recorder:
+            yield recorder
+        rep = getattr(request.node, "rep_call", None)
+        if rep is not None and rep.failed:
+            names = recorder.dump(re.sub(r"[^\w.-]+", "_", request.node.nodeid))
+            request.node.user_properties.append(("flight_recorder", names))
+
+    return recording
+
+
+@pytest.fixture
+def track_commands(request):
+    """Usage in a driver fixture: ``with track_commands(driver): yield driver``."""
+
+    @contextmanager
+    def track(driver):
+        if not lab_config.COMMAND_STATS:
+            yield None
+            return
+        with command_stats.instrument(driver, test=request.node.nodeid) as log:
+            yield log
+        request.config.stash[_COMMANDS_KEY].append(log)
+        request.node.user_properties.append(("commands", log.as_dict()))
+
+    return track
+
+
+@pytest.fixture
+def ddt_rows(request):
+    """Usage in a driver fixture: ``with ddt_rows(launch) as driver: yield driver``.
+
+    ``launch()`` starts a browser. Tests not marked ``ddt`` (or with SELENIUM_LAB_DDT=0) get
+    their own browser, quit afterwards; the rows of a ddt test share one until a row fails.
+    """
+
+    @contextmanager
+    def rows(launch, start_url="about:blank", implicit_wait=None):
+        key = row_group(request.node) if lab_config.DDT else None
+        if key is None:
+            driver = launch()
+            try:
+                yield driver
+            finally:
+                driver.quit()
+            return
+        pool = row_groups.pool(key, launch, start_url=start_url, implicit_wait=implicit_wait)
+        driver = pool.acquire()
+        try:
+            yield driver
+        finally:
+            rep = getattr(request.node, "rep_call", None)
+            pool.release(driver, failed=rep is None or rep.failed)
+
+    return rows
+
+
+@pytest.fixture(scope="session")
+def auth_state():
+    return AuthCache()
+
+
+@pytest.fixture
+def data_rows(request):
+    """Iterator over this test's split of the ``@pytest.mark.data`` file."""
+    if not hasattr(request, "param"):
+        pytest.fail("data_rows needs @pytest.mark.data(path) on the test")
+    source, split = request.param
+    return source.rows(split)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if auth_stats.logins or auth_stats.restored:
+        terminalreporter.write_sep("-", "login state")
+        for line in auth_stats.summary_lines():
+            terminalreporter.write_line(line)
+
+    if ddt_stats.rows:
+        terminalreporter.write_sep("-", "ddt sessions")
+        for line in ddt_stats.summary_lines():
+            terminalreporter.write_line(line)
+
+    logs = config.stash.get(_COMMANDS_KEY, [])
+    if logs:
+        terminalreporter.write_sep("-", "webdriver commands")
+        for line in command_stats.slowest(logs, top=lab_config.COMMAND_REPORT_TOP):
+            terminalreporter.write_line(line)
+        for log in sorted(logs, key=lambda log: -log.total)[:lab_config.COMMAND_HISTOGRAMS]:
+            for line in log.histogram_lines():
+                terminalreporter.write_line(line)
+        if lab_config.COMMAND_EXPORT:
+            path = command_stats.export(logs, lab_config.COMMAND_EXPORT)
+            terminalreporter.write_line(f"every command written to {path}")
+
+    if recorder_stats.snapshots:
+        terminalreporter.write_sep("-", "flight recorder")
+        for line in recorder_stats.summary_lines():
+            terminalreporter.write_line(line)
+
+    if element_stats.finds:
+        terminalreporter.write_sep("-", "page-object elements")
+        for line in element_stats.summary_lines():
+            terminalreporter.write_line(line)
+
+    records = config.stash.get(_WAITS_KEY, [])
+    if not records:
+        return
+    terminalreporter.write_sep("-", "wait budget")
+    for line in ranking(records, top=lab_config.WAIT_REPORT_TOP):
+        terminalreporter.write_line(line)
+    sleeps = [event for record in records for event in record.sleeps]
+    if sleeps:
+        terminalreporter.write_sep("-", "fixed sleeps")
+        for line in summarize(sleeps):
+            terminalreporter.write_line(line)
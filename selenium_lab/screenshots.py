@@ -0,0 +1,240 @@
+# screenshots.py
+"""
+Screenshots of many elements from one capture, and of whole pages without
+scrolling by hand.
+
+``element.screenshot()`` makes the browser scroll, capture and PNG-encode
+once per element. ``element_screenshots`` asks for every element's rect in
+one script call, takes one capture that covers all of them (Chrome: a
+DevTools ``Page.captureScreenshot`` clipped to their bounding box with
+``captureBeyondViewport``, so nothing has to scroll; other browsers: the
+viewport), decodes it once into a NumPy array and crops and PNG-encodes each
+element in a thread pool. Crops use the same rect x devicePixelRatio region
+the browser uses for element screenshots.
+
+Elements far apart on a long page are split over several captures, so none
+goes beyond Chrome's capture size limit (MAX_CAPTURE_SIDE device px per side,
+MAX_CAPTURE_PIXELS in all). Elements the captures do not cover (outside the
+viewport on non-Chrome browsers, larger than the limit, or in a capture that
+failed) and every element when Pillow is not installed fall back to
+``element.screenshot_as_png``.
+
+    pngs = element_screenshots(driver, [(By.CSS_SELECTOR, "div.example h3"), username_el])
+    paths = element_screenshots(driver, targets, paths=["h3.png", "user.png"])
+
+``full_page_screenshot`` captures the whole document: on Chrome one DevTools
+``Page.captureScreenshot`` sized from ``Page.getLayoutMetrics`` with
+``captureBeyondViewport``; on Firefox its own full-page command; otherwise
+(or when the single capture fails, e.g. pages beyond Chrome's texture limit)
+by scrolling one viewport at a time and writing each tile into a disk-backed
+array, waiting two animation frames per scroll instead of sleeping. Fixed
+and sticky elements show up in every tile of the stitched version.
+
+    full_page_screenshot(driver, "large.png")
+"""
+
+import base64
+import io
+import math
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from selenium.common.exceptions import WebDriverException
+
+from selenium_lab._js import with_helpers
+
+try:
+    from PIL import Image
+except ImportError:  # optional, every element is captured by the browser instead
+    Image = None
+
+MAX_CAPTURE_SIDE = 16384          # device px; Chrome fails captures beyond its texture size
+MAX_CAPTURE_PIXELS = 64_000_000   # device px per capture, stays under Pillow's decompression-bomb check
+
+RECTS_SCRIPT = with_helpers(r"""
+var targets = arguments[0];
+var rects = targets.map(function (t) {
+  var el = Array.isArray(t) ? labFind(t[0], t[1]) : t;
+  if (!el) { return null; }
+  var r = el.getBoundingClientRect();
+  return {x: r.left + window.scrollX, y: r.top + window.scrollY, width: r.width, height: r.height};
+});
+return {rects: rects, dpr: window.devicePixelRatio || 1, scrollX: window.scrollX, scrollY: window.scrollY,
+        width: window.innerWidth, height: window.innerHeight};
+""")
+
+
+# scroll to arguments[0] (CSS px) and answer once the new position has been painted
+SCROLL_SCRIPT = r"""
+var y = arguments[0], done = arguments[arguments.length - 1];
+window.scrollTo(0, y);
+requestAnimationFrame(function () { requestAnimationFrame(function () { done(window.scrollY); }); });
+"""
+
+PAGE_SIZE_SCRIPT = r"""
+var d = document.documentElement, b = document.body || d;
+return {width: Math.max(d.scrollWidth, b.scrollWidth), height: Math.max(d.scrollHeight, b.scrollHeight),
+        viewportWidth: d.clientWidth, viewportHeight: window.innerHeight, dpr: window.devicePixelRatio || 1,
+        scrollY: window.scrollY};
+"""
+
+
+def _encode(pixels):
+    out = io.BytesIO()
+    Image.fromarray(pixels).save(out, "PNG")
+    return out.getvalue()
+
+
+def _capture(driver, rects, page):
+    """One capture covering ``rects``; returns (png, origin_x, origin_y) in CSS pixels of the document."""
+    if hasattr(driver, "execute_cdp_cmd"):
+        left = min(r["x"] for r in rects)
+        top = min(r["y"] for r in rects)
+        right = max(r["x"] + r["width"] for r in rects)
+        bottom = max(r["y"] + r["height"] for r in rects)
+        clip = {"x": left, "y": top, "width": right - left, "height": bottom - top, "scale": 1}
+        shot = driver.execute_cdp_cmd("Page.captureScreenshot",
+                                      {"format": "png", "clip": clip, "captureBeyondViewport": True})
+        return base64.b64decode(shot["data"]), left, top
+    return driver.get_screenshot_as_png(), page["scrollX"], page["scrollY"]
+
+
+def _groups(rects, indices, dpr):
+    """Split ``indices`` top to bottom into groups whose bounding box fits in one capture.
+
+    Elements that do not fit a capture on their own are left out.
+    """
+    groups = []
+    bounds = None
+    for i in sorted(indices, key=lambda i: rects[i]["y"]):
+        r = rects[i]
+        box = (r["x"], r["y"], r["x"] + r["width"], r["y"] + r["height"])
+        if not _fits(box, dpr):
+            continue
+        if bounds is not None:
+            union = (min(bounds[0], box[0]), min(bounds[1], box[1]), max(bounds[2], box[2]), max(bounds[3], box[3]))
+            if _fits(union, dpr):
+                groups[-1].append(i)
+                bounds = union
+                continue
+        groups.append([i])
+        bounds = box
+    return groups
+
+
+def _fits(box, dpr):
+    width, height = (box[2] - box[0]) * dpr, (box[3] - box[1]) * dpr
+    return width <= MAX_CAPTURE_SIDE and height <= MAX_CAPTURE_SIDE and width * height <= MAX_CAPTURE_PIXELS
+
+
+def _box(rect, origin_x, origin_y, dpr):
+    x0 = int(math.floor((rect["x"] - origin_x) * dpr))
+    y0 = int(math.floor((rect["y"] - origin_y) * dpr))
+    x1 = int(math.ceil((rect["x"] - origin_x + rect["width"]) * dpr))
+    y1 = int(math.ceil((rect["y"] - origin_y + rect["height"]) * dpr))
+    return x0, y0, x1, y1
+
+
+def element_screenshots(driver, targets, paths=None, workers=None):
+    """PNG bytes of every target (WebElement or (By, value)); None for targets not found or empty.
+
+    With ``paths`` (one per target) the PNGs are written there and the paths returned instead.
+    """
+    targets = list(targets)
+    page = driver.execute_script(RECTS_SCRIPT, [list(t) if isinstance(t, tuple) else t for t in targets])
+    rects = page["rects"]
+    visible = [i for i, r in enumerate(rects) if r and r["width"] > 0 and r["height"] > 0]
+    results = [None] * len(targets)
+    crops = {}
+
+    if visible and Image is not None:
+        groups = _groups(rects, visible, page["dpr"]) if hasattr(driver, "execute_cdp_cmd") else [visible]
+        for group in groups:
+            try:
+                png, origin_x, origin_y = _capture(driver, [rects[i] for i in group], page)
+                pixels = np.asarray(Image.open(io.BytesIO(png)))
+            except (WebDriverException, OSError, Image.DecompressionBombError):
+                continue    # these elements are captured one by one below
+            height, width = pixels.shape[:2]
+            for i in group:
+                x0, y0, x1, y1 = _box(rects[i], origin_x, origin_y, page["dpr"])
+                if x0 >= 0 and y0 >= 0 and x1 <= width and y1 <= height:
+                    crops[i] = pixels[y0:y1, x0:x1]    # a view, nothing is copied yet
+        with ThreadPoolExecutor(max_workers=workers or min(8, os.cpu_count() or 1)) as pool:
+            for i, encoded in zip(crops, pool.map(_encode, crops.values())):
+                results[i] = encoded
+
+    for i in visible:
+        if results[i] is None:
+            target = targets[i]
+            element = driver.find_element(*target) if isinstance(target, tuple) else target
+            results[i] = element.screenshot_as_png
+
+    if paths is None:
+        return results
+    return [None if png is None else _write(png, path) for png, path in zip(results, paths)]
+
+
+def _write(png, path):
+    if path is None:
+        return png
+    with open(path, "wb") as f:
+        f.write(png)
+    return path
+
+
+def full_page_screenshot(driver, path=None, tiled=False):
+    """PNG of the whole page (bytes, or ``path`` after writing it there).
+
+    tiled=True skips the single-capture methods and always stitches viewport tiles.
+    """
+    if not tiled:
+        try:
+            if hasattr(driver, "execute_cdp_cmd"):
+                metrics = driver.execute_cdp_cmd("Page.getLayoutMetrics", {})
+                content = metrics.get("cssContentSize") or metrics["contentSize"]
+                clip = {"x": 0, "y": 0, "width": content["width"], "height": content["height"], "scale": 1}
+                shot = driver.execute_cdp_cmd("Page.captureScreenshot",
+                                              {"format": "png", "clip": clip, "captureBeyondViewport": True})
+                return _write(base64.b64decode(shot["data"]), path)
+            if hasattr(driver, "get_full_page_screenshot_as_png"):
+                return _write(driver.get_full_page_screenshot_as_png(), path)
+        except WebDriverException:
+            pass  # too large for one capture, or no DevTools: stitch it
+    return _stitch(driver, path)
+
+
+def _stitch(driver, path):
+    if Image is None:
+        raise RuntimeError("stitched full-page screenshots need Pillow")
+    page = driver.execute_script(PAGE_SIZE_SCRIPT)
+    dpr, step = page["dpr"], page["viewportHeight"]
+    folder = os.path.dirname(os.path.abspath(path)) if path else None
+    with tempfile.TemporaryDirectory(dir=folder, prefix=".tiles-") as tmp:
+        canvas = None
+        y = 0
+        try:
+            while True:
+                scrolled = driver.execute_async_script(SCROLL_SCRIPT, y)
+                tile = np.asarray(Image.open(io.BytesIO(driver.get_screenshot_as_png())).convert("RGB"))
+                if canvas is None:
+                    # tiles go straight to a disk-backed array, never all in memory at once
+                    width = min(tile.shape[1], int(round(page["viewportWidth"] * dpr)))
+                    height = int(round(page["height"] * dpr))
+                    canvas = np.lib.format.open_memmap(os.path.join(tmp, "page.npy"), mode="w+",
+                                                       dtype=np.uint8, shape=(height, width, 3))
+                top = int(round(scrolled * dpr))
+                rows = min(tile.shape[0], canvas.shape[0] - top)
+                canvas[top:top + rows] = tile[:rows, :canvas.shape[1]]
+                canvas.flush()
+                if scrolled + step >= page["height"] or scrolled < y:
+                    break   # last tile (the browser clamps the final scroll)
+                y = scrolled + step
+        finally:
+            driver.execute_async_script(SCROLL_SCRIPT, page["scrollY"])
+        out = io.BytesIO() if path is None else path
+        Image.fromarray(canvas).save(out, "PNG")
+        del canvas  # close the memmap before the folder goes away
+    return out.getvalue() if path is None else path
@@ -0,0 +1,125 @@
+# settle.py
+"""
+Wait for the page to go quiet instead of sleeping a fixed time.
+
+``time.sleep(1)`` between steps is either too long (most of the time) or too
+short (on a slow CI box). ``settle(driver)`` returns as soon as the page is
+quiescent:
+
+ - document.readyState is "complete"
+ - no fetch / XMLHttpRequest is in flight
+ - no finite CSS animation or transition is running (spinners that loop
+   forever are ignored, they would never finish)
+ - the DOM has not changed for ``quiet_ms``
+
+It is one execute_async_script per call. The first call on a new document
+installs the fetch/XHR counters, so requests started before that are not seen
+and the first call always waits one full ``quiet_ms``.
+
+Usage:
+    button.click()
+    settle(driver)                  # instead of time.sleep(1)
+    result = settle(driver, quiet_ms=100, timeout=5)
+    if not result:
+        print("still busy:", result.reason)
+
+    linger()                        # instead of time.sleep(2) before driver.quit()
+"""
+
+import time
+from dataclasses import dataclass
+
+from selenium.common.exceptions import TimeoutException, UnexpectedAlertPresentException, WebDriverException
+
+from selenium_lab import config
+
+SETTLE_SCRIPT = r"""
+var quietMs = arguments[0], timeoutMs = arguments[1], done = arguments[arguments.length - 1];
+var s = window.__labSettle;
+if (!s) {
+  s = window.__labSettle = {pending: 0, lastChange: performance.now()};
+  var touch = function () { s.lastChange = performance.now(); };
+  var finished = function () { s.pending--; touch(); };
+  if (window.fetch) {
+    var originalFetch = window.fetch;
+    window.fetch = function () {
+      s.pending++; touch();
+      try {
+        return originalFetch.apply(this, arguments).finally(finished);
+      } catch (e) { finished(); throw e; }
+    };
+  }
+  var originalSend = XMLHttpRequest.prototype.send;
+  XMLHttpRequest.prototype.send = function () {
+    s.pending++; touch();
+    this.addEventListener("loadend", finished, {once: true});
+    try {
+      return originalSend.apply(this, arguments);
+    } catch (e) { this.removeEventListener("loadend", finished); finished(); throw e; }
+  };
+  new MutationObserver(touch).observe(document.documentElement,
+    {subtree: true, childList: true, attributes: true, characterData: true});
+}
+
+function animating() {
+  if (!document.getAnimations) { return false; }
+  return document.getAnimations().some(function (a) {
+    return a.playState === "running" && a.effect && isFinite(a.effect.getComputedTiming().endTime);
+  });
+}
+function busy() {
+  if (document.readyState !== "complete") { return "loading"; }
+  if (s.pending > 0) { return "network"; }
+  if (animating()) { return "animation"; }
+  if (performance.now() - s.lastChange < quietMs) { return "dom"; }
+  return null;
+}
+
+var start = performance.now();
+(function tick() {
+  var reason = busy(), waited = performance.now() - start;
+  if (!reason) { done({settled: true, waited: waited, reason: null}); return; }
+  if (waited >= timeoutMs) { done({settled: false, waited: waited, reason: reason}); return; }
+  setTimeout(tick, 25);
+})();
+"""
+
+
+@dataclass
+class SettleResult:
+    """settled is False when ``timeout`` ran out; reason says what was still busy."""
+
+    settled: bool
+    waited: float            # seconds
+    reason: str = None       # "loading" | "network" | "animation" | "dom" | "alert" | None
+
+    def __bool__(self):
+        return self.settled
+
+
+def settle(driver, quiet_ms=None, timeout=None):
+    """Block until the page is quiet (see module docstring); never raises on a busy page."""
+    quiet_ms = config.SETTLE_QUIET_MS if quiet_ms is None else quiet_ms
+    timeout = config.SETTLE_TIMEOUT if timeout is None else timeout
+    started = time.monotonic()
+    while True:
+        remaining = timeout - (time.monotonic() - started)
+        try:
+            result = driver.execute_async_script(SETTLE_SCRIPT, quiet_ms, int(max(remaining, 0) * 1000))
+            return SettleResult(result["settled"], time.monotonic() - started, result["reason"])
+        except UnexpectedAlertPresentException:
+            # the page is blocked on a dialog; nothing else will happen until it is handled
+            return SettleResult(True, time.monotonic() - started, "alert")
+        except TimeoutException:
+            return SettleResult(False, time.monotonic() - started, "script timeout")
+        except WebDriverException as exc:
+            # a navigation unloaded the document mid-wait: settle the new one
+            if "unload" not in str(exc) or remaining <= 0:
+                raise
+
+
+def linger(seconds=None):
+    """Keep the browser open for someone watching; no-op unless SELENIUM_LAB_LINGER is set."""
+    seconds = config.LINGER if seconds is None else seconds
+    if seconds > 0:
+        time.sleep(seconds)
@@ -0,0 +1,130 @@
+# sleep_audit.py
+"""
+Find the fixed ``time.sleep`` calls that are left and what they cost.
+
+Static: list every time.sleep(...) / sleep(...) call in the given files or
+folders with the seconds it asks for (when it is a literal).
+
+    python -m selenium_lab.sleep_audit Exercsies Advance_exercises tests
+
+Runtime: run a script with time.sleep timed and print each call site, how
+often it ran and how long it slept in total.
+
+    python -m selenium_lab.sleep_audit --run Advance_exercises/Mouse_Actions_ae4.py
+
+Under pytest the same numbers come from the wait budget records and are
+printed in the "fixed sleeps" section at the end of the run.
+"""
+
+import argparse
+import ast
+import os
+import runpy
+import sys
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+from selenium_lab.wait_budget import _call_site
+
+_SKIP_DIRS = {".git", "__pycache__", ".pytest_cache", "venv", ".venv", "node_modules"}
+
+
+def _python_files(paths):
+    for path in paths:
+        if os.path.isfile(path):
+            yield path
+            continue
+        for folder, dirs, files in os.walk(path):
+            dirs[:] = sorted(d for d in dirs if d not in _SKIP_DIRS)
+            for name in sorted(files):
+                if name.endswith(".py"):
+                    yield os.path.join(folder, name)
+
+
+def _is_sleep(call):
+    func = call.func
+    if isinstance(func, ast.Attribute):
+        return func.attr == "sleep" and isinstance(func.value, ast.Name) and func.value.id == "time"
+    return isinstance(func, ast.Name) and func.id == "sleep"
+
+
+def find_sleeps(paths):
+    """[(file, line, seconds or None)] for every sleep call in ``paths``."""
+    found = []
+    for path in _python_files(paths):
+        try:
+            with open(path, encoding="utf-8") as f:
+                tree = ast.parse(f.read(), filename=path)
+        except (SyntaxError, UnicodeDecodeError):
+            continue
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Call) and _is_sleep(node) and node.args:
+                arg = node.args[0]
+                seconds = arg.value if isinstance(arg, ast.Constant) and isinstance(arg.value, (int, float)) else None
+                found.append((path, node.lineno, seconds))
+    return sorted(found)
+
+
+def summarize(events):
+    """Report lines for (where, what, seconds) sleep events, most expensive call site first."""
+    by_site = defaultdict(lambda: [0, 0.0])
+    for where, _, seconds in events:
+        by_site[where][0] += 1
+        by_site[where][1] += seconds
+    if not by_site:
+        return ["no fixed sleeps ran"]
+    lines = [f"{seconds:7.2f}s  {count:>4}x  {where}" for where, (count, seconds) in
+             sorted(by_site.items(), key=lambda item: item[1][1], reverse=True)]
+    total = sum(seconds for _, seconds in by_site.values())
+    lines.append(f"{total:7.2f}s  total in {sum(c for c, _ in by_site.values())} sleeps at {len(by_site)} call sites")
+    return lines
+
+
+@contextmanager
+def audit_sleeps():
+    """Time every time.sleep in the block; yields the list of (where, what, seconds) events."""
+    events = []
+    original = time.sleep
+
+    def sleep(seconds):
+        started = time.perf_counter()
+        try:
+            return original(seconds)
+        finally:
+            events.append((_call_site(), f"sleep({seconds})", time.perf_counter() - started))
+
+    time.sleep = sleep
+    try:
+        yield events
+    finally:
+        time.sleep = original
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("paths", nargs="*", default=["."], help="files or folders to scan")
+    parser.add_argument("--run", metavar="SCRIPT", help="run SCRIPT and time its sleeps instead of scanning")
+    args, script_args = parser.parse_known_args(argv)
+
+    if args.run:
+        sys.argv = [args.run] + script_args
+        with audit_sleeps() as events:
+            try:
+                runpy.run_path(args.run, run_name="__main__")
+            finally:
+                print("\n--- fixed sleeps ---")
+                for line in summarize(events):
+                    print(line)
+        return 0
+
+    found = find_sleeps(args.paths)
+    for path, line, seconds in found:
+        print(f"{path}:{line}  sleep({'?' if seconds is None else seconds})")
+    known = sum(s for _, _, s in found if s is not None)
+    print(f"{len(found)} sleep calls, {known:g}s per pass through all of them")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,166 @@
+# tables.py
+"""
+Read a whole HTML <table> in one WebDriver round trip.
+
+The old way (find rows, then ``row.find_elements("td")``, then ``.text`` per
+cell) costs about 1 + rows * (cells + 1) HTTP commands. Here one injected
+script walks the table and returns the data column by column; very large
+tables are read in row chunks so a single response never gets huge.
+
+Usage:
+    table = extract_table(driver, (By.ID, "table1"))
+    table.headers                 # ['Last Name', 'First Name', ...]
+    table.columns["Email"]        # ['jsmith@gmail.com', ...]
+    for row in table.rows(): ...
+
+    for chunk in iter_table_chunks(driver, (By.ID, "grid"), chunk_size=5000):
+        ...
+"""
+
+from dataclasses import dataclass, field
+
+from selenium.webdriver.remote.webelement import WebElement
+
+from selenium_lab._js import with_helpers
+
+TABLE_CHUNK_SCRIPT = with_helpers(r"""
+var target = arguments[0], start = arguments[1], count = arguments[2];
+var attrs = arguments[3] || [], useInnerText = arguments[4];
+var table = (target && target.nodeType === 1) ? target : labFind(target[0], target[1]);
+if (!table) { return null; }
+
+function textOf(cell) {
+  var t = useInnerText ? cell.innerText : cell.textContent;
+  return (t || "").replace(/\s+/g, " ").trim();
+}
+
+var headerRow = table.tHead && table.tHead.rows.length ? table.tHead.rows[0] : null;
+var bodyRows = [];
+if (table.tBodies.length) {
+  for (var b = 0; b < table.tBodies.length; b++) {
+    Array.prototype.push.apply(bodyRows, table.tBodies[b].rows);
+  }
+} else {
+  bodyRows = Array.prototype.slice.call(table.rows);
+}
+if (!headerRow && bodyRows.length && bodyRows[0].querySelector("th") && !bodyRows[0].querySelector("td")) {
+  headerRow = bodyRows.shift();
+}
+
+var headers = headerRow ? Array.prototype.map.call(headerRow.cells, textOf) : [];
+var end = count === null ? bodyRows.length : Math.min(bodyRows.length, start + count);
+// width over the whole table so every chunk has the same columns
+var width = headers.length;
+for (var r = 0; r < bodyRows.length; r++) { width = Math.max(width, bodyRows[r].cells.length); }
+
+var columns = [], attrColumns = {}, widths = [];
+for (var c = 0; c < width; c++) { columns.push([]); }
+attrs.forEach(function (a) { attrColumns[a] = columns.map(function () { return []; }); });
+
+for (var r = start; r < end; r++) {
+  var cells = bodyRows[r].cells;
+  widths.push(cells.length);
+  for (var c = 0; c < width; c++) {
+    var cell = cells[c];
+    columns[c].push(cell ? textOf(cell) : "");
+    for (var i = 0; i < attrs.length; i++) {
+      attrColumns[attrs[i]][c].push(cell ? cell.getAttribute(attrs[i]) : null);
+    }
+  }
+}
+return {headers: headers, columns: columns, attrs: attrColumns, widths: widths, total: bodyRows.length};
+""")
+
+
+@dataclass
+class TableData:
+    """Column-oriented table contents.
+
+    columns:    header -> list of cell texts (same order as the rows)
+    attributes: attribute name -> header -> list of attribute values (None if missing)
+    widths:     number of cells actually present in each row (short rows are padded with "")
+    total_rows: body rows in the whole table, not just this chunk
+    """
+
+    headers: list
+    columns: dict = field(default_factory=dict)
+    attributes: dict = field(default_factory=dict)
+    widths: list = field(default_factory=list)
+    total_rows: int = 0
+
+    def __len__(self):
+        return len(self.widths)
+
+    def column(self, index_or_name):
+        if isinstance(index_or_name, int):
+            return self.columns[self.headers[index_or_name]]
+        return self.columns[index_or_name]
+
+    def rows(self):
+        """Yield each row as a tuple, in header order."""
+        return zip(*(self.columns[h] for h in self.headers))
+
+    def extend(self, other):
+        for h in self.headers:
+            self.columns[h].extend(other.columns[h])
+        for name, cols in other.attributes.items():
+            for h in self.headers:
+                self.attributes[name][h].extend(cols[h])
+        self.widths.extend(other.widths)
+
+
+def _column_names(headers, width):
+    """Unique names for every column; blank or repeated headers get a position suffix."""
+    names, seen = [], set()
+    for i in range(width):
+        name = headers[i] if i < len(headers) and headers[i] else f"column_{i}"
+        if name in seen:
+            name = f"{name}_{i}"
+        seen.add(name)
+        names.append(name)
+    return names
+
+
+def _fetch(driver, table, start, count, attributes, inner_text):
+    target = table if isinstance(table, WebElement) else list(table)
+    raw = driver.execute_script(TABLE_CHUNK_SCRIPT, target, start, count, list(attributes), inner_text)
+    if raw is None:
+        raise LookupError(f"table not found: {table}")
+    names = _column_names(raw["headers"], len(raw["columns"]))
+    return TableData(
+        headers=names,
+        columns=dict(zip(names, raw["columns"])),
+        attributes={a: dict(zip(names, cols)) for a, cols in raw["attrs"].items()},
+        widths=raw["widths"],
+        total_rows=raw["total"],
+    )
+
+
+def iter_table_chunks(driver, table, chunk_size=5000, attributes=(), inner_text=True):
+    """Yield TableData for ``chunk_size`` body rows at a time (one execute_script per chunk).
+
+    table: a (By.X, value) locator or a WebElement.
+    inner_text: True matches WebElement.text (rendered text); False uses textContent,
+                which is faster on huge tables because it skips layout.
+    """
+    start = 0
+    while True:
+        chunk = _fetch(driver, table, start, chunk_size, attributes, inner_text)
+        if len(chunk) or start == 0:
+            yield chunk
+        start += chunk_size
+        if start >= chunk.total_rows:
+            return
+
+
+def extract_table(driver, table, attributes=(), chunk_size=None, inner_text=True):
+    """Read the whole table; with ``chunk_size`` it is fetched in several calls and merged."""
+    if chunk_size is None:
+        return _fetch(driver, table, 0, None, attributes, inner_text)
+    result = None
+    for chunk in iter_table_chunks(driver, table, chunk_size, attributes, inner_text):
+        if result is None:
+            result = chunk
+        else:
+            result.extend(chunk)
+    return result
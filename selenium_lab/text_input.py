@@ -0,0 +1,204 @@
+# text_input.py
+"""
+Type text into a field with whichever input strategy works on that site.
+
+Some inputs ignore plain send_keys (overlays, custom widgets, iframes that
+steal focus), so Keyboard_Actions_ae5 used to walk a fixed ladder on every run:
+
+    standard  clear() + send_keys()
+    click     click(), settle, send_keys()
+    actions   ActionChains move / click / send_keys
+    js        set .value from JavaScript and fire "input"
+
+each rung followed by a sleep and a value check. ``type_text`` keeps success
+counts and latency per (host, locator) in a small JSON store
+(SELENIUM_LAB_CACHE_DIR/input_strategies.json), starts with the strategy that
+has worked fastest there before, and checks the result with one
+execute_async_script that waits for the field's input/change events (or a
+DOM change) instead of sleeping. The field is cleared before every rung and
+only counts as typed when it shows exactly the text, so a late first rung can
+neither double the text nor hand its success to the next one.
+
+Usage:
+    result = type_text(driver, (By.ID, "target"), "Hello")
+    print(result.strategy, result.attempts)
+"""
+
+import os
+import time
+from collections import namedtuple
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.action_chains import ActionChains
+
+from selenium_lab import config
+from selenium_lab.locking import locked, read_json, write_json_atomic
+from selenium_lab.settle import settle
+
+
+# -------------------------
+# strategies (the rungs of the old ladder)
+# -------------------------
+def try_send_keys_standard(el, text, driver):
+    try:
+        el.clear()
+    except Exception:
+        pass
+    el.send_keys(text)
+
+
+def try_send_keys_with_click(el, text, driver):
+    el.click()
+    settle(driver, quiet_ms=100)
+    el.send_keys(text)
+
+
+def try_actionchains(el, text, driver):
+    actions = ActionChains(driver)
+    actions.move_to_element(el).click().send_keys(text).perform()
+
+
+def try_js_set_value(el, text, driver):
+    script = "arguments[0].value = arguments[1]; arguments[0].dispatchEvent(new Event('input', {bubbles: true}));"
+    driver.execute_script(script, el, text)
+
+
+# ladder order, used for strategies a (host, locator) has no history for
+STRATEGIES = {
+    "standard": try_send_keys_standard,
+    "click": try_send_keys_with_click,
+    "actions": try_actionchains,
+    "js": try_js_set_value,
+}
+
+# run before every rung, so a rung never appends to (or gets credit for) an earlier rung's typing;
+# returns what the field shows afterwards
+CLEAR_SCRIPT = r"""
+var el = arguments[0];
+if (typeof el.value === "string") { el.value = ""; } else if (el.isContentEditable) { el.textContent = ""; }
+el.dispatchEvent(new Event("input", {bubbles: true}));
+return typeof el.value === "string" ? el.value : (el.innerText || el.textContent || "").trim();
+"""
+
+# resolves true as soon as the field shows exactly the text (value, or text for non-inputs);
+# false at once if it already did before the rung ran, since then the rung cannot be told apart
+VERIFY_SCRIPT = r"""
+var el = arguments[0], text = arguments[1], before = arguments[2], timeoutMs = arguments[3];
+var done = arguments[arguments.length - 1];
+function shown() {
+  var value = typeof el.value === "string" ? el.value : (el.innerText || el.textContent || "").trim();
+  return value === text;
+}
+if (before === text) { done(false); return; }
+if (shown()) { done(true); return; }
+var types = ["input", "change", "keyup"], finished = false, observer = null, timer = null;
+function finish(result) {
+  if (finished) { return; }
+  finished = true;
+  types.forEach(function (t) { el.removeEventListener(t, check); });
+  if (observer) { observer.disconnect(); }
+  clearTimeout(timer);
+  done(result);
+}
+function check() { if (shown()) { finish(true); } }
+types.forEach(function (t) { el.addEventListener(t, check); });
+observer = new MutationObserver(check);
+observer.observe(el, {subtree: true, childList: true, characterData: true, attributes: true});
+timer = setTimeout(function () { finish(shown()); }, timeoutMs);
+"""
+
+TypeResult = namedtuple("TypeResult", "strategy attempts seconds")
+
+
+def stats_path():
+    return os.path.join(config.CACHE_DIR, "input_strategies.json")
+
+
+class InputStats:
+    """Per (host, locator) success / failure counts and total success latency per strategy."""
+
+    def __init__(self, path=None):
+        self.path = path or stats_path()
+        self.data = read_json(self.path, {}) or {}
+        self._pending = []          # results of this run, merged into the file by save()
+
+    @staticmethod
+    def key(host, locator):
+        by, value = locator
+        return f"{host} {by}={value}"
+
+    def order(self, key):
+        """Strategy names to try: proven ones fastest first, untried in ladder order, failing ones last."""
+        history = self.data.get(key, {})
+        proven, untried, failing = [], [], []
+        for index, name in enumerate(STRATEGIES):
+            entry = history.get(name)
+            if not entry:
+                untried.append(name)
+            elif entry["ok"]:
+                rate = entry["ok"] / (entry["ok"] + entry["fail"])
+                proven.append((-rate, entry["seconds"] / entry["ok"], index, name))
+            else:
+                failing.append(name)
+        return [name for *_, name in sorted(proven)] + untried + failing
+
+    def record(self, key, name, ok, seconds):
+        self._add(self.data, key, name, ok, seconds)
+        self._pending.append((key, name, ok, seconds))
+
+    @staticmethod
+    def _add(data, key, name, ok, seconds):
+        entry = data.setdefault(key, {}).setdefault(name, {"ok": 0, "fail": 0, "seconds": 0.0})
+        if ok:
+            entry["ok"] += 1
+            entry["seconds"] += seconds
+        else:
+            entry["fail"] += 1
+
+    def save(self):
+        """Merge this run's results into the file (other processes may have written meanwhile)."""
+        if not self._pending:
+            return
+        with locked(self.path + ".lock"):
+            data = read_json(self.path, {}) or {}
+            for result in self._pending:
+                self._add(data, *result)
+            write_json_atomic(self.path, data)
+        self._pending.clear()
+        self.data = data
+
+
+def _verify(driver, el, text, before, timeout):
+    try:
+        return bool(driver.execute_async_script(VERIFY_SCRIPT, el, text, before, int(timeout * 1000)))
+    except WebDriverException:
+        return False
+
+
+def type_text(driver, locator, text, element=None, stats=None, verify_timeout=1.0):
+    """Type ``text`` into the field at ``locator`` (or ``element``), learning which strategy works.
+
+    Raises RuntimeError if no strategy got the text into the field.
+    """
+    stats = stats or InputStats()
+    el = element if element is not None else driver.find_element(*locator)
+    key = InputStats.key(urlsplit(driver.current_url).netloc, locator)
+    attempts = []
+    try:
+        for name in stats.order(key):
+            attempts.append(name)
+            started = time.perf_counter()
+            try:
+                before = driver.execute_script(CLEAR_SCRIPT, el)
+                STRATEGIES[name](el, text, driver)
+                ok = _verify(driver, el, text, before, verify_timeout)
+            except WebDriverException:
+                ok = False
+            seconds = time.perf_counter() - started
+            stats.record(key, name, ok, seconds)
+            if ok:
+                return TypeResult(name, attempts, seconds)
+    finally:
+        stats.save()
+    raise RuntimeError(f"send_keys did not input any text after trying {', '.join(attempts)}")
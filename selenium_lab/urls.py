@@ -0,0 +1,23 @@
+# urls.py
+"""
+Where the the-internet pages are loaded from.
+
+SELENIUM_LAB_BASE_URL picks the site for every script and test:
+  - unset                     https://the-internet.herokuapp.com (the real site)
+  - local                     an in-process FixtureServer started on first use
+  - http://127.0.0.1:8000     a server started with python -m selenium_lab.fixture_server
+"""
+
+from selenium_lab import config
+
+
+def base_url():
+    if config.BASE_URL.lower() == "local":
+        from selenium_lab.fixture_server import shared_server
+        return shared_server().url
+    return config.BASE_URL.rstrip("/")
+
+
+def url_for(path):
+    """Absolute URL of a the-internet page, e.g. url_for("/login")."""
+    return base_url() + path
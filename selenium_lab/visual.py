@@ -0,0 +1,213 @@
+# visual.py
+"""
+Compare screenshots against approved baselines.
+
+Baselines live in a folder with an index.json keyed by test id plus element
+locator (``tests/test_login.py::test_ok  css selector=#flash``, or ``page``
+for whole-page shots). Each entry records the PNG's sha256, size and a
+64-bit perceptual hash (dHash).
+
+Checking a candidate:
+ 1. same sha256 as the baseline -> "identical", nothing is decoded; this is
+    what almost every unchanged screenshot hits
+ 2. otherwise both PNGs are decoded to NumPy arrays in a worker process and
+    diffed per pixel (any channel off by more than ``tolerance``), ignoring
+    masked rectangles; changed pixels are grouped into region boxes on a
+    16 px grid. The perceptual-hash distance is reported alongside so a
+    re-rendered but unchanged page (distance 0, few pixels) is easy to tell
+    from a real layout change.
+
+    index = BaselineIndex()
+    index.approve(BaselineIndex.key(test_id, locator), png)
+    results = index.check_many([(key, "shots/login.png"), ...])
+    for r in results:
+        print(r.key, r.status, r.changed_ratio, r.regions)
+"""
+
+import hashlib
+import io
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from selenium_lab import config
+from selenium_lab.locking import locked, read_json, write_json_atomic
+
+try:
+    from PIL import Image
+except ImportError:  # needed only once images differ and have to be decoded
+    Image = None
+
+BLOCK = 16      # region grid, in pixels
+
+
+@dataclass
+class VisualResult:
+    key: str
+    status: str                     # "identical", "same" (within limits), "changed", "size", "new"
+    changed_pixels: int = 0
+    changed_ratio: float = 0.0
+    phash_distance: int = 0
+    regions: list = field(default_factory=list)   # (x, y, width, height) of changed areas
+
+    def __bool__(self):
+        return self.status in ("identical", "same")
+
+
+def _decode(png):
+    if Image is None:
+        raise RuntimeError("decoding screenshots needs Pillow")
+    return Image.open(io.BytesIO(png)).convert("RGB")
+
+
+def dhash(image):
+    """64-bit difference hash of a PIL image: each bit says "brighter than its right neighbour"."""
+    small = np.asarray(image.convert("L").resize((9, 8), Image.BILINEAR), dtype=np.int16)
+    bits = (small[:, 1:] > small[:, :-1]).flatten()
+    return int("".join("1" if b else "0" for b in bits), 2)
+
+
+def mask_array(shape, masks):
+    """Boolean (height, width) array, True where pixels are compared; masks are (x, y, w, h)."""
+    keep = np.ones(shape[:2], dtype=bool)
+    for x, y, w, h in masks or ():
+        keep[max(0, y):y + h, max(0, x):x + w] = False
+    return keep
+
+
+def changed_regions(changed, block=BLOCK):
+    """Bounding boxes (x, y, w, h) of connected groups of changed ``block`` x ``block`` cells."""
+    height, width = changed.shape
+    rows, cols = -(-height // block), -(-width // block)
+    padded = np.zeros((rows * block, cols * block), dtype=bool)
+    padded[:height, :width] = changed
+    cells = padded.reshape(rows, block, cols, block).any(axis=(1, 3))
+
+    regions, seen = [], np.zeros_like(cells)
+    for r, c in zip(*np.nonzero(cells)):
+        if seen[r, c]:
+            continue
+        seen[r, c] = True
+        queue, top, left, bottom, right = deque([(r, c)]), r, c, r, c
+        while queue:
+            y, x = queue.popleft()
+            top, left, bottom, right = min(top, y), min(left, x), max(bottom, y), max(right, x)
+            for ny, nx in ((y - 1, x), (y + 1, x), (y, x - 1), (y, x + 1)):
+                if 0 <= ny < rows and 0 <= nx < cols and cells[ny, nx] and not seen[ny, nx]:
+                    seen[ny, nx] = True
+                    queue.append((ny, nx))
+        x0, y0 = int(left) * block, int(top) * block
+        regions.append((x0, y0, min(width, (int(right) + 1) * block) - x0, min(height, (int(bottom) + 1) * block) - y0))
+    return regions
+
+
+def diff_images(baseline, candidate, masks=None, tolerance=None, max_ratio=0.0, key=""):
+    """Pixel-diff two PNGs (bytes); returns a VisualResult."""
+    tolerance = config.VISUAL_TOLERANCE if tolerance is None else tolerance
+    base_image, cand_image = _decode(baseline), _decode(candidate)
+    distance = bin(dhash(base_image) ^ dhash(cand_image)).count("1")
+    a, b = np.asarray(base_image), np.asarray(cand_image)
+    if a.shape != b.shape:
+        return VisualResult(key, "size", phash_distance=distance)
+
+    changed = (np.abs(a.astype(np.int16) - b.astype(np.int16)).max(axis=2) > tolerance)
+    keep = mask_array(a.shape, masks)
+    changed &= keep
+    count = int(changed.sum())
+    ratio = count / max(1, int(keep.sum()))
+    status = "same" if ratio <= max_ratio else "changed"
+    regions = changed_regions(changed) if count else []
+    return VisualResult(key, status, count, ratio, distance, regions)
+
+
+def _diff_files(key, baseline_path, candidate_path, masks, tolerance, max_ratio):
+    # runs in a worker process: read both files there instead of pickling the bytes over
+    with open(baseline_path, "rb") as f:
+        baseline = f.read()
+    with open(candidate_path, "rb") as f:
+        candidate = f.read()
+    return diff_images(baseline, candidate, masks, tolerance, max_ratio, key)
+
+
+class BaselineIndex:
+    """Approved screenshots, content-addressed, keyed by test id + locator."""
+
+    def __init__(self, root=None):
+        self.root = os.path.abspath(root or config.VISUAL_BASELINE_DIR)
+        self.index_path = os.path.join(self.root, "index.json")
+        self.entries = read_json(self.index_path, {}) or {}
+
+    @staticmethod
+    def key(test_id, locator=None):
+        if locator is None:
+            return f"{test_id}  page"
+        by, value = locator
+        return f"{test_id}  {by}={value}"
+
+    def path(self, key):
+        return os.path.join(self.root, self.entries[key]["file"])
+
+    def approve(self, key, png):
+        """Make ``png`` (bytes) the baseline for ``key``."""
+        digest = hashlib.sha256(png).hexdigest()
+        name = f"{digest[:2]}/{digest}.png"
+        target = os.path.join(self.root, name)
+        if not os.path.exists(target):
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with open(target, "wb") as f:
+                f.write(png)
+        image = _decode(png)
+        entry = {"file": name, "sha256": digest, "phash": f"{dhash(image):016x}",
+                 "width": image.width, "height": image.height}
+        with locked(self.index_path + ".lock"):
+            entries = read_json(self.index_path, {}) or {}
+            entries[key] = entry
+            write_json_atomic(self.index_path, entries)
+        self.entries[key] = entry
+
+    def check(self, key, png, masks=None, tolerance=None, max_ratio=0.0):
+        """Compare one candidate (bytes) in this process."""
+        entry = self.entries.get(key)
+        if entry is None:
+            return VisualResult(key, "new")
+        if hashlib.sha256(png).hexdigest() == entry["sha256"]:
+            return VisualResult(key, "identical")
+        with open(self.path(key), "rb") as f:
+            return diff_images(f.read(), png, masks, tolerance, max_ratio, key)
+
+    def check_many(self, candidates, masks=None, tolerance=None, max_ratio=0.0, workers=None):
+        """Compare ``[(key, candidate_path), ...]``; identical files never leave this process.
+
+        masks: key -> [(x, y, w, h), ...] regions to ignore. Results come back in input order.
+        """
+        masks = masks or {}
+        tolerance = config.VISUAL_TOLERANCE if tolerance is None else tolerance
+        results = [None] * len(candidates)
+        pending = []
+        for i, (key, path) in enumerate(candidates):
+            entry = self.entries.get(key)
+            if entry is None:
+                results[i] = VisualResult(key, "new")
+                continue
+            with open(path, "rb") as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+            if digest == entry["sha256"]:
+                results[i] = VisualResult(key, "identical")
+            else:
+                pending.append((i, key, path))
+        if not pending:
+            return results
+
+        workers = workers or config.VISUAL_WORKERS or os.cpu_count() or 1
+        args = [(key, self.path(key), path, masks.get(key), tolerance, max_ratio) for _, key, path in pending]
+        if workers == 1 or len(pending) == 1:
+            diffs = [_diff_files(*a) for a in args]
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, len(pending))) as pool:
+                diffs = list(pool.map(_diff_files, *zip(*args), chunksize=max(1, len(args) // (workers * 4))))
+        for (i, _, _), result in zip(pending, diffs):
+            results[i] = result
+        return results
@@ -0,0 +1,276 @@
+# wait_budget.py
+"""
+Where does a test's time go while it is waiting?
+
+The tests run with ``implicitly_wait(10)`` and also use ``WebDriverWait``.
+Every find that comes back empty under an implicit wait silently costs the
+full 10 s, and a find inside an explicit wait can block for 10 s per poll
+instead of returning straight away. ``instrument(driver)`` wraps one driver
+and records, per test:
+
+    implicit  time spent in find commands while an implicit wait was set
+    explicit  time spent inside WebDriverWait.until / until_not
+    sleep     time spent in time.sleep (outside explicit waits)
+
+plus every negative find (empty result under an implicit wait) and every
+conflict (a find under an implicit wait *inside* an explicit wait), with the
+line of test code that caused it. With ``zero_implicit=True`` the implicit
+wait is set to 0 for the duration of each explicit wait, so conflicts go away.
+
+Usage:
+    with instrument(driver, implicit_wait=10) as record:
+        ...
+    print(record.summary())
+    for line in ranking([record, ...]): print(line)
+
+Only ``time.sleep`` looked up at call time is seen; ``from time import sleep``
+done before instrumenting keeps the original function.
+"""
+
+import functools
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+import selenium
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.support.wait import WebDriverWait
+
+from selenium_lab.waits import ObserverWait
+
+_FIND_COMMANDS = {
+    Command.FIND_ELEMENT, Command.FIND_ELEMENTS, Command.FIND_CHILD_ELEMENT, Command.FIND_CHILD_ELEMENTS,
+}
+# frames inside these folders are library code, not the line that caused the wait
+_LIBRARY_DIRS = (
+    os.path.dirname(selenium.__file__) + os.sep,
+    os.path.dirname(os.path.abspath(__file__)) + os.sep,
+)
+
+
+@dataclass
+class WaitRecord:
+    """Wait time of one test (seconds). Event lists hold (where, what, seconds)."""
+
+    test: str = ""
+    implicit: float = 0.0
+    explicit: float = 0.0
+    sleep: float = 0.0
+    negative_finds: list = field(default_factory=list)
+    conflicts: list = field(default_factory=list)
+    sleeps: list = field(default_factory=list)
+
+    @property
+    def wasted(self):
+        """Time that bought nothing: empty implicit finds, conflicting finds and fixed sleeps."""
+        return (
+            sum(s for _, _, s in self.negative_finds)
+            + sum(s for _, _, s in self.conflicts)
+            + self.sleep
+        )
+
+    def summary(self):
+        return (
+            f"implicit={self.implicit:.2f}s explicit={self.explicit:.2f}s sleep={self.sleep:.2f}s "
+            f"wasted={self.wasted:.2f}s negative_finds={len(self.negative_finds)} "
+            f"conflicts={len(self.conflicts)}"
+        )
+
+    def as_dict(self):
+        return {
+            "implicit": round(self.implicit, 3),
+            "explicit": round(self.explicit, 3),
+            "sleep": round(self.sleep, 3),
+            "wasted": round(self.wasted, 3),
+            "negative_finds": len(self.negative_finds),
+            "conflicts": len(self.conflicts),
+        }
+
+
+def _call_site():
+    """file:line of the first frame outside selenium and selenium_lab."""
+    frame = sys._getframe(2)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if not filename.startswith(_LIBRARY_DIRS):
+            return f"{os.path.relpath(filename)}:{frame.f_lineno}"
+        frame = frame.f_back
+    return "?"
+
+
+class _Recorder:
+    def __init__(self, driver, record, implicit_wait, zero_implicit):
+        self.driver = driver
+        self.record = record
+        self.implicit = implicit_wait or 0.0
+        self.zero_implicit = zero_implicit
+        self.thread = threading.get_ident()
+        self.depth = 0          # nesting of explicit waits
+        self.zeroed = False
+        self.original_execute = driver.execute
+
+    def execute(self, command, params=None):
+        if command == Command.SET_TIMEOUTS and params and "implicit" in params:
+            self.implicit = params["implicit"] / 1000.0
+        if command not in _FIND_COMMANDS or self.implicit <= 0 or self.zeroed:
+            return self.original_execute(command, params)
+
+        started = time.perf_counter()
+        found = True
+        try:
+            response = self.original_execute(command, params)
+            if command in (Command.FIND_ELEMENTS, Command.FIND_CHILD_ELEMENTS) and not response.get("value"):
+                found = False
+            return response
+        except NoSuchElementException:
+            found = False
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            self.record.implicit += elapsed
+            what = f"{params.get('using')}={params.get('value')}" if params else command
+            if self.depth:
+                self.record.conflicts.append((_call_site(), what, elapsed))
+            elif not found:
+                self.record.negative_finds.append((_call_site(), what, elapsed))
+
+    def set_implicit(self, seconds):
+        self.original_execute(Command.SET_TIMEOUTS, {"implicit": int(seconds * 1000)})
+
+    @contextmanager
+    def explicit_wait(self):
+        self.depth += 1
+        if self.depth == 1 and self.zero_implicit and self.implicit > 0:
+            self.set_implicit(0)
+            self.zeroed = True
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.depth -= 1
+            if self.depth == 0:
+                self.record.explicit += time.perf_counter() - started
+                if self.zeroed:
+                    self.zeroed = False
+                    self.set_implicit(self.implicit)
+
+
+# -------------------------
+# process-wide hooks, installed while at least one driver is instrumented
+# -------------------------
+_lock = threading.Lock()
+_active = []            # live _Recorder objects
+_patched = {}           # (owner, name) -> original
+
+
+def _recorder_for_driver(driver):
+    driver = getattr(driver, "parent", driver)  # WebDriverWait(element, ...) waits on an element
+    for recorder in _active:
+        if recorder.driver is driver:
+            return recorder
+    return None
+
+
+def _timed_wait(original):
+    @functools.wraps(original)
+    def wrapper(self, *args, **kwargs):
+        recorder = _recorder_for_driver(self._driver)
+        if recorder is None:
+            return original(self, *args, **kwargs)
+        with recorder.explicit_wait():
+            return original(self, *args, **kwargs)
+    return wrapper
+
+
+def _timed_sleep(original):
+    @functools.wraps(original)
+    def sleep(seconds):
+        thread = threading.get_ident()
+        recorders = [r for r in _active if r.thread == thread and not r.depth]
+        if not recorders:
+            return original(seconds)
+        started = time.perf_counter()
+        try:
+            return original(seconds)
+        finally:
+            elapsed = time.perf_counter() - started
+            where = _call_site()
+            for recorder in recorders:
+                recorder.record.sleep += elapsed
+                recorder.record.sleeps.append((where, f"sleep({seconds})", elapsed))
+    return sleep
+
+
+def _install():
+    targets = [(cls, name) for cls in (WebDriverWait, ObserverWait) for name in ("until", "until_not") if name in vars(cls)]
+    for owner, name in targets:
+        original = vars(owner)[name]
+        _patched[(owner, name)] = original
+        setattr(owner, name, _timed_wait(original))
+    _patched[(time, "sleep")] = time.sleep
+    time.sleep = _timed_sleep(time.sleep)
+
+
+def _uninstall():
+    for (owner, name), original in _patched.items():
+        setattr(owner, name, original)
+    _patched.clear()
+
+
+@contextmanager
+def instrument(driver, implicit_wait=None, zero_implicit=False, test=""):
+    """Record the wait time of everything done with ``driver`` inside the block.
+
+    implicit_wait: the implicit wait the driver already has (it is not queried).
+    zero_implicit: drop the implicit wait to 0 while an explicit wait runs.
+    """
+    record = WaitRecord(test=test)
+    recorder = _Recorder(driver, record, implicit_wait, zero_implicit)
+    with _lock:
+        if not _active:
+            _install()
+        _active.append(recorder)
+    previous = vars(driver).get("execute")  # another wrapper may already be installed
+    driver.execute = recorder.execute
+    try:
+        yield record
+    finally:
+        if previous is None:
+            del driver.execute  # back to the class method
+        else:
+            driver.execute = previous
+        with _lock:
+            _active.remove(recorder)
+            if not _active:
+                _uninstall()
+
+
+def ranking(records, top=10):
+    """Report lines: the worst tests by wasted wait time, then the worst lines of code."""
+    records = [r for r in records if r.wasted > 0 or r.conflicts]
+    if not records:
+        return ["no wasted wait time recorded"]
+    lines = [f"{'wasted':>8} {'implicit':>9} {'explicit':>9} {'sleep':>7} {'conflicts':>9}  test"]
+    for r in sorted(records, key=lambda r: r.wasted, reverse=True)[:top]:
+        lines.append(
+            f"{r.wasted:7.2f}s {r.implicit:8.2f}s {r.explicit:8.2f}s {r.sleep:6.2f}s {len(r.conflicts):>9}  {r.test}"
+        )
+
+    by_site = defaultdict(lambda: [0, 0.0])
+    for r in records:
+        for kind, events in (("conflict", r.conflicts), ("negative find", r.negative_finds), ("sleep", r.sleeps)):
+            for where, what, seconds in events:
+                entry = by_site[(where, kind, what)]
+                entry[0] += 1
+                entry[1] += seconds
+    worst = sorted(by_site.items(), key=lambda item: item[1][1], reverse=True)[:top]
+    if worst:
+        lines.append("worst offenders:")
+        for (where, kind, what), (count, seconds) in worst:
+            lines.append(f"{seconds:7.2f}s  {count:>4}x  {kind:<13} {where}  {what}")
+    return lines
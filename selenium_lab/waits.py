@@ -0,0 +1,284 @@
+# waits.py
+"""
+Wait helpers that do their checking inside the page instead of polling from Python.
+
+Race: trying N locators one after another with ``WebDriverWait(driver, 15)`` each
+costs up to N * 15 s when none of them ever shows up (a consent banner that
+is not there). ``first_match`` checks every locator in a single
+execute_script per poll and the whole race shares one deadline.
+
+Usage:
+    index, element = WebDriverWait(driver, 5).until(first_match(locators))
+
+    hit = click_first(driver, consent_locators, timeout=5)   # None if nothing showed up
+    if hit:
+        print("clicked", hit.locator)
+
+Observed conditions: ``WebDriverWait`` + ``expected_conditions`` costs one
+find_element (+ .text / is_displayed) round trip per poll. The conditions
+below install a MutationObserver through execute_async_script and answer as
+soon as the page changes, so a wait is one round trip. They have the same
+names and return values as selenium's expected_conditions:
+
+    from selenium_lab import waits
+    ObserverWait(driver, 15).until(waits.invisibility_of_element_located((By.ID, "loading")))
+    finish = ObserverWait(driver, 15).until(waits.visibility_of_element_located((By.ID, "finish")))
+
+They also work with a plain WebDriverWait (each call then watches the page for
+``slice`` seconds). If the observer script cannot run, they fall back to the
+polled expected condition.
+"""
+
+import time
+from typing import NamedTuple
+
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    StaleElementReferenceException,
+    InvalidSelectorException,
+    TimeoutException,
+    WebDriverException,
+)
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from selenium_lab._js import with_helpers
+
+# returns [index, element] for the first locator (in list order) that matches, or null
+RACE_SCRIPT = with_helpers(r"""
+var locators = arguments[0], clickable = arguments[1];
+function ready(el) {
+  if (!clickable) { return true; }
+  return labVisible(el) && !el.disabled;
+}
+for (var i = 0; i < locators.length; i++) {
+  var found;
+  try {
+    found = labFindAll(locators[i][0], locators[i][1]);
+  } catch (e) {
+    continue;  // a bad xpath must not spoil the other candidates
+  }
+  for (var j = 0; j < found.length; j++) {
+    if (ready(found[j])) { return [i, found[j]]; }
+  }
+}
+return null;
+""")
+
+
+class RaceResult(NamedTuple):
+    index: int
+    element: WebElement
+    locator: tuple
+
+
+class first_match:
+    """Expected condition: the first of ``locators`` that is present (or clickable).
+
+    Earlier locators win when several match in the same poll. Returns a
+    RaceResult, or False so WebDriverWait keeps polling.
+    """
+
+    def __init__(self, locators, clickable=True):
+        self.locators = [tuple(loc) for loc in locators]
+        self.clickable = clickable
+
+    def __call__(self, driver):
+        hit = driver.execute_script(RACE_SCRIPT, [list(loc) for loc in self.locators], self.clickable)
+        if not hit:
+            return False
+        index, element = hit
+        return RaceResult(index, element, self.locators[index])
+
+
+def race(driver, locators, timeout=10, poll=0.25, clickable=True):
+    """Wait for the first of ``locators``; raises TimeoutException after ``timeout`` seconds in total."""
+    wait = WebDriverWait(driver, timeout, poll_frequency=poll)
+    return wait.until(first_match(locators, clickable), f"none of {len(locators)} locators matched")
+
+
+def click_first(driver, locators, timeout=5, poll=0.25):
+    """Click the first clickable match of ``locators``; None if none showed up before the deadline.
+
+    An element that goes stale or is covered between the check and the click
+    puts the race back on, still within the same deadline.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining = deadline - time.monotonic()
+        try:
+            hit = race(driver, locators, timeout=max(remaining, 0), poll=poll)
+        except TimeoutException:
+            return None
+        try:
+            hit.element.click()
+            return hit
+        except (StaleElementReferenceException, ElementClickInterceptedException, ElementNotInteractableException):
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(poll)
+
+
+# ---------------------------------------------------------------------------
+# Observed conditions
+# ---------------------------------------------------------------------------
+
+# Longest single execute_async_script; stays under WebDriver's default 30 s script timeout.
+MAX_SLICE = 20.0
+
+OBSERVE_SCRIPT = with_helpers(r"""
+var kind = arguments[0], by = arguments[1], value = arguments[2], extra = arguments[3];
+var timeoutMs = arguments[4], done = arguments[arguments.length - 1];
+
+function textOf(el) { return el.innerText || el.textContent || ""; }
+function check() {
+  var el = labFind(by, value);
+  switch (kind) {
+    case "presence": return el ? {element: el} : null;
+    case "visibility": return labVisible(el) ? {element: el} : null;
+    // like EC.invisibility_of_element_located: the element while it is present but hidden, true once it is gone
+    case "invisibility": return labVisible(el) ? null : el ? {element: el} : {value: true};
+    case "text": return el && textOf(el).indexOf(extra) !== -1 ? {value: true} : null;
+    case "non_empty_text": return el && textOf(el).trim() ? {element: el} : null;
+    case "attribute_text":
+      var attr = el ? el.getAttribute(extra[0]) : null;
+      return attr !== null && attr.indexOf(extra[1]) !== -1 ? {value: true} : null;
+    case "has_attribute": return el && el.getAttribute(extra) !== null ? {value: true} : null;
+  }
+  throw new Error("unknown condition: " + kind);
+}
+
+var observer = null, timer = null, ticker = null, finished = false, queued = false;
+function finish(result) {
+  if (finished) { return; }
+  finished = true;
+  if (observer) { observer.disconnect(); }
+  clearTimeout(timer);
+  clearInterval(ticker);
+  done(result);
+}
+function run() {
+  queued = false;
+  try {
+    var result = check();
+    if (result) { finish(result); }
+  } catch (e) {
+    finish({error: String(e && e.message || e)});
+  }
+}
+function schedule() {
+  // a burst of mutations costs one check
+  if (!queued) { queued = true; Promise.resolve().then(run); }
+}
+
+run();
+if (!finished) {
+  observer = new MutationObserver(schedule);
+  observer.observe(document.documentElement, {subtree: true, childList: true, attributes: true, characterData: true});
+  ticker = setInterval(schedule, 250);  // layout-only changes (CSS transitions) do not mutate the DOM
+  timer = setTimeout(function () { finish(null); }, timeoutMs);
+}
+""")
+
+
+class _Observed:
+    """Expected condition evaluated inside the page by OBSERVE_SCRIPT."""
+
+    def __init__(self, kind, locator, fallback, extra=None, slice=2.0):
+        self.kind = kind
+        self.locator = tuple(locator)
+        self.extra = extra
+        self.fallback = fallback
+        self.slice = slice
+        self.polling = False
+
+    def __call__(self, driver):
+        return self.wait(driver, self.slice)
+
+    def wait(self, driver, timeout):
+        """Watch the page for up to ``timeout`` seconds; the condition's value, or False."""
+        if self.polling:
+            return self.fallback(driver)
+        by, value = self.locator
+        timeout_ms = int(min(max(timeout, 0), MAX_SLICE) * 1000)
+        try:
+            result = driver.execute_async_script(OBSERVE_SCRIPT, self.kind, by, value, self.extra, timeout_ms)
+        except TimeoutException:
+            return False
+        except WebDriverException as exc:
+            # the page navigated away mid-wait: just look again next time
+            if "unload" not in str(exc):
+                self.polling = True
+            return self.fallback(driver)
+        if not result:
+            return False
+        if "error" in result:
+            raise InvalidSelectorException(f"{self.locator}: {result['error']}")
+        return result["element"] if "element" in result else result["value"]
+
+
+class ObserverWait(WebDriverWait):
+    """WebDriverWait that lets observed conditions block in the page until the deadline.
+
+    Other conditions (anything from expected_conditions, lambdas) are polled
+    exactly as WebDriverWait does.
+    """
+
+    def until(self, method, message=""):
+        if not isinstance(method, _Observed):
+            return super().until(method, message)
+        deadline = time.monotonic() + self._timeout
+        while True:
+            try:
+                value = method.wait(self._driver, deadline - time.monotonic())
+                if value:
+                    return value
+            except self._ignored_exceptions:
+                pass
+            if time.monotonic() >= deadline:
+                raise TimeoutException(message)
+            if method.polling:
+                time.sleep(self._poll)
+
+
+def presence_of_element_located(locator):
+    return _Observed("presence", locator, EC.presence_of_element_located(locator))
+
+
+def visibility_of_element_located(locator):
+    return _Observed("visibility", locator, EC.visibility_of_element_located(locator))
+
+
+def invisibility_of_element_located(locator):
+    return _Observed("invisibility", locator, EC.invisibility_of_element_located(locator))
+
+
+def text_to_be_present_in_element(locator, text_):
+    return _Observed("text", locator, EC.text_to_be_present_in_element(locator, text_), extra=text_)
+
+
+def text_to_be_present_in_element_attribute(locator, attribute_, text_):
+    return _Observed(
+        "attribute_text", locator,
+        EC.text_to_be_present_in_element_attribute(locator, attribute_, text_),
+        extra=[attribute_, text_],
+    )
+
+
+def element_attribute_to_include(locator, attribute_):
+    return _Observed("has_attribute", locator, EC.element_attribute_to_include(locator, attribute_), extra=attribute_)
+
+
+def element_has_non_empty_text(locator):
+    """The element once its text is not blank (not an expected_conditions name, used by waits_demo)."""
+
+    def _polled(driver):
+        try:
+            element = driver.find_element(*locator)
+            return element if element.text.strip() else False
+        except WebDriverException:
+            return False
+
+    return _Observed("non_empty_text", locator, _polled)
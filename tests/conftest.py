@@ -1,20 +1,45 @@
 # conftest.py
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-import os
+
+from selenium_lab import config
+from selenium_lab.driver_factory import create_chrome_driver
+from selenium_lab.pool import BrowserPool
+
+_POOL_KEY = pytest.StashKey[BrowserPool]()
+
+
+@pytest.fixture(scope="session")
+def browser_pool(pytestconfig):
+    # browsers are launched once per session and reset between tests
+    pool = BrowserPool(
+        create_chrome_driver,
+        size=config.POOL_SIZE,
+        max_uses=config.POOL_MAX_USES,
+        implicit_wait=config.IMPLICIT_WAIT,
+    )
+    pytestconfig.stash[_POOL_KEY] = pool
+    pool.start()
+    yield pool
+    pool.close()
+
 
 @pytest.fixture(scope="function")
-def driver(tmp_path):
-    service = Service(ChromeDriverManager().install())
-    options = webdriver.ChromeOptions()
-    # options.add_argument("--headless")   # comment/uncomment as needed
-    driver = webdriver.Chrome(service=service, options=options)
-    driver.maximize_window()
-    driver.implicitly_wait(10)  # increased implicit wait
-    # attach a place to save debug artifacts
-    driver._debug_dir = os.path.join(str(tmp_path), "debug")
-    os.makedirs(driver._debug_dir, exist_ok=True)
-    yield driver
-    driver.quit()
+def driver(browser_pool, request, track_waits, track_commands, flight_recorder):
+    driver = browser_pool.acquire()
+    # implicit / explicit / sleep time of this test goes into the wait budget report;
+    # every WebDriver command is timed for the command report;
+    # with SELENIUM_LAB_FLIGHT_RECORDER=1 the last steps are saved if the test fails
+    with track_waits(driver, implicit_wait=browser_pool.implicit_wait), track_commands(driver), \
+            flight_recorder(driver):
+        yield driver
+    rep = getattr(request.node, "rep_call", None)
+    browser_pool.release(driver, failed=bool(rep and rep.failed))
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    pool = config.stash.get(_POOL_KEY, None)
+    if pool is None:
+        return
+    terminalreporter.write_sep("-", "browser pool")
+    for line in pool.stats.summary_lines():
+        terminalreporter.write_line(line)
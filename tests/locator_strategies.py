@@ -1,19 +1,19 @@
 # locator_strategies.py
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-import time
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # repo root, for selenium_lab
+from selenium_lab.driver_factory import create_chrome_driver
+from selenium_lab.settle import settle
 
 # Step 1: Initialize Chrome browser
-service = Service(ChromeDriverManager().install())
-driver = webdriver.Chrome(service=service)
-driver.maximize_window()
+driver = create_chrome_driver()
 
 # Step 2: Open test website
 driver.get("https://www.saucedemo.com/")
 print("Opened:", driver.title)
-time.sleep(2)
+settle(driver)
 
 # ---------- LOCATOR STRATEGIES DEMO ---------- #
 
@@ -31,7 +31,7 @@ print("Located by NAME ✅")
 login_btn = driver.find_element(By.CLASS_NAME, "submit-button")
 login_btn.click()
 print("Located by CLASS NAME ✅")
-time.sleep(2)
+settle(driver)
 
 # 4️⃣ Locate by TAG NAME
 # Example: Find all <a> tags (links)
@@ -41,7 +41,7 @@ print(f"Located by TAG NAME ✅ - Total links found: {len(all_links)}")
 # 5️⃣ Locate by LINK TEXT
 menu_button = driver.find_element(By.ID, "react-burger-menu-btn")
 menu_button.click()
-time.sleep(1)
+settle(driver)
 about_link = driver.find_element(By.LINK_TEXT, "About")
 print("Located by LINK TEXT ✅ - Found 'About' link")
 
@@ -60,7 +60,7 @@ cart_icon = driver.find_element(By.XPATH, "//a[@class='shopping_cart_link']")
 cart_icon.click()
 print("Located by XPATH ✅ - Clicked cart icon")
 
-time.sleep(2)
+settle(driver)
 
 # ---------- END DEMO ---------- #
 driver.quit()
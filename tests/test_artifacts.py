@@ -0,0 +1,70 @@
+# tests/test_artifacts.py
+"""Checks for selenium_lab.artifacts using a fake driver (no real browser needed)."""
+
+import base64
+import os
+
+from selenium.common.exceptions import WebDriverException
+
+from selenium_lab.artifacts import ArtifactStore
+
+PAGE = "<html><body>" + "<p>same page</p>" * 200 + "</body></html>"
+
+
+class FakeDriver:
+    page_source = PAGE
+
+    def __init__(self, screenshot=b"\x89PNG fake"):
+        self.screenshot = screenshot
+
+    def get_screenshot_as_base64(self):
+        if isinstance(self.screenshot, Exception):
+            raise self.screenshot
+        return base64.b64encode(self.screenshot).decode("ascii")
+
+
+def _blob_files(root):
+    return [name for _, _, files in os.walk(os.path.join(root, "blobs")) for name in files]
+
+
+def test_identical_snapshots_are_stored_once_and_compressed(tmp_path):
+    store = ArtifactStore(str(tmp_path))
+    first = store.capture(FakeDriver(), "failure")
+    second = store.capture(FakeDriver(), "failure")
+    assert store.flush() == []
+    store.close()
+
+    assert len(set(first + second)) == 4 and len(store.entries()) == 4
+    assert len(_blob_files(str(tmp_path))) == 2
+    html_blob = store.entries()[first[1]]["blob"]
+    assert os.path.getsize(tmp_path / "blobs" / html_blob) < len(PAGE) / 10
+    assert store.load(first[1]).decode("utf-8") == PAGE
+    assert store.load(first[0]) == b"\x89PNG fake"
+
+
+def test_least_recently_used_blobs_are_evicted_over_the_cap(tmp_path):
+    store = ArtifactStore(str(tmp_path), max_bytes=250, workers=1)
+    old = store.put("old", b"a" * 100, "png")
+    store.flush()
+    store.put("kept", b"b" * 100, "png")
+    store.flush()
+    store.put("old-again", b"a" * 100, "png")   # same content: "a" is now the most recently used
+    store.flush()
+    store.put("new", b"c" * 100, "png")
+    store.close()
+
+    remaining = store.entries()
+    assert old in remaining and not any(name.startswith("kept-") for name in remaining)
+    assert len(_blob_files(str(tmp_path))) == 2
+
+
+def test_capture_problems_are_recorded_not_raised(tmp_path):
+    store = ArtifactStore(str(tmp_path))
+    entries = store.capture(FakeDriver(screenshot=WebDriverException("tab crashed")), "crash")
+    store.close()
+    assert len(entries) == 1 and entries[0].endswith(".html")
+    assert [name for name, _ in store.errors] == ["crash.png"]
+
+    path = store.extract(entries[0], str(tmp_path / "out"))
+    with open(path, encoding="utf-8") as f:
+        assert f.read() == PAGE
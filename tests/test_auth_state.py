@@ -0,0 +1,116 @@
+# tests/test_auth_state.py
+"""Checks for selenium_lab.auth_state using a fake driver (no real browser needed)."""
+
+import os
+import stat
+import time
+
+import pytest
+
+from selenium_lab.auth_state import AuthCache, SNAPSHOT_STORAGE_SCRIPT, auth_stats
+
+URL = "http://127.0.0.1:8000/secure"
+
+
+@pytest.fixture(autouse=True)
+def _clean_stats():
+    auth_stats.reset()
+    yield
+    auth_stats.reset()
+
+
+class FakeSite:
+    """Server side: which session tokens are still valid."""
+
+    def __init__(self):
+        self.sessions = set()
+
+
+class FakeDriver:
+    def __init__(self, site):
+        self.site = site
+        self.current_url = "about:blank"
+        self.cookies = {}
+        self.cdp = []
+        self.seeded = None
+
+    def get(self, url):
+        valid = self.cookies.get("rack.session") in self.site.sessions
+        self.current_url = url if url != URL or valid else "http://127.0.0.1:8000/login"
+
+    def get_cookies(self):
+        return [{"name": k, "value": v, "path": "/", "domain": "127.0.0.1", "httpOnly": True,
+                 "expiry": int(time.time()) + 3600} for k, v in self.cookies.items()]
+
+    def delete_all_cookies(self):
+        self.cookies.clear()
+
+    def execute_script(self, script, *args):
+        assert script == SNAPSHOT_STORAGE_SCRIPT
+        return {"local": {"theme": "dark"}, "session": {}}
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.cdp.append(cmd)
+        if cmd == "Network.setCookies":
+            for cookie in params["cookies"]:
+                assert cookie["url"] == "http://127.0.0.1:8000/"
+                self.cookies[cookie["name"]] = cookie["value"]
+        if cmd == "Page.addScriptToEvaluateOnNewDocument":
+            self.seeded = params["source"]
+            return {"identifier": "1"}
+        return {}
+
+
+def _cache(tmp_path):
+    return AuthCache(root=str(tmp_path / "auth"))
+
+
+def _form_login(calls):
+    def login(driver, username, password):
+        calls.append(username)
+        token = f"token-{len(calls)}"
+        driver.site.sessions.add(token)
+        driver.cookies["rack.session"] = token
+        driver.current_url = URL
+    return login
+
+
+def _on_secure(driver):
+    return driver.current_url == URL
+
+
+def test_second_login_restores_the_snapshot(tmp_path):
+    site, calls = FakeSite(), []
+    cache = _cache(tmp_path)
+    assert cache.login(FakeDriver(site), "tomsmith", "pw", URL, _form_login(calls), _on_secure) == "login"
+
+    fresh = FakeDriver(site)
+    # a new cache object (another worker) finds the snapshot on disk
+    assert _cache(tmp_path).login(fresh, "tomsmith", "pw", URL, _form_login(calls), _on_secure) == "restored"
+    assert calls == ["tomsmith"] and fresh.current_url == URL
+    assert fresh.cdp[0] == "Network.setCookies" and '"theme": "dark"' in fresh.seeded
+
+    key = AuthCache.key(URL, "tomsmith", "pw")
+    path = os.path.join(cache.root, key + ".json")
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600 and "pw" not in key
+    assert stat.S_IMODE(os.stat(cache.root).st_mode) == 0o700
+
+
+def test_ended_session_logs_in_again(tmp_path):
+    site, calls = FakeSite(), []
+    cache = _cache(tmp_path)
+    cache.login(FakeDriver(site), "tomsmith", "pw", URL, _form_login(calls), _on_secure)
+    site.sessions.clear()       # server restarted / user logged out
+    assert cache.login(FakeDriver(site), "tomsmith", "pw", URL, _form_login(calls), _on_secure) == "login"
+    assert calls == ["tomsmith", "tomsmith"]
+
+
+def test_expired_snapshot_and_other_credentials_are_not_used(tmp_path):
+    site, calls = FakeSite(), []
+    cache = AuthCache(root=str(tmp_path / "auth"), max_age=10)     # closer to expiry than the safety margin
+    cache.login(FakeDriver(site), "tomsmith", "pw", URL, _form_login(calls), _on_secure)
+    assert cache.get(AuthCache.key(URL, "tomsmith", "pw")) is None
+    cache = _cache(tmp_path)
+    cache.login(FakeDriver(site), "tomsmith", "pw", URL, _form_login(calls), _on_secure)
+    cache.login(FakeDriver(site), "other", "pw", URL, _form_login(calls), _on_secure)
+    assert calls == ["tomsmith", "tomsmith", "other"]
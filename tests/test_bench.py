@@ -0,0 +1,32 @@
+# tests/test_bench.py
+"""Checks for selenium_lab.bench (no browser needed)."""
+
+from selenium_lab.bench import Timing, compare, load_baseline, measure, save_baseline
+
+
+def _timing(median_ms):
+    return Timing(5, median_ms, median_ms, median_ms, 0.0)
+
+
+def test_measure_runs_warmup_and_rounds():
+    calls = []
+    timing = measure(lambda: calls.append(1), rounds=4, warmup=2, matches=3)
+    assert len(calls) == 6 and timing.rounds == 4 and timing.extra == {"matches": 3}
+    assert timing.min_ms <= timing.median_ms <= timing.max_ms
+
+
+def test_baseline_round_trip_and_regressions(tmp_path):
+    path = str(tmp_path / "baselines" / "locators.json")
+    save_baseline(path, {"id@1000": _timing(2.0), "xpath@1000": _timing(10.0), "css@1000": _timing(0.2)},
+                  browser="120")
+    baseline = load_baseline(path)
+    assert baseline["xpath@1000"].median_ms == 10.0
+    regressions, lines = compare(baseline, {
+        "id@1000": _timing(2.1),        # within tolerance
+        "xpath@1000": _timing(20.0),    # twice as slow
+        "css@1000": _timing(0.5),       # 2.5x, but only 0.3 ms: noise
+        "id@10000": _timing(3.0),       # not in the baseline
+    })
+    assert regressions == ["xpath@1000"]
+    assert lines[-1].endswith("(new)") and "REGRESSION" in lines[1]
+    assert load_baseline(str(tmp_path / "missing.json")) == {}
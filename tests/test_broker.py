@@ -0,0 +1,91 @@
+# tests/test_broker.py
+"""Checks for selenium_lab.broker using fake drivers behind a real socket (no real browser needed)."""
+
+import socket
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from selenium_lab import broker
+from selenium_lab.broker import Broker, LeasedDriver
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix domain sockets")
+
+
+def _fake_driver(n):
+    driver = mock.MagicMock(window_handles=["main"], session_id=f"session-{n}", capabilities={"browserName": "chrome"})
+    driver.command_executor._url = "http://127.0.0.1:9515"
+    return driver
+
+
+@pytest.fixture
+def running(tmp_path):
+    """A broker with two fake browsers on a socket in tmp_path; yields (path, launched drivers)."""
+    path = str(tmp_path / "broker.sock")
+    launched = []
+
+    def launch():
+        launched.append(_fake_driver(len(launched)))
+        return launched[-1]
+
+    thread = threading.Thread(target=broker.serve, kwargs=dict(path=path, size=2, idle_timeout=0, launch=launch),
+                              daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 5
+    while not broker._ping(path):
+        assert time.monotonic() < deadline, "broker did not start"
+        time.sleep(0.01)
+    yield path, launched
+    broker.request("stop", path)
+    thread.join(5)
+
+
+def test_scripts_attach_to_the_leased_session_and_give_it_back(running):
+    path, launched = running
+    driver = broker.attach(path, start=False)
+    assert isinstance(driver, LeasedDriver)
+    assert driver.session_id.startswith("session-") and driver.attach_ms >= 0
+    status = broker.request("status", path)
+    assert [lease["lease"] for lease in status["leases"]] == [1]
+
+    driver.quit()
+    driver.quit()       # a second quit is harmless
+    status = broker.request("status", path)
+    assert status["leases"] == [] and "released=1" in status["summary"][0]
+    assert len(launched) == 2       # reset and kept, never quit
+    assert not any(d.quit.called for d in launched)
+
+
+def test_closed_connection_counts_as_leak_and_keeps_the_browser(running):
+    path, launched = running
+    conn = broker._connect(path)
+    lease = broker._request(conn, {"op": "lease", "pid": 1, "script": "crashed.py"})
+    conn.close()        # the script died without quit()
+    deadline = time.monotonic() + 5
+    while broker.request("status", path)["leases"]:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    assert "leaked=1" in broker.request("status", path)["summary"][0]
+    driver = broker.attach(path, start=False)
+    assert driver is not None and lease["session_id"] in {d.session_id for d in launched}
+    driver.quit()
+
+
+def test_reaper_takes_back_expired_leases_and_reports_idle():
+    launched = []
+    b = Broker(lambda: launched.append(_fake_driver(len(launched))) or launched[-1], size=1,
+               idle_timeout=60, lease_timeout=10)
+    lease = b.lease(pid=1, script="hung.py")
+    now = time.monotonic()
+    assert b.reap(now + 5) is False and not lease.expired
+    assert b.reap(now + 11) is False        # still leased until it is taken back, so not idle
+    assert lease.expired and b.stats.expired == 1 and launched[0].quit.called
+    assert b.reap(time.monotonic() + 61) is True
+    b.close()
+
+
+def test_no_broker_means_no_lease(tmp_path):
+    assert broker.attach(str(tmp_path / "missing.sock"), start=False) is None
+    assert broker.request("status", str(tmp_path / "missing.sock")) is None
@@ -0,0 +1,127 @@
+# tests/test_browser_pool.py
+"""Checks for selenium_lab.pool using fake drivers (no real browser needed)."""
+
+from selenium.common.exceptions import NoAlertPresentException, WebDriverException
+
+from selenium_lab.pool import BrowserPool
+
+
+class _FakeSwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    @property
+    def alert(self):
+        if not self.driver.alert_open:
+            raise NoAlertPresentException()
+        return self
+
+    def dismiss(self):
+        self.driver.alert_open = False
+
+    def window(self, handle):
+        self.driver.current = handle
+
+    def default_content(self):
+        self.driver.in_frame = False
+
+
+class FakeDriver:
+    def __init__(self):
+        self.switch_to = _FakeSwitchTo(self)
+        self.window_handles = ["main"]
+        self.current = "main"
+        self.alert_open = False
+        self.in_frame = False
+        self.cookies = {"session": "abc"}
+        self.url = "about:blank"
+        self.implicit = None
+        self.quit_called = False
+        self.broken = False
+        self.rect = {"x": 0, "y": 0, "width": 1280, "height": 800}
+
+    def get_window_rect(self):
+        return dict(self.rect)
+
+    def set_window_rect(self, x, y, width, height):
+        self.rect = {"x": x, "y": y, "width": width, "height": height}
+
+    def close(self):
+        self.window_handles.remove(self.current)
+
+    def execute_script(self, script, *args):
+        if self.broken:
+            raise WebDriverException("browser crashed")
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.cookies.clear()
+
+    def get(self, url):
+        self.url = url
+
+    def implicitly_wait(self, seconds):
+        self.implicit = seconds
+
+    def quit(self):
+        self.quit_called = True
+
+
+def test_acquire_reuses_warm_browser():
+    pool = BrowserPool(FakeDriver, size=1, max_uses=10, implicit_wait=10).start()
+    first = pool.acquire()
+    pool.release(first)
+    second = pool.acquire()
+    assert second is first
+    assert pool.stats.hits == 2
+    assert pool.stats.misses == 0
+    assert pool.stats.launches == 1
+    pool.close()
+
+
+def test_reset_clears_windows_alerts_frames_window_size_and_cookies():
+    pool = BrowserPool(FakeDriver, size=1, implicit_wait=10).start()
+    driver = pool.acquire()
+    driver.window_handles.append("popup")
+    driver.current = "popup"
+    driver.alert_open = True
+    driver.in_frame = True
+    driver.url = "https://example.test/secure"
+    driver.implicitly_wait(0)
+    driver.set_window_rect(10, 10, 375, 667)
+
+    pool.release(driver)
+
+    assert driver.window_handles == ["main"] and driver.current == "main"
+    assert not driver.alert_open and not driver.in_frame
+    assert driver.cookies == {}
+    assert driver.url == "about:blank"
+    assert driver.implicit == 10
+    assert driver.rect == {"x": 0, "y": 0, "width": 1280, "height": 800}
+    assert len(pool.stats.reset_seconds) == 1
+    pool.close()
+
+
+def test_browser_recycled_after_max_uses_and_on_failure():
+    pool = BrowserPool(FakeDriver, size=1, max_uses=2).start()
+    first = pool.acquire()
+    pool.release(first)
+    assert pool.acquire() is first
+    pool.release(first)  # second use -> recycled
+    assert first.quit_called
+
+    second = pool.acquire(timeout=5)
+    assert second is not first
+    pool.release(second, failed=True)
+    assert second.quit_called
+    assert pool.stats.recycled == 2
+    pool.close()
+
+
+def test_broken_reset_recycles_browser():
+    pool = BrowserPool(FakeDriver, size=1).start()
+    driver = pool.acquire()
+    driver.broken = True
+    pool.release(driver)
+    assert driver.quit_called
+    assert pool.acquire(timeout=5) is not driver
+    pool.close()
@@ -0,0 +1,60 @@
+# tests/test_columns.py
+"""selenium_lab.columns must give exactly what parse_currency_to_float gives, value for value."""
+
+import importlib.util
+import math
+import os
+import random
+
+import pytest
+
+from selenium_lab.columns import argmax, parse_currency_column, total, unique_values
+
+_SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                       "Exercsies", "Table_Data_Extraction_e5.py")
+_spec = importlib.util.spec_from_file_location("table_data_extraction_e5", _SCRIPT)
+_module = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_module)
+parse_currency_to_float = _module.parse_currency_to_float
+
+EDGE_CASES = [
+    "$50.00", "$1,234.56", "($1,234.56)", "(50)", "()", "(", ")", "", "   ", None,
+    "-$5.00", "$-5.00", "5-", "--5", "1.2.3", ".5", "-.5", "5.", ".", "-", "n/a",
+    " $7.25 ", "( $3.00 )", "(-5)", "1e5", "€ 1.234,56", "0", "(0)", "-0",
+    "$" + "9" * 400, "\x1c(2)\x1f",
+]
+
+
+def _same(a, b):
+    return (a == b and math.copysign(1, a) == math.copysign(1, b)) or (math.isnan(a) and math.isnan(b))
+
+
+def test_edge_cases_match_per_value_parser():
+    parsed = parse_currency_column(EDGE_CASES)
+    for raw, value in zip(EDGE_CASES, parsed):
+        expected = parse_currency_to_float(raw)
+        assert _same(float(value), expected), (raw, value, expected)
+
+
+def test_random_values_match_per_value_parser():
+    rng = random.Random(1234)
+    alphabet = "0123456789.,-$()  abc€"
+    values = ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12))) for _ in range(20000)]
+    values += [f"${rng.uniform(-1e7, 1e7):,.2f}" for _ in range(20000)]
+    parsed = parse_currency_column(values)
+    mismatches = [(v, p) for v, p in zip(values, parsed) if not _same(float(p), parse_currency_to_float(v))]
+    assert not mismatches[:10]
+
+
+def test_value_containing_nul_uses_per_value_path():
+    values = ["(5)\x00", "$1\x002"]
+    assert [float(v) for v in parse_currency_column(values)] == [parse_currency_to_float(v) for v in values]
+
+
+def test_aggregates():
+    dues = parse_currency_column(["$50.00", "$51.00", "$100.00", "$100.00"])
+    assert argmax(dues) == 2  # first of the tied maxima, like max()
+    assert total(dues) == 301.0
+    assert unique_values(["b@x", "a@x", "b@x"]) == sorted({"b@x", "a@x"})
+    with pytest.raises(ValueError):
+        argmax(parse_currency_column([]))
@@ -0,0 +1,83 @@
+# tests/test_command_stats.py
+"""Checks for selenium_lab.command_stats using a fake driver (no real browser needed)."""
+
+import csv
+import json
+import time
+
+from selenium.webdriver.remote.command import Command
+
+from selenium_lab.command_stats import CommandLog, export, instrument, slowest
+
+
+class FakeExecutor:
+    def execute(self, command, params):
+        if command == Command.GET_PAGE_SOURCE:
+            time.sleep(0.01)
+            return {"value": "<html>" + "x" * 1000 + "</html>"}
+        if command == Command.FIND_ELEMENT and params["value"] == "#missing":
+            return {"status": 404, "value": "no such element"}
+        return {"value": {"element-6066-11e4-a52e-4f735466cecf": "abc"}}
+
+
+class FakeDriver:
+    """Only the executor: a real driver's own frames live in selenium and are skipped anyway."""
+
+    def __init__(self):
+        self.command_executor = FakeExecutor()
+
+
+class LoginPage:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def open(self):
+        executor = self.driver.command_executor
+        executor.execute(Command.GET_PAGE_SOURCE, {"sessionId": "fake"})
+        executor.execute(Command.FIND_ELEMENT, {"sessionId": "fake", "using": "css selector", "value": "#username"})
+
+
+def test_commands_are_charged_to_the_page_object_method():
+    driver = FakeDriver()
+    with instrument(driver, test="t::login") as log:
+        LoginPage(driver).open()
+        driver.command_executor.execute(Command.FIND_ELEMENT, {"using": "css selector", "value": "#missing"})
+    source, find, missing = log.commands
+    assert source[0] == Command.GET_PAGE_SOURCE and source[1] >= 0.01
+    assert source[3] > 1000 and find[2] > len("#username")
+    assert source[4] == "LoginPage.open" and "test_command_stats.py:" in source[5]
+    assert missing[4].endswith("test_commands_are_charged_to_the_page_object_method")
+    assert not source[6] and not find[6] and missing[6]
+    assert "execute" not in vars(driver.command_executor)   # unwrapped again
+
+
+def test_histogram_and_report():
+    driver = FakeDriver()
+    with instrument(driver, test="t::slow") as log:
+        for _ in range(3):
+            LoginPage(driver).open()
+    histogram = log.histogram()
+    assert sum(histogram[Command.GET_PAGE_SOURCE]) == 3 and sum(histogram[Command.FIND_ELEMENT]) == 3
+    assert log.histogram_lines()[0].startswith("t::slow: 6 commands")
+    report = slowest([log], top=2)
+    assert report[1].endswith(Command.GET_PAGE_SOURCE)
+    assert "LoginPage.open" in report[report.index("slowest calls:") + 1]
+    assert report[-1].startswith("recording overhead:")
+
+
+def test_report_survives_zero_second_commands():
+    log = CommandLog("t::mocked", [(Command.GET, 0.0, 10, 10, "test", "t.py:1", False)], overhead=0.0001)
+    assert slowest([log])[-1] == "recording overhead: 0.1 ms (0.00% of command time)"
+
+
+def test_export_json_and_csv(tmp_path):
+    driver = FakeDriver()
+    with instrument(driver, test="t::export") as log:
+        LoginPage(driver).open()
+    with open(export([log], str(tmp_path / "out" / "commands.json"))) as f:
+        data = json.load(f)
+    assert data["tests"][0]["commands"] == 2
+    assert [c["command"] for c in data["tests"][0]["calls"]] == [Command.GET_PAGE_SOURCE, Command.FIND_ELEMENT]
+    with open(export([log], str(tmp_path / "commands.csv")), newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 2 and rows[0]["caller"] == "LoginPage.open" and rows[0]["test"] == "t::export"
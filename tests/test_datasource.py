@@ -0,0 +1,78 @@
+# tests/test_datasource.py
+"""Checks for selenium_lab.datasource (no browser needed)."""
+
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from selenium_lab.datasource import DataSource, parse_shard, write_rows
+
+
+def _rows(n):
+    # uneven line lengths so split boundaries land mid-line
+    return ({"username": f"user{i}", "password": "x" * (i % 17), "ok": str(i % 3 == 0)} for i in range(n))
+
+
+@pytest.mark.parametrize("name", ["rows.csv", "rows.jsonl"])
+def test_every_row_is_in_exactly_one_split(tmp_path, name):
+    path = write_rows(str(tmp_path / name), _rows(1000))
+    source = DataSource(path, split_bytes=997)
+    splits = source.splits()
+    assert len(splits) > 20
+    seen = [row["username"] for split in splits for row in source.rows(split)]
+    assert seen == [f"user{i}" for i in range(1000)]
+
+
+def test_shards_partition_and_sampling_is_stable(tmp_path):
+    path = write_rows(str(tmp_path / "rows.csv"), _rows(2000))
+    everything = {row["username"] for row in DataSource(path, split_bytes=1000)}
+    shards = [{row["username"] for row in DataSource(path, split_bytes=1000, shard=(i, 3))} for i in range(3)]
+    assert set().union(*shards) == everything and sum(map(len, shards)) == len(everything)
+
+    sampled = [row["username"] for row in DataSource(path, sample=0.1, seed=7)]
+    assert 120 <= len(sampled) <= 280
+    assert sampled == [row["username"] for row in DataSource(path, sample=0.1, seed=7, split_bytes=500)]
+    assert sampled != [row["username"] for row in DataSource(path, sample=0.1, seed=8)]
+
+
+def test_where_head_and_shard_setting(tmp_path):
+    path = write_rows(str(tmp_path / "rows.jsonl"), _rows(100))
+    source = DataSource(path, where=lambda row: row["ok"] == "True")
+    assert [row["username"] for row in source.head(3)] == ["user0", "user3", "user6"]
+    assert parse_shard("2/8") == (2, 8) and parse_shard("") is None
+    with pytest.raises(ValueError):
+        parse_shard("8/8")
+
+
+def test_parquet_row_groups(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = str(tmp_path / "rows.parquet")
+    pq.write_table(pa.Table.from_pylist(list(_rows(100))), path, row_group_size=30)
+    source = DataSource(path)
+    assert len(source.splits()) == 4
+    assert [row["username"] for row in source][-1] == "user99"
+
+
+def test_marked_test_runs_once_per_split(tmp_path):
+    write_rows(str(tmp_path / "rows.csv"), _rows(500))
+    (tmp_path / "test_rows.py").write_text(textwrap.dedent("""
+        import pytest
+
+        seen = []
+
+        @pytest.mark.data("rows.csv", split_bytes=2000)
+        def test_rows(data_rows):
+            seen.extend(row["username"] for row in data_rows)
+
+        def test_all_rows_seen():
+            assert len(seen) == len(set(seen)) == 500
+    """))
+    proc = subprocess.run([sys.executable, "-m", "pytest", "-p", "selenium_lab.pytest_plugin",
+                           "-p", "no:cacheprovider", "-q", str(tmp_path)], capture_output=True, text=True)
+    assert " passed" in proc.stdout and "failed" not in proc.stdout, proc.stdout
+    assert "test_rows[part0]" in subprocess.run(
+        [sys.executable, "-m", "pytest", "-p", "selenium_lab.pytest_plugin", "-p", "no:cacheprovider",
+         "--collect-only", "-q", str(tmp_path)], capture_output=True, text=True).stdout
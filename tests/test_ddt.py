@@ -0,0 +1,71 @@
+# tests/test_ddt.py
+"""Checks for selenium_lab.ddt (no browser needed; the last one runs a small suite with mock drivers)."""
+
+import os
+import subprocess
+import sys
+import textwrap
+from types import SimpleNamespace
+
+from selenium_lab.ddt import keep_rows_together, row_group
+
+
+def _item(nodeid, ddt=True):
+    item = SimpleNamespace(nodeid=nodeid, get_closest_marker=lambda name: object() if ddt else None)
+    if "[" in nodeid:
+        item.callspec = object()
+    return item
+
+
+def test_rows_of_a_group_run_together():
+    items = [_item("t.py::test_login[a]"), _item("t.py::test_other"), _item("t.py::test_login[b]"),
+             _item("t.py::test_plain[x]", ddt=False), _item("t.py::test_login[c]")]
+    assert row_group(items[0]) == "t.py::test_login" and row_group(items[3]) is None
+    keep_rows_together(items)
+    assert [item.nodeid for item in items] == [
+        "t.py::test_login[a]", "t.py::test_login[b]", "t.py::test_login[c]", "t.py::test_other", "t.py::test_plain[x]",
+    ]
+
+
+def test_rows_share_a_browser_until_one_fails(tmp_path):
+    (tmp_path / "conftest.py").write_text(textwrap.dedent("""
+        from unittest import mock
+
+        import pytest
+
+        launched = []
+
+
+        def launch():
+            driver = mock.MagicMock(window_handles=["main"])
+            launched.append(driver)
+            return driver
+
+
+        @pytest.fixture
+        def driver(ddt_rows):
+            with ddt_rows(launch) as driver:
+                yield driver
+    """))
+    (tmp_path / "test_rows.py").write_text(textwrap.dedent("""
+        import pytest
+
+        from conftest import launched
+
+
+        @pytest.mark.ddt
+        @pytest.mark.parametrize("row", [1, 2, 3, 4])
+        def test_row(driver, row):
+            assert row != 2
+
+
+        def test_after_the_group():
+            assert len(launched) == 2
+            assert all(driver.quit.called for driver in launched)
+    """))
+    proc = subprocess.run([sys.executable, "-m", "pytest", "-p", "selenium_lab.pytest_plugin",
+                           "-p", "no:cacheprovider", str(tmp_path)],
+                          capture_output=True, text=True,
+                          env=dict(os.environ, SELENIUM_LAB_DURATIONS_FILE=str(tmp_path / "durations.json")))
+    assert "1 failed, 4 passed" in proc.stdout, proc.stdout
+    assert "rows=4 in groups=1: launches=2 (relaunched after failure=1) instead of 4" in proc.stdout
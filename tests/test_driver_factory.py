@@ -0,0 +1,109 @@
+# tests/test_driver_factory.py
+"""Checks for the cached chromedriver resolution in selenium_lab.driver_factory (no browser needed)."""
+
+import os
+import sys
+import types
+
+import pytest
+
+from selenium_lab import config, driver_factory
+from selenium_lab.locking import read_json, write_json_atomic
+
+
+@pytest.fixture
+def fake_install(tmp_path, monkeypatch):
+    """A fake chrome binary + chromedriver, with the cache redirected to tmp_path."""
+    chrome = tmp_path / "chrome"
+    chrome.write_text("")
+    chromedriver = tmp_path / "chromedriver"
+    chromedriver.write_text("")
+    monkeypatch.setattr(config, "CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(config, "CHROME_BINARY", str(chrome))
+    monkeypatch.setattr(config, "PINNED_CHROMEDRIVER", None)
+    monkeypatch.setattr(config, "OFFLINE", True)
+    monkeypatch.setattr(driver_factory, "_resolved_path", None)
+    monkeypatch.setattr(driver_factory, "detect_browser_version", lambda binary: "120.0.6099.109")
+    return chrome, chromedriver
+
+
+def test_manifest_hit_needs_no_version_check(fake_install, monkeypatch):
+    chrome, chromedriver = fake_install
+    write_json_atomic(driver_factory.manifest_path(), {
+        "browsers": {str(chrome): {"mtime": os.stat(chrome).st_mtime, "version": "120.0.6099.109"}},
+        "drivers": {"120.0.6099.109": {"path": str(chromedriver), "resolved_at": "2025-01-01T00:00:00"}},
+    })
+
+    def fail(binary):
+        raise AssertionError("browser version should come from the manifest")
+
+    monkeypatch.setattr(driver_factory, "detect_browser_version", fail)
+    assert driver_factory.resolve_chromedriver() == str(chromedriver)
+
+
+def test_undetectable_version_is_remembered_for_the_fast_path(fake_install, monkeypatch):
+    chrome, chromedriver = fake_install
+    installs = []
+    manager = types.SimpleNamespace(install=lambda: installs.append(1) or str(chromedriver))
+    monkeypatch.setitem(sys.modules, "webdriver_manager", types.ModuleType("webdriver_manager"))
+    monkeypatch.setitem(sys.modules, "webdriver_manager.chrome",
+                        types.SimpleNamespace(ChromeDriverManager=lambda: manager))
+    monkeypatch.setattr(config, "OFFLINE", False)
+    monkeypatch.setattr(driver_factory, "detect_browser_version", lambda binary: None)
+    assert driver_factory.resolve_chromedriver() == str(chromedriver)
+
+    def fail(binary):
+        raise AssertionError("a failed version check should not be repeated")
+
+    monkeypatch.setattr(driver_factory, "detect_browser_version", fail)
+    monkeypatch.setattr(driver_factory, "_resolved_path", None)     # a new process
+    monkeypatch.setattr(driver_factory, "locked", None)             # and no lock either
+    assert driver_factory.resolve_chromedriver() == str(chromedriver) and len(installs) == 1
+
+
+def test_offline_falls_back_to_pinned_binary_and_records_version(fake_install, monkeypatch):
+    chrome, chromedriver = fake_install
+    monkeypatch.setattr(config, "PINNED_CHROMEDRIVER", str(chromedriver))
+    monkeypatch.setattr(driver_factory.shutil, "which", lambda name: None)
+    installs = []
+
+    def install():
+        installs.append(1)
+        raise ConnectionError("no network")
+
+    monkeypatch.setitem(sys.modules, "webdriver_manager", types.ModuleType("webdriver_manager"))
+    monkeypatch.setitem(sys.modules, "webdriver_manager.chrome",
+                        types.SimpleNamespace(ChromeDriverManager=lambda: types.SimpleNamespace(install=install)))
+    monkeypatch.setattr(config, "OFFLINE", False)
+
+    assert driver_factory.resolve_chromedriver() == str(chromedriver)
+    manifest = read_json(driver_factory.manifest_path())
+    assert manifest["browsers"][str(chrome)]["version"] == "120.0.6099.109"
+    entry = manifest["drivers"]["120.0.6099.109"]
+    assert entry["path"] == str(chromedriver) and entry["fallback"] is True
+    assert len(installs) == 1
+
+    monkeypatch.setattr(driver_factory, "_resolved_path", None)     # a new process
+    assert driver_factory.resolve_chromedriver() == str(chromedriver)
+    assert len(installs) == 1       # no second network attempt
+
+    monkeypatch.setattr(driver_factory, "_resolved_path", None)
+    monkeypatch.setattr(driver_factory, "FALLBACK_RETRY", -1)        # backoff over: try online again
+    driver_factory.resolve_chromedriver()
+    assert len(installs) == 2
+
+
+def test_offline_prefers_driver_for_same_major_version(fake_install, tmp_path):
+    chrome, _ = fake_install
+    older = tmp_path / "chromedriver-120-old"
+    older.write_text("")
+    write_json_atomic(driver_factory.manifest_path(), {
+        "drivers": {"120.0.6000.0": {"path": str(older), "resolved_at": "2024-12-01T00:00:00"}},
+    })
+    assert driver_factory.resolve_chromedriver() == str(older)
+
+
+def test_offline_without_any_driver_raises(fake_install, monkeypatch):
+    monkeypatch.setattr(driver_factory.shutil, "which", lambda name: None)
+    with pytest.raises(driver_factory.DriverResolutionError):
+        driver_factory.resolve_chromedriver()
@@ -0,0 +1,130 @@
+# tests/test_fixture_server.py
+"""HTTP-level checks for the local the-internet stand-in (no browser needed)."""
+
+import gzip
+import http.cookiejar
+import urllib.error
+import urllib.parse
+import urllib.request
+
+import pytest
+
+from selenium_lab.fixture_server import FixtureServer
+
+
+@pytest.fixture(scope="module")
+def server():
+    with FixtureServer(dynamic_delay=0.2) as server:
+        yield server
+
+
+@pytest.fixture
+def browser():
+    """urllib opener that keeps cookies, like a browser session."""
+    return urllib.request.build_opener(urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar()))
+
+
+def _text(response):
+    return response.read().decode("utf-8")
+
+
+def _login(browser, server, username, password):
+    data = urllib.parse.urlencode({"username": username, "password": password}).encode()
+    return browser.open(server.url + "/authenticate", data=data)
+
+
+@pytest.mark.parametrize("username,password,message", [
+    ("tomsmith", "SuperSecretPassword!", "You logged into a secure area!"),
+    ("tomsmith", "wrongpass", "Your password is invalid!"),
+    ("invalid_user", "invalid_pass", "Your username is invalid!"),
+])
+def test_login_flash_messages(server, browser, username, password, message):
+    page = _text(_login(browser, server, username, password))
+    assert message in page
+    # flash is shown only once
+    assert message not in _text(browser.open(server.url + "/login"))
+
+
+def test_secure_area_requires_login_and_logout_clears_it(server, browser):
+    assert "You must login to view the secure area!" in _text(browser.open(server.url + "/secure"))
+    _login(browser, server, "tomsmith", "SuperSecretPassword!")
+    assert "Secure Area" in _text(browser.open(server.url + "/secure"))
+    assert "You logged out of the secure area!" in _text(browser.open(server.url + "/logout"))
+    assert "You must login" in _text(browser.open(server.url + "/secure"))
+
+
+def test_upload_echoes_file_name(server, browser):
+    boundary = "----lab-boundary"
+    body = (
+        f"--{boundary}\r\n"
+        'Content-Disposition: form-data; name="file"; filename="test_file.txt"\r\n'
+        "Content-Type: text/plain\r\n\r\n"
+        "hello\r\n"
+        f"--{boundary}--\r\n"
+    ).encode()
+    request = urllib.request.Request(server.url + "/upload", data=body, headers={
+        "Content-Type": f"multipart/form-data; boundary={boundary}",
+    })
+    page = _text(browser.open(request))
+    assert "File Uploaded!" in page
+    assert "test_file.txt" in page
+    assert server.uploads[-1] == ("test_file.txt", 5)
+
+
+def test_pages_are_served_gzipped_with_etag(server):
+    request = urllib.request.Request(server.url + "/tables", headers={"Accept-Encoding": "gzip"})
+    response = urllib.request.urlopen(request)
+    assert response.headers["Content-Encoding"] == "gzip"
+    page = gzip.decompress(response.read()).decode("utf-8")
+    assert 'id="table1"' in page and "$100.00" in page
+
+    request.add_header("If-None-Match", response.headers["ETag"])
+    with pytest.raises(urllib.error.HTTPError) as err:
+        urllib.request.urlopen(request)
+    assert err.value.code == 304
+
+
+def test_dynamic_loading_delay_is_configurable(server):
+    assert "}, 200);" in _text(urllib.request.urlopen(server.url + "/dynamic_loading/1"))
+    assert "}, 50);" in _text(urllib.request.urlopen(server.url + "/dynamic_loading/2?delay=0.05"))
+
+
+def test_generated_form_has_the_requested_fields(server):
+    page = _text(urllib.request.urlopen(server.url + "/form?fields=12"))
+    assert page.count('name="field-') == 12 + 2  # the radio group has three inputs
+    assert "window.formEvents" in page
+
+
+def test_generated_frames_nest_the_target(server):
+    page = _text(urllib.request.urlopen(server.url + "/frames?count=5&depth=2"))
+    assert page.count('class="widget"') == 5
+    # widget -> level-1 -> level-2 -> input: each srcdoc level escapes once more
+    assert "&amp;amp;lt;input id=&amp;amp;quot;target&amp;amp;quot;" in page
+
+
+def test_generated_locator_page_scales_with_nodes(server):
+    for nodes in (1000, 10000):
+        page = _text(urllib.request.urlopen(server.url + f"/locators?nodes={nodes}"))
+        elements = page.count("<") - page.count("</") - page.count("<!")
+        assert 0.9 * nodes <= elements <= 1.1 * nodes
+        assert page.count('id="target-id"') == 1 and page.index("item-link") < page.index("target-link")
+
+
+def test_query_variants_are_kept_in_a_bounded_cache(monkeypatch):
+    monkeypatch.setattr("selenium_lab.fixture_server.server.VARIANT_CACHE_SIZE", 3)
+    with FixtureServer() as server:
+        pinned = len(server._cache)
+        for fields in range(1, 8):
+            urllib.request.urlopen(server.url + f"/form?fields={fields}").read()
+        assert len(server._cache) == pinned
+        assert [key[2] for key in server._variants] == [(("fields", n),) for n in (5, 6, 7)]
+        assert "window.formEvents" in _text(urllib.request.urlopen(server.url + "/form"))
+
+
+def test_bad_query_values_get_400_and_sizes_are_clamped(server):
+    for query in ("/locators?nodes=abc", "/form?fields=1.5", "/dynamic_loading/1?delay=nan"):
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(server.url + query)
+        assert error.value.code == 400
+    page = _text(urllib.request.urlopen(server.url + "/frames?count=100000&depth=-3"))
+    assert page.count('class="widget"') == 500
@@ -0,0 +1,102 @@
+# tests/test_flight_recorder.py
+"""Checks for selenium_lab.flight_recorder using a fake driver (no real browser needed)."""
+
+import base64
+import json
+
+import pytest
+from selenium.common.exceptions import ElementClickInterceptedException, UnexpectedAlertPresentException
+from selenium.webdriver.remote.command import Command
+
+from selenium_lab.artifacts import store_for
+from selenium_lab.flight_recorder import SNAPSHOT_SCRIPT, record, recorder_stats
+
+
+@pytest.fixture(autouse=True)
+def _clean_stats():
+    recorder_stats.reset()
+    yield
+    recorder_stats.reset()
+
+
+class FakeDriver:
+    """``html`` is the current page; clicks append a line to it."""
+
+    def __init__(self):
+        self.html = "<html><body>\n<p>start</p>\n</body></html>"
+        self.commands = []
+        self.alert = False
+
+    def execute(self, command, params=None):
+        self.commands.append(command)
+        if command == Command.CLICK_ELEMENT:
+            if params.get("id") == "covered":
+                raise ElementClickInterceptedException("another element would receive the click")
+            self.html = self.html.replace("</body>", f"<p>clicked {params['id']}</p>\n</body>")
+        return {"value": None}
+
+    def execute_script(self, script, last_hash):
+        assert script == SNAPSHOT_SCRIPT
+        if self.alert:
+            raise UnexpectedAlertPresentException("alert open")
+        digest = format(hash(self.html) & 0xFFFFFFFF, "x")
+        return {"url": "http://127.0.0.1/form", "title": "Form", "hash": digest,
+                "html": None if digest == last_hash else self.html, "width": 800, "height": 600}
+
+    def execute_cdp_cmd(self, cmd, params):
+        assert cmd == "Page.captureScreenshot" and params["clip"]["scale"] == 0.25
+        return {"data": base64.b64encode(b"tiny jpeg").decode("ascii")}
+
+
+def test_snapshots_at_page_changing_commands_only_and_dom_only_when_changed():
+    driver = FakeDriver()
+    with record(driver, screenshots=False) as recorder:
+        driver.execute(Command.GET, {"url": "http://127.0.0.1/form"})
+        driver.execute(Command.GET_TITLE)              # reading the page is not a boundary
+        driver.execute(Command.REFRESH)                # same DOM as before
+        driver.execute(Command.CLICK_ELEMENT, {"id": "submit"})
+    assert "execute" not in vars(driver)
+    assert [s.command for s in recorder.ring] == [Command.GET, Command.REFRESH, Command.CLICK_ELEMENT]
+    assert [s.dom is not None for s in recorder.ring] == [True, False, True]
+
+    timeline = recorder.timeline()
+    assert "+<p>clicked submit</p>" in timeline[2]["diff"] and "diff" not in timeline[1]
+
+
+def test_ring_is_bounded_and_keeps_a_dom_for_its_oldest_entry():
+    driver = FakeDriver()
+    with record(driver, size=3, screenshots=False) as recorder:
+        driver.execute(Command.GET, {"url": "http://127.0.0.1/form"})
+        for _ in range(5):
+            driver.execute(Command.REFRESH)
+    assert [s.seq for s in recorder.ring] == [4, 5, 6]
+    assert recorder.ring[0].dom is not None and recorder.nbytes == recorder.ring[0].nbytes
+
+    with record(driver, max_bytes=1, screenshots=True) as recorder:
+        for name in "abc":
+            driver.execute(Command.CLICK_ELEMENT, {"id": name})
+    assert len(recorder.ring) == 1 and recorder.ring[0].screenshot == b"tiny jpeg"
+
+
+def test_failed_commands_are_recorded_and_snapshot_errors_swallowed():
+    driver = FakeDriver()
+    with record(driver, screenshots=False) as recorder:
+        with pytest.raises(ElementClickInterceptedException):
+            driver.execute(Command.CLICK_ELEMENT, {"id": "covered"})
+        driver.alert = True
+        driver.execute(Command.CLICK_ELEMENT, {"id": "opens-alert"})
+    assert recorder.ring[0].command == Command.CLICK_ELEMENT and recorder.ring[0].dom is not None
+    assert recorder.ring[1].error.startswith("alert open")
+
+
+def test_dump_writes_the_ring_to_the_artifact_store(tmp_path):
+    driver = FakeDriver()
+    with record(driver) as recorder:
+        driver.execute(Command.GET, {"url": "http://127.0.0.1/form"})
+        driver.execute(Command.CLICK_ELEMENT, {"id": "submit"})
+    names = recorder.dump("tests_test_form.py__test_submit", root=str(tmp_path))
+    store = store_for(str(tmp_path))
+    assert store.flush() == []
+    assert sum(name.endswith(".jpg") for name in names) == 2 and sum(name.endswith(".html") for name in names) == 2
+    timeline = json.loads(store.load(names[0]))
+    assert [entry["seq"] for entry in timeline] == [1, 2]
@@ -0,0 +1,66 @@
+# tests/test_forms.py
+"""Checks for the Python side of selenium_lab.forms using a fake driver (no real browser needed)."""
+
+import pytest
+from selenium.webdriver.common.by import By
+
+from selenium_lab.forms import FILL_SCRIPT, Native, fill_form
+
+
+class FakeElement:
+    def __init__(self):
+        self.calls = []
+
+    def clear(self):
+        self.calls.append("clear")
+
+    def send_keys(self, text):
+        self.calls.append(("send_keys", text))
+
+
+class FakeDriver:
+    """Returns ``raw`` from FILL_SCRIPT and remembers what it was sent."""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.scripts = []
+
+    def execute_script(self, script, entries, native):
+        assert script == FILL_SCRIPT
+        self.scripts.append((entries, native))
+        return self.raw
+
+
+def test_everything_goes_out_in_one_script_call():
+    driver = FakeDriver({"set": 3, "native": [], "errors": []})
+    result = fill_form(driver, {
+        (By.NAME, "my-text"): "SoochiTara",
+        (By.NAME, "my-select"): "2",
+        (By.ID, "my-check-1"): False,
+    })
+    assert result.scripted == 3 and not result.typed and len(result) == 3
+    (entries, native), = driver.scripts
+    assert native is False
+    assert entries == [["name", "my-text", "SoochiTara", False], ["name", "my-select", "2", False],
+                       ["id", "my-check-1", False, False]]
+
+
+def test_native_fields_are_typed_and_files_are_not_cleared():
+    keyed, upload = FakeElement(), FakeElement()
+    driver = FakeDriver({"set": 1, "native": [[1, keyed, False], [2, upload, True]], "errors": []})
+    result = fill_form(driver, {
+        (By.NAME, "a"): "scripted",
+        (By.NAME, "b"): Native("typed"),
+        (By.NAME, "file"): "/tmp/pic.png",
+    }, native=True)
+    assert driver.scripts[0][0][1] == ["name", "b", "typed", True]
+    assert keyed.calls == ["clear", ("send_keys", "typed")]
+    assert upload.calls == [("send_keys", "/tmp/pic.png")]
+    assert result.typed == [(By.NAME, "b"), (By.NAME, "file")]
+
+
+def test_problems_are_reported_together():
+    driver = FakeDriver({"set": 1, "native": [], "errors": [[1, "not found"], [2, 'no option "Nope"']]})
+    with pytest.raises(LookupError) as err:
+        fill_form(driver, {(By.NAME, "ok"): "x", (By.NAME, "missing"): "y", (By.NAME, "my-select"): "Nope"})
+    assert "missing" in str(err.value) and "Nope" in str(err.value)
@@ -0,0 +1,108 @@
+# tests/test_frames.py
+"""Checks for selenium_lab.frames using a fake driver (no real browser needed)."""
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+from selenium_lab.frames import FRAME_INDEX_SCRIPT, STATE_SCRIPT, find_anywhere
+
+TARGET = (By.ID, "target")
+
+
+class FakeSwitch:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def default_content(self):
+        self.driver.path = []
+
+    def frame(self, index):
+        self.driver.path = self.driver.path + [index]
+        self.driver.switches += 1
+
+
+class FakeDriver:
+    """A page whose frames are ``documents``: path tuple -> {"elements": [...], "opaque": bool}."""
+
+    def __init__(self, documents, url="http://127.0.0.1/frames"):
+        self.documents = documents
+        self.url = url
+        self.generation = 0
+        self.path = []
+        self.switches = 0
+        self.scripts = []
+        self.switch_to = FakeSwitch(self)
+
+    def _walk(self, root, locators):
+        """What FRAME_INDEX_SCRIPT reports when run in the document at ``root``."""
+        def hits(path):
+            return [i for i, (by, value) in enumerate(locators) if value in self.documents[path]["elements"]]
+
+        frames, stack = [], [root]
+        while stack:
+            parent = stack.pop(0)
+            for path in sorted(self.documents):
+                if len(path) == len(parent) + 1 and path[:len(parent)] == parent:
+                    opaque = self.documents[path].get("opaque", False)
+                    frames.append({"path": list(path[len(root):]), "name": "", "src": "",
+                                   "opaque": opaque, "hits": [] if opaque else hits(path)})
+                    if not opaque:
+                        stack.append(path)
+        return {"url": self.url, "generation": self.generation, "hits": hits(root), "frames": frames}
+
+    def execute_script(self, script, *args):
+        self.scripts.append(script)
+        if script == STATE_SCRIPT:
+            return [self.url, self.generation]
+        assert script == FRAME_INDEX_SCRIPT
+        return self._walk(tuple(self.path), [tuple(locator) for locator in args[0]])
+
+    def find_elements(self, by, value):
+        return [f"{value}@{self.path}"] if value in self.documents[tuple(self.path)]["elements"] else []
+
+
+def _page():
+    documents = {(): {"elements": ["header"]}}
+    for i in range(10):
+        documents[(i,)] = {"elements": ["ad"]}
+    documents[(9, 0)] = {"elements": []}
+    documents[(9, 0, 0)] = {"elements": ["target"]}
+    return documents
+
+
+def test_one_script_maps_nested_frames_and_switches_straight_there():
+    driver = FakeDriver(_page())
+    assert find_anywhere(driver, TARGET) == "target@[9, 0, 0]"
+    assert driver.scripts == [FRAME_INDEX_SCRIPT] and driver.switches == 3
+
+
+def test_cached_map_is_reused_until_the_frame_generation_changes():
+    driver = FakeDriver(_page())
+    find_anywhere(driver, TARGET)
+    driver.scripts.clear()
+    assert find_anywhere(driver, TARGET) == "target@[9, 0, 0]"
+    assert driver.scripts == [STATE_SCRIPT]
+
+    # an iframe was inserted before the widget: paths shift, the map is rebuilt
+    driver.documents = {(): {"elements": []}, (0,): {"elements": []}, (1,): {"elements": ["target"]}}
+    driver.generation += 1
+    driver.scripts.clear()
+    assert find_anywhere(driver, TARGET) == "target@[1]"
+    assert driver.scripts == [STATE_SCRIPT, FRAME_INDEX_SCRIPT]
+
+
+def test_cross_origin_frames_are_entered_once():
+    documents = _page()
+    documents[(3,)] = {"elements": [], "opaque": True}
+    documents[(3, 0)] = {"elements": ["login"]}
+    driver = FakeDriver(documents)
+    assert find_anywhere(driver, (By.NAME, "login")) == "login@[3, 0]"
+    assert driver.scripts == [FRAME_INDEX_SCRIPT, FRAME_INDEX_SCRIPT]
+
+
+def test_missing_everywhere_raises_and_returns_to_the_top():
+    driver = FakeDriver(_page())
+    with pytest.raises(NoSuchElementException, match="any of its 12 frames"):
+        find_anywhere(driver, (By.ID, "nope"))
+    assert driver.path == []
@@ -1,37 +1,17 @@
 # tests/test_google_search.py
-import time
 import traceback
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
-def _try_click_any(driver, wait, xpaths):
-    """Try several xpaths; return True if clicked one, else False."""
-    for xp in xpaths:
-        try:
-            el = wait.until(EC.element_to_be_clickable((By.XPATH, xp)))
-            el.click()
-            return True
-        except Exception:
-            # skip and try next
-            continue
-    return False
+from selenium_lab.artifacts import save_debug
+from selenium_lab.settle import settle
+from selenium_lab.waits import click_first
 
-def _save_debug(driver, name_prefix="failure"):
-    """Save screenshot and page source to driver's debug folder (from conftest tmp_path)."""
-    try:
-        ts = time.strftime("%Y%m%d-%H%M%S")
-        folder = getattr(driver, "_debug_dir", None) or "."
-        png = f"{folder}/{name_prefix}-{ts}.png"
-        html = f"{folder}/{name_prefix}-{ts}.html"
-        driver.save_screenshot(png)
-        with open(html, "w", encoding="utf-8") as f:
-            f.write(driver.page_source)
-        print(f"[debug saved] screenshot: {png}")
-        print(f"[debug saved] page source: {html}")
-    except Exception as e:
-        print("Failed to save debug info:", e)
+def _try_click_any(driver, xpaths, timeout=5):
+    """Race all xpaths in one script per poll; return True if one was clicked, else False."""
+    return click_first(driver, [(By.XPATH, xp) for xp in xpaths], timeout=timeout) is not None
 
 def test_google_search(driver):
     wait = WebDriverWait(driver, 15)  # explicit wait for key elements
@@ -51,10 +31,10 @@ def test_google_search(driver):
             "//button[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'agree')]",
             "//button[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'accept')]",
         ]
-        clicked = _try_click_any(driver, wait, consent_xpaths)
+        clicked = _try_click_any(driver, consent_xpaths)
         if clicked:
             # short pause to let overlay disappear
-            time.sleep(0.5)
+            settle(driver)
 
         # Wait for the search input. Using CSS selector is more stable here.
         search_box = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, 'input[name="q"]')))
@@ -67,8 +47,8 @@ def test_google_search(driver):
         assert "Selenium WebDriver" in driver.title
 
     except Exception as e:
-        # Save screenshot + page source to help debug
+        # Queue screenshot + page source (written in the background, debug/ by default)
         print("TEST EXCEPTION:", e)
         traceback.print_exc()
-        _save_debug(driver, name_prefix="test_google_search_failure")
+        save_debug(driver, "test_google_search_failure")
         raise
@@ -0,0 +1,89 @@
+# tests/test_page.py
+"""Checks for selenium_lab.page using a fake driver (no real browser needed)."""
+
+import itertools
+
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webelement import WebElement
+
+from selenium_lab.page import BasePage, Element, LazyElement, element_stats
+
+
+class FakeDriver:
+    """Element ids stay valid until navigate() replaces the document."""
+
+    _is_remote = False
+
+    def __init__(self):
+        self._ids = itertools.count()
+        self.document = {}
+        self.finds = 0
+        self.typed = []
+
+    def navigate(self):
+        self.document = {}
+
+    def find_element(self, by, value):
+        self.finds += 1
+        element_id = self.document.setdefault((by, value), f"el-{next(self._ids)}")
+        return WebElement(self, element_id)
+
+    def execute(self, command, params):
+        if params["id"] not in self.document.values():
+            raise StaleElementReferenceException()
+        if command == Command.SEND_KEYS_TO_ELEMENT:
+            self.typed.append((params["id"], params["text"]))
+        return {"value": None}
+
+
+class LoginPage(BasePage):
+    USERNAME_INPUT = Element(By.ID, "username")
+    PASSWORD_INPUT = Element(By.ID, "password")
+    PATH = "/login"
+
+    def login(self, username, password):
+        self.USERNAME_INPUT.clear()
+        self.USERNAME_INPUT.send_keys(username)
+        self.PASSWORD_INPUT.clear()
+        self.PASSWORD_INPUT.send_keys(password)
+
+
+@pytest.fixture(autouse=True)
+def _clean_stats():
+    element_stats.reset()
+    yield
+    element_stats.reset()
+
+
+def test_locator_is_a_plain_tuple_on_the_class():
+    assert LoginPage.USERNAME_INPUT == (By.ID, "username")
+    by, value = LoginPage.PASSWORD_INPUT
+    assert (by, value) == (By.ID, "password")
+
+
+def test_elements_are_found_lazily_once_per_page():
+    driver = FakeDriver()
+    page = LoginPage(driver)
+    assert isinstance(page.USERNAME_INPUT, LazyElement) and driver.finds == 0
+    page.login("tomsmith", "secret")
+    assert driver.finds == 2  # was 4 with find_element per call
+    assert [text for _, text in driver.typed] == ["tomsmith", "secret"]
+    assert element_stats.finds == 2 and element_stats.saved == 2
+
+
+def test_stale_element_is_found_again_transparently():
+    driver = FakeDriver()
+    page = LoginPage(driver)
+    page.login("tomsmith", "secret")
+    driver.navigate()  # same page loaded again: the cached ids are stale now
+    page.login("invalid_user", "nope")
+    assert [text for _, text in driver.typed[-2:]] == ["invalid_user", "nope"]
+    assert element_stats.stale == 2 and driver.finds == 4
+
+
+def test_locators_cannot_be_overwritten_on_an_instance():
+    with pytest.raises(AttributeError):
+        LoginPage(FakeDriver()).USERNAME_INPUT = (By.ID, "other")
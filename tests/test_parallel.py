@@ -0,0 +1,112 @@
+# tests/test_parallel.py
+"""Checks for selenium_lab.parallel (no browser needed; the last one starts real pytest workers)."""
+
+import json
+import os
+import re
+import subprocess
+import sys
+import textwrap
+
+from selenium_lab import config, parallel
+from selenium_lab.parallel import DurationHistory, shard
+
+
+def test_longest_first_keeps_workers_even():
+    expected = {"slow": 8.0, "a": 5.0, "b": 4.0, "c": 3.0, "d": 2.0}
+    shards, loads = shard(expected, 2)
+    assert loads == [11.0, 11.0]
+    assert shards[0][0] == "slow"       # longest test starts first
+    assert sorted(sum(shards, [])) == sorted(expected)
+
+
+def test_ddt_rows_are_sharded_as_one_unit():
+    expected = {"t::rows[1]": 3.0, "t::rows[2]": 3.0, "t::rows[3]": 3.0, "t::a": 5.0, "t::b": 4.0}
+    groups = {"t::rows[1]": "t::rows", "t::rows[2]": "t::rows", "t::rows[3]": "t::rows"}
+    shards, loads = shard(expected, 2, groups)
+    assert shards[0] == ["t::rows[1]", "t::rows[2]", "t::rows[3]"] and loads == [9.0, 9.0]
+
+
+def test_collect_reads_ddt_groups_from_the_plugin(tmp_path):
+    (tmp_path / "test_rows.py").write_text(textwrap.dedent("""
+        import pytest
+
+        @pytest.mark.ddt
+        @pytest.mark.parametrize("row", [1, 2])
+        def test_rows(row):
+            pass
+
+        def test_plain():
+            pass
+    """))
+    groups = parallel.collect(["-p", "selenium_lab.pytest_plugin", "--rootdir", str(tmp_path), str(tmp_path)])
+    assert groups == {"test_rows.py::test_rows[1]": "test_rows.py::test_rows",
+                      "test_rows.py::test_rows[2]": "test_rows.py::test_rows",
+                      "test_rows.py::test_plain": "test_rows.py::test_plain"}
+
+
+def test_collect_without_plugin_keeps_only_the_node_id_block(monkeypatch):
+    stdout = textwrap.dedent("""
+        tests/test_a.py::test_one
+        tests/test_a.py::test_two[a b]
+
+        2 tests collected in 0.01s
+        tests/test_a.py::test_one
+          /x.py:3: DeprecationWarning: old:: api
+    """).lstrip("\n")
+    monkeypatch.setattr(parallel.subprocess, "run",
+                        lambda *args, **kwargs: subprocess.CompletedProcess(args, 0, stdout, ""))
+    assert list(parallel.collect([])) == ["tests/test_a.py::test_one", "tests/test_a.py::test_two[a b]"]
+
+
+def test_plain_unit_runs_leave_the_history_alone(tmp_path):
+    (tmp_path / "test_unit.py").write_text("def test_fast():\n    pass\n")
+    durations = tmp_path / "durations.json"
+    env = dict(os.environ, SELENIUM_LAB_DURATIONS_FILE=str(durations))
+    env.pop(parallel.SHARD_ENV, None)
+    subprocess.run([sys.executable, "-m", "pytest", "-p", "selenium_lab.pytest_plugin", "-p", "no:cacheprovider",
+                    str(tmp_path)], env=env, capture_output=True, check=True)
+    assert not durations.exists()
+
+
+def test_history_averages_and_guesses_unknown_tests(tmp_path):
+    path = str(tmp_path / "durations.json")
+    DurationHistory(path).save({"t::a": 4.0, "t::b": 1.0, "t::c": 2.0})
+    history = DurationHistory(path)
+    history.save({"t::a": 2.0})
+    expected = DurationHistory(path).expected(["t::a", "t::b", "t::c", "t::new"])
+    assert expected == {"t::a": 3.0, "t::b": 1.0, "t::c": 2.0, "t::new": 2.0}
+
+
+def test_auto_workers_respects_memory(monkeypatch):
+    monkeypatch.setattr(parallel, "available_memory", lambda: 2 * config.WORKER_MEMORY_MB * 1024 * 1024)
+    assert parallel.auto_workers() <= 2
+    assert parallel.auto_workers(tests=1) == 1
+    monkeypatch.setattr(parallel, "available_memory", lambda: 0)
+    assert parallel.auto_workers() == 1
+
+
+def test_workers_run_their_shards(tmp_path, monkeypatch):
+    suite = tmp_path / "suite"
+    suite.mkdir()
+    (suite / "test_sample.py").write_text(textwrap.dedent("""
+        import os
+
+        def test_one():
+            assert os.environ["SELENIUM_LAB_WORKER"] in ("0", "1")
+
+        def test_two():
+            pass
+
+        def test_three():
+            pass
+    """))
+    durations = str(tmp_path / "durations.json")
+    monkeypatch.setenv("SELENIUM_LAB_DURATIONS_FILE", durations)
+    monkeypatch.setattr(config, "DURATIONS_FILE", durations)
+    monkeypatch.setattr(config, "ARTIFACT_DIR", str(tmp_path / "debug"))
+    assert parallel.run(["-p", "selenium_lab.pytest_plugin", str(suite)], workers=2) == 0
+    logs = [(tmp_path / "debug" / f"worker-{i}.log").read_text() for i in (0, 1)]
+    assert sorted(int(re.search(r"(\d+) passed", log).group(1)) for log in logs) == [1, 2]
+    with open(durations) as f:
+        assert sorted(json.load(f)) == [f"test_sample.py::test_{n}" for n in ("one", "three", "two")]
@@ -0,0 +1,118 @@
+# tests/test_screenshots.py
+"""Checks for selenium_lab.screenshots using a fake driver (no real browser needed)."""
+
+import base64
+import io
+import os
+
+import numpy as np
+import pytest
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+
+from selenium_lab import screenshots
+from selenium_lab.screenshots import RECTS_SCRIPT, element_screenshots, full_page_screenshot
+
+Image = pytest.importorskip("PIL.Image")
+
+
+def _png(pixels):
+    out = io.BytesIO()
+    Image.fromarray(pixels).save(out, "PNG")
+    return out.getvalue()
+
+
+def _pixels(png):
+    return np.asarray(Image.open(io.BytesIO(png)))
+
+
+# a 200 x 100 CSS px document rendered at devicePixelRatio 2, a different colour per pixel
+PAGE = (np.arange(400 * 200 * 3) % 251).astype(np.uint8).reshape(200, 400, 3)
+RECTS = {
+    "header": {"x": 10, "y": 5, "width": 50, "height": 20},
+    "row": {"x": 100, "y": 60, "width": 80.5, "height": 10},
+    "hidden": {"x": 0, "y": 0, "width": 0, "height": 0},
+}
+
+
+class FakeDriver:
+    def __init__(self):
+        self.captures = []
+
+    def execute_script(self, script, targets):
+        assert script == RECTS_SCRIPT
+        rects = [RECTS.get(value) for by, value in targets]
+        return {"rects": rects, "dpr": 2, "scrollX": 0, "scrollY": 0, "width": 400, "height": 200}
+
+    def execute_cdp_cmd(self, cmd, params):
+        assert cmd == "Page.captureScreenshot" and params["captureBeyondViewport"]
+        clip = params["clip"]
+        self.captures.append(clip)
+        x0, y0 = int(clip["x"] * 2), int(clip["y"] * 2)
+        x1, y1 = int((clip["x"] + clip["width"]) * 2 + 0.5), int((clip["y"] + clip["height"]) * 2 + 0.5)
+        return {"data": base64.b64encode(_png(PAGE[y0:y1, x0:x1])).decode("ascii")}
+
+
+def test_one_capture_is_cropped_per_element():
+    driver = FakeDriver()
+    header, row, hidden, missing = element_screenshots(
+        driver, [(By.ID, "header"), (By.ID, "row"), (By.ID, "hidden"), (By.ID, "missing")])
+    assert len(driver.captures) == 1 and hidden is None and missing is None
+    assert np.array_equal(_pixels(header), PAGE[10:50, 20:120])
+    assert np.array_equal(_pixels(row), PAGE[120:140, 200:361])   # 80.5 px wide -> 161 device px
+
+
+def test_paths_get_the_pngs(tmp_path):
+    paths = [str(tmp_path / "header.png"), str(tmp_path / "missing.png")]
+    written = element_screenshots(FakeDriver(), [(By.ID, "header"), (By.ID, "missing")], paths=paths)
+    assert written == [paths[0], None]
+    with open(paths[0], "rb") as f:
+        assert np.array_equal(_pixels(f.read()), PAGE[10:50, 20:120])
+
+
+def test_far_apart_elements_get_separate_captures(monkeypatch):
+    monkeypatch.setattr(screenshots, "MAX_CAPTURE_PIXELS", 10000)  # header + row together are 341 x 130 device px
+    driver = FakeDriver()
+    header, row = element_screenshots(driver, [(By.ID, "header"), (By.ID, "row")])
+    assert len(driver.captures) == 2
+    assert np.array_equal(_pixels(header), PAGE[10:50, 20:120])
+    assert np.array_equal(_pixels(row), PAGE[120:140, 200:361])
+
+
+def test_failed_capture_falls_back_to_element_screenshots():
+    class FailingDriver(FakeDriver):
+        def execute_cdp_cmd(self, cmd, params):
+            raise WebDriverException("unable to capture screenshot")
+
+        def find_element(self, by, value):
+            return type("Element", (), {"screenshot_as_png": b"own " + value.encode()})()
+
+    assert element_screenshots(FailingDriver(), [(By.ID, "header"), (By.ID, "row")]) == [b"own header", b"own row"]
+
+
+class ScrollingDriver:
+    """A 100 x 100 px page in a 100 x 40 viewport with no DevTools: full pages must be stitched."""
+
+    def __init__(self):
+        self.scroll_y = 0
+        self.scrolls = []
+
+    def execute_script(self, script):
+        return {"width": 100, "height": 100, "viewportWidth": 100, "viewportHeight": 40, "dpr": 1, "scrollY": 0}
+
+    def execute_async_script(self, script, y):
+        self.scroll_y = min(y, 100 - 40)    # the browser clamps at the bottom
+        self.scrolls.append(self.scroll_y)
+        return self.scroll_y
+
+    def get_screenshot_as_png(self):
+        return _png(PAGE[self.scroll_y:self.scroll_y + 40, :100])
+
+
+def test_full_page_is_stitched_from_viewport_tiles(tmp_path):
+    driver = ScrollingDriver()
+    path = full_page_screenshot(driver, str(tmp_path / "page.png"))
+    with open(path, "rb") as f:
+        assert np.array_equal(_pixels(f.read()), PAGE[:100, :100])
+    assert driver.scrolls == [0, 40, 60, 0]     # three tiles, then back where the page was
+    assert os.listdir(tmp_path) == ["page.png"]
@@ -0,0 +1,68 @@
+# tests/test_settle.py
+"""Checks for selenium_lab.settle and selenium_lab.sleep_audit (no real browser needed)."""
+
+import time
+
+from selenium.common.exceptions import JavascriptException, UnexpectedAlertPresentException
+
+from selenium_lab import config
+from selenium_lab.settle import SETTLE_SCRIPT, linger, settle
+from selenium_lab.sleep_audit import audit_sleeps, find_sleeps, summarize
+
+
+class FakeDriver:
+    """Answers SETTLE_SCRIPT with ``answers`` (a result dict, or an exception to raise)."""
+
+    def __init__(self, *answers):
+        self.answers = list(answers)
+        self.calls = []
+
+    def execute_async_script(self, script, quiet_ms, timeout_ms):
+        assert script == SETTLE_SCRIPT
+        self.calls.append((quiet_ms, timeout_ms))
+        answer = self.answers.pop(0)
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+
+def test_settle_is_one_script_call():
+    driver = FakeDriver({"settled": True, "waited": 230, "reason": None})
+    result = settle(driver, quiet_ms=100, timeout=5)
+    assert result and result.reason is None
+    (quiet_ms, timeout_ms), = driver.calls
+    assert quiet_ms == 100 and 4900 < timeout_ms <= 5000
+
+
+def test_busy_page_is_reported_not_raised():
+    result = settle(FakeDriver({"settled": False, "waited": 1000, "reason": "network"}), timeout=1)
+    assert not result and result.reason == "network"
+
+
+def test_settle_follows_navigation_and_stops_at_alerts():
+    unloaded = JavascriptException("javascript error: document unloaded while waiting for result")
+    driver = FakeDriver(unloaded, {"settled": True, "waited": 200, "reason": None})
+    assert settle(driver, timeout=5) and len(driver.calls) == 2
+
+    result = settle(FakeDriver(UnexpectedAlertPresentException()))
+    assert result and result.reason == "alert"
+
+
+def test_linger_is_off_by_default(monkeypatch):
+    monkeypatch.setattr(config, "LINGER", 0)
+    with audit_sleeps() as events:
+        linger()
+    assert events == []
+
+
+def test_sleep_audit_finds_and_times_sleeps(tmp_path):
+    script = tmp_path / "demo.py"
+    script.write_text("import time\nfrom time import sleep\ntime.sleep(2)\nsleep(0.5)\ntime.sleep(delay)\n")
+    assert [(line, seconds) for _, line, seconds in find_sleeps([str(tmp_path)])] == [(3, 2), (4, 0.5), (5, None)]
+
+    with audit_sleeps() as events:
+        for _ in range(2):
+            time.sleep(0.01)
+    assert len(events) == 2 and all("test_settle.py:" in where for where, _, _ in events)
+    lines = summarize(events)
+    assert "2x" in lines[0] and "total in 2 sleeps at 1 call sites" in lines[-1]
@@ -1,13 +1,13 @@
 # test_setup.py
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # repo root, for selenium_lab
+from selenium_lab.driver_factory import create_chrome_driver
 
 def main():
-    service = Service(ChromeDriverManager().install())
-    options = webdriver.ChromeOptions()
-    # options.add_argument('--headless')  # uncomment to run headless
-    driver = webdriver.Chrome(service=service, options=options)
+    # set SELENIUM_LAB_HEADLESS=1 to run headless
+    driver = create_chrome_driver(maximize=False)
     try:
         driver.get("https://www.google.com")
         print("Page Title:", driver.title)
@@ -0,0 +1,40 @@
+# tests/test_table_extraction.py
+"""Checks for selenium_lab.tables in Chrome against the local fixture server (skipped without Chrome)."""
+
+import pytest
+from selenium.webdriver.common.by import By
+
+from selenium_lab.driver_factory import find_chrome_binary
+from selenium_lab.fixture_server import FixtureServer
+from selenium_lab.tables import extract_table, iter_table_chunks
+
+pytestmark = pytest.mark.skipif(find_chrome_binary() is None, reason="needs Chrome")
+
+
+@pytest.fixture(scope="module")
+def tables_url():
+    with FixtureServer() as server:
+        yield server.url + "/tables"
+
+
+def test_extract_table_matches_per_cell_text(driver, tables_url):
+    driver.get(tables_url)
+    table = extract_table(driver, (By.ID, "table1"), attributes=["class"])
+
+    assert table.headers == ["Last Name", "First Name", "Email", "Due", "Web Site", "Action"]
+    assert table.total_rows == len(table) == 4
+
+    rows = driver.find_elements(By.CSS_SELECTOR, "#table1 tbody tr")
+    expected = [[td.text.strip() for td in row.find_elements(By.TAG_NAME, "td")] for row in rows]
+    assert [list(r) for r in table.rows()] == expected
+
+    table2 = extract_table(driver, (By.ID, "table2"), attributes=["class"])
+    assert table2.attributes["class"]["Email"] == ["email"] * 4
+
+
+def test_chunked_extraction_covers_every_row(driver, tables_url):
+    driver.get(tables_url)
+    chunks = list(iter_table_chunks(driver, (By.ID, "table1"), chunk_size=3))
+    assert [len(c) for c in chunks] == [3, 1]
+    merged = extract_table(driver, (By.ID, "table1"), chunk_size=3)
+    assert merged.columns["Email"] == extract_table(driver, (By.ID, "table1")).columns["Email"]
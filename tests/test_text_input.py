@@ -0,0 +1,120 @@
+# tests/test_text_input.py
+"""Checks for selenium_lab.text_input using a fake driver (no real browser needed)."""
+
+import pytest
+from selenium.common.exceptions import ElementNotInteractableException
+from selenium.webdriver.common.by import By
+
+from selenium_lab import text_input
+from selenium_lab.locking import read_json
+from selenium_lab.text_input import CLEAR_SCRIPT, STRATEGIES, VERIFY_SCRIPT, InputStats, type_text
+
+LOCATOR = (By.ID, "target")
+
+
+class FakeDriver:
+    """A field whose value the fake strategies type into; CLEAR_SCRIPT and VERIFY_SCRIPT act on it."""
+
+    current_url = "https://the-internet.herokuapp.com/key_presses"
+
+    def __init__(self, value="", clearable=True, slow=()):
+        self.value = value
+        self.clearable = clearable
+        self.slow = set(slow)       # strategies whose typing shows up only after the verify timeout
+        self.verified = 0
+        self.last = None
+
+    def find_element(self, by, value):
+        return object()
+
+    def execute_script(self, script, el):
+        assert script == CLEAR_SCRIPT
+        if self.clearable:
+            self.value = ""
+        return self.value
+
+    def execute_async_script(self, script, el, text, before, timeout_ms):
+        assert script == VERIFY_SCRIPT and text == "Hello"
+        self.verified += 1
+        if self.last in self.slow:
+            return False
+        return before != text and self.value == text
+
+
+@pytest.fixture
+def strategies(monkeypatch):
+    """Replace the strategies with fakes; ``working`` names the ones that get text in."""
+    calls, working = [], set()
+
+    def fake(name):
+        def run(el, text, driver):
+            calls.append(name)
+            if name == "actions":
+                raise ElementNotInteractableException("not reachable by keyboard")
+            driver.last = name
+            if name in working:
+                driver.value += text
+        return run
+
+    monkeypatch.setattr(text_input, "STRATEGIES", {name: fake(name) for name in STRATEGIES})
+    return calls, working
+
+
+def test_first_run_walks_the_ladder_and_records_every_rung(tmp_path, strategies):
+    calls, working = strategies
+    working.add("js")
+    path = str(tmp_path / "stats.json")
+    result = type_text(FakeDriver(), LOCATOR, "Hello", stats=InputStats(path))
+    assert result.strategy == "js" and result.attempts == ["standard", "click", "actions", "js"]
+
+    saved = read_json(path)["the-internet.herokuapp.com id=target"]
+    assert saved["standard"]["fail"] == saved["actions"]["fail"] == 1
+    assert saved["js"]["ok"] == 1 and saved["js"]["seconds"] >= 0
+
+
+def test_next_run_starts_with_what_worked(tmp_path, strategies):
+    calls, working = strategies
+    working.add("js")
+    path = str(tmp_path / "stats.json")
+    type_text(FakeDriver(), LOCATOR, "Hello", stats=InputStats(path))
+    calls.clear()
+
+    driver = FakeDriver()
+    result = type_text(driver, LOCATOR, "Hello", stats=InputStats(path))
+    assert calls == ["js"] and result.attempts == ["js"] and driver.verified == 1
+
+
+def test_order_prefers_reliable_then_fast_and_tries_failures_last():
+    stats = InputStats("/nonexistent/stats.json")
+    stats.data["k"] = {
+        "standard": {"ok": 0, "fail": 3, "seconds": 0.0},
+        "click": {"ok": 4, "fail": 0, "seconds": 2.0},      # 0.5 s each
+        "js": {"ok": 4, "fail": 0, "seconds": 0.4},         # 0.1 s each
+    }
+    assert stats.order("k") == ["js", "click", "actions", "standard"]
+    stats.data["k"]["js"]["fail"] = 4                       # fast but only works half the time
+    assert stats.order("k") == ["click", "js", "actions", "standard"]
+
+
+def test_nothing_works_raises_and_still_saves(tmp_path, strategies):
+    path = str(tmp_path / "stats.json")
+    with pytest.raises(RuntimeError, match="standard, click, actions, js"):
+        type_text(FakeDriver(), LOCATOR, "Hello", stats=InputStats(path))
+    saved = read_json(path)["the-internet.herokuapp.com id=target"]
+    assert all(entry["fail"] == 1 for entry in saved.values())
+
+
+def test_late_rung_is_cleared_away_and_not_credited_to_the_next(tmp_path, strategies):
+    calls, working = strategies
+    working.update(["standard", "click"])
+    driver = FakeDriver(slow=["standard"])
+    path = str(tmp_path / "stats.json")
+    result = type_text(driver, LOCATOR, "Hello", stats=InputStats(path))
+    assert result.strategy == "click" and driver.value == "Hello"     # not "HelloHello"
+
+
+def test_text_already_in_the_field_is_no_success(tmp_path, strategies):
+    calls, working = strategies
+    working.add("standard")
+    with pytest.raises(RuntimeError):
+        type_text(FakeDriver(value="Hello", clearable=False), LOCATOR, "Hello", stats=InputStats(str(tmp_path / "s.json")))
@@ -0,0 +1,73 @@
+# tests/test_visual.py
+"""Checks for selenium_lab.visual on generated images (no real browser needed)."""
+
+import io
+
+import numpy as np
+import pytest
+from selenium.webdriver.common.by import By
+
+from selenium_lab import visual
+from selenium_lab.visual import BaselineIndex, changed_regions, diff_images
+
+Image = pytest.importorskip("PIL.Image")
+
+
+def _png(pixels):
+    out = io.BytesIO()
+    Image.fromarray(pixels).save(out, "PNG")
+    return out.getvalue()
+
+
+def _page(seed=0):
+    pixels = np.full((120, 200, 3), 240, dtype=np.uint8)
+    pixels[10:30, 10:190] = (30, 60, 200)          # a header bar
+    pixels[50:110, 20 + seed:80 + seed] = 0         # a block that can move
+    return pixels
+
+
+def test_identical_files_are_not_decoded(tmp_path, monkeypatch):
+    index = BaselineIndex(str(tmp_path))
+    key = BaselineIndex.key("tests/test_login.py::test_ok", (By.ID, "flash"))
+    index.approve(key, _png(_page()))
+    monkeypatch.setattr(visual, "_decode", lambda png: pytest.fail("decoded an identical screenshot"))
+    assert index.check(key, _png(_page())).status == "identical"
+    assert BaselineIndex(str(tmp_path)).check(key, _png(_page())), "index survives a reload"
+
+
+def test_pixel_diff_finds_regions_and_honours_masks_and_tolerance():
+    base, moved = _page(), _page(seed=40)
+    result = diff_images(_png(base), _png(moved), tolerance=8)
+    assert result.status == "changed" and result.changed_pixels == 2 * 40 * 60
+    assert result.regions == [(16, 48, 48, 64), (80, 48, 48, 64)]   # the overlap stayed black
+
+    masked = diff_images(_png(base), _png(moved), masks=[(0, 40, 200, 80)])
+    assert masked.status == "same" and masked.regions == []
+
+    noisy = base.copy()
+    noisy[::2] += 3                                # re-rendering noise below the tolerance
+    assert diff_images(_png(base), _png(noisy), tolerance=8).status == "same"
+    assert diff_images(_png(base), _png(base[:100])).status == "size"
+
+
+def test_regions_are_connected_groups():
+    changed = np.zeros((64, 64), dtype=bool)
+    changed[0:5, 0:5] = True
+    changed[40:50, 40:60] = True
+    assert changed_regions(changed) == [(0, 0, 16, 16), (32, 32, 32, 32)]
+
+
+def test_check_many_uses_worker_processes_and_keeps_order(tmp_path):
+    index = BaselineIndex(str(tmp_path / "baselines"))
+    candidates = []
+    for i in range(6):
+        key = BaselineIndex.key(f"tests/test_pages.py::test_{i}")
+        index.approve(key, _png(_page()))
+        path = tmp_path / f"shot-{i}.png"
+        path.write_bytes(_png(_page(seed=40 if i % 2 else 0)))
+        candidates.append((key, str(path)))
+    candidates.append((BaselineIndex.key("tests/test_pages.py::test_new"), str(tmp_path / "shot-0.png")))
+
+    results = index.check_many(candidates, workers=2)
+    assert [r.status for r in results] == ["identical", "changed"] * 3 + ["new"]
+    assert all(r.key == key for r, (key, _) in zip(results, candidates))
@@ -0,0 +1,84 @@
+# tests/test_wait_budget.py
+"""Checks for selenium_lab.wait_budget using a fake driver (no real browser needed)."""
+
+import time
+
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.support.ui import WebDriverWait
+
+from selenium_lab.wait_budget import instrument, ranking
+
+_real_sleep = time.sleep  # the fake browser "waits" without being counted as a test sleep
+
+
+class FakeDriver:
+    """Knows no elements; find commands block for the implicit wait like a real browser."""
+
+    def __init__(self, implicit=0.05):
+        self.implicit = implicit
+        self.commands = []
+
+    def execute(self, command, params=None):
+        self.commands.append((command, params))
+        if command == Command.SET_TIMEOUTS:
+            self.implicit = params["implicit"] / 1000.0
+            return {"value": None}
+        _real_sleep(self.implicit)
+        if command == Command.FIND_ELEMENTS:
+            return {"value": []}
+        raise NoSuchElementException()
+
+    def find_elements(self, by, value):
+        return self.execute(Command.FIND_ELEMENTS, {"using": by, "value": value})["value"]
+
+    def find_element(self, by, value):
+        return self.execute(Command.FIND_ELEMENT, {"using": by, "value": value})
+
+
+def test_negative_find_is_charged_to_the_test_line():
+    driver = FakeDriver()
+    with instrument(driver, implicit_wait=0.05) as record:
+        assert driver.find_elements(By.ID, "cookie-banner") == []
+    assert len(record.negative_finds) == 1
+    where, what, seconds = record.negative_finds[0]
+    assert "test_wait_budget.py:" in where
+    assert what == "id=cookie-banner" and seconds >= 0.05
+    assert record.implicit >= 0.05 and record.wasted >= 0.05
+
+
+def test_find_inside_explicit_wait_is_a_conflict():
+    driver = FakeDriver()
+    with instrument(driver, implicit_wait=0.05) as record:
+        try:
+            WebDriverWait(driver, 0.12, poll_frequency=0.01).until(lambda d: d.find_element(By.ID, "finish"))
+        except TimeoutException:
+            pass
+    assert record.conflicts and not record.negative_finds
+    assert record.explicit >= 0.12
+    assert record.sleep == 0  # WebDriverWait's own poll sleeps are explicit wait time
+
+
+def test_zero_implicit_inside_explicit_waits_removes_conflicts():
+    driver = FakeDriver()
+    with instrument(driver, implicit_wait=0.05, zero_implicit=True) as record:
+        try:
+            WebDriverWait(driver, 0.05, poll_frequency=0.01).until(lambda d: d.find_elements(By.ID, "finish"))
+        except TimeoutException:
+            pass
+    assert not record.conflicts
+    timeouts = [params["implicit"] for command, params in driver.commands if command == Command.SET_TIMEOUTS]
+    assert timeouts == [0, 50]  # zeroed for the wait, then restored
+    assert driver.implicit == 0.05
+
+
+def test_sleeps_are_recorded_and_hooks_removed_afterwards():
+    original_sleep, original_until = time.sleep, WebDriverWait.until
+    driver = FakeDriver(implicit=0)
+    with instrument(driver) as record:
+        time.sleep(0.02)
+    assert record.sleep >= 0.02 and record.sleeps[0][1] == "sleep(0.02)"
+    assert time.sleep is original_sleep and WebDriverWait.until is original_until
+    assert "execute" not in vars(driver)
+    assert "sleep" in "\n".join(ranking([record]))
@@ -0,0 +1,148 @@
+# tests/test_waits.py
+"""Checks for selenium_lab.waits using fake drivers (no real browser needed)."""
+
+import time
+
+import pytest
+from selenium.common.exceptions import (
+    InvalidSelectorException,
+    JavascriptException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+
+from selenium_lab import waits
+from selenium_lab.waits import OBSERVE_SCRIPT, RACE_SCRIPT, ObserverWait, click_first, race
+
+
+class FakeElement:
+    def __init__(self, stale_clicks=0):
+        self.stale_clicks = stale_clicks
+        self.clicks = 0
+
+    def click(self):
+        if self.stale_clicks:
+            self.stale_clicks -= 1
+            raise StaleElementReferenceException()
+        self.clicks += 1
+
+
+class FakeDriver:
+    """Answers RACE_SCRIPT with ``hits`` one poll at a time (None = nothing matched yet)."""
+
+    def __init__(self, hits=()):
+        self.hits = list(hits)
+        self.calls = 0
+
+    def execute_script(self, script, locators, clickable):
+        assert script == RACE_SCRIPT
+        self.calls += 1
+        return self.hits.pop(0) if self.hits else None
+
+
+LOCATORS = [(By.XPATH, f"//button[{i}]") for i in range(9)]
+
+
+def test_race_returns_first_match_with_index():
+    button = FakeElement()
+    driver = FakeDriver([None, None, [3, button]])
+    hit = race(driver, LOCATORS, timeout=2, poll=0.01)
+    assert hit.index == 3 and hit.element is button and hit.locator == LOCATORS[3]
+    assert driver.calls == 3  # one script per poll, not one per locator
+
+
+def test_race_shares_one_deadline_across_all_locators():
+    driver = FakeDriver()
+    start = time.monotonic()
+    with pytest.raises(TimeoutException):
+        race(driver, LOCATORS, timeout=0.3, poll=0.05)
+    assert time.monotonic() - start < 1.0
+
+
+def test_click_first_returns_none_without_banner():
+    assert click_first(FakeDriver(), LOCATORS, timeout=0.1, poll=0.02) is None
+
+
+def test_click_first_retries_stale_element_within_deadline():
+    stale, fresh = FakeElement(stale_clicks=1), FakeElement()
+    driver = FakeDriver([[0, stale], [1, fresh]])
+    hit = click_first(driver, LOCATORS, timeout=2, poll=0.01)
+    assert hit.element is fresh and fresh.clicks == 1
+
+
+class FakeObservingDriver:
+    """Answers OBSERVE_SCRIPT with ``answers`` (a value, or an exception to raise)."""
+
+    def __init__(self, answers=(), element=None):
+        self.answers = list(answers)
+        self.element = element
+        self.async_calls = []
+        self.find_calls = 0
+
+    def execute_async_script(self, script, kind, by, value, extra, timeout_ms):
+        assert script == OBSERVE_SCRIPT
+        self.async_calls.append((kind, timeout_ms))
+        answer = self.answers.pop(0) if self.answers else None
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+    def find_element(self, by, value):
+        self.find_calls += 1
+        if self.element is None:
+            raise NoSuchElementException()
+        return self.element
+
+
+def test_observed_wait_is_one_round_trip():
+    element = FakeElement()
+    driver = FakeObservingDriver([{"element": element}])
+    found = ObserverWait(driver, 15).until(waits.presence_of_element_located((By.ID, "finish")))
+    assert found is element
+    assert len(driver.async_calls) == 1
+    kind, timeout_ms = driver.async_calls[0]
+    assert kind == "presence" and 14000 < timeout_ms <= 15000
+
+
+def test_observed_wait_times_out_on_the_wait_deadline():
+    driver = FakeObservingDriver()
+    with pytest.raises(TimeoutException):
+        ObserverWait(driver, 0.05).until(waits.invisibility_of_element_located((By.ID, "loading")))
+    assert driver.async_calls and driver.async_calls[0][1] <= 50
+
+
+def test_observed_condition_is_a_drop_in_for_webdriverwait():
+    driver = FakeObservingDriver([None, {"value": True}])
+    assert WebDriverWait(driver, 5, poll_frequency=0.01).until(
+        waits.text_to_be_present_in_element((By.ID, "finish"), "Hello")) is True
+    assert [kind for kind, _ in driver.async_calls] == ["text", "text"]
+
+
+def test_falls_back_to_polling_when_the_observer_cannot_run():
+    element = FakeElement()
+    element.is_displayed = lambda: True
+    driver = FakeObservingDriver([JavascriptException("MutationObserver is not defined")], element=element)
+    condition = waits.visibility_of_element_located((By.ID, "finish"))
+    assert ObserverWait(driver, 1, poll_frequency=0.01).until(condition) is element
+    assert condition.polling and len(driver.async_calls) == 1 and driver.find_calls == 1
+
+
+@pytest.mark.parametrize("observed", [True, False])
+def test_invisibility_returns_the_hidden_element_or_true_on_both_paths(observed):
+    hidden = FakeElement()
+    hidden.is_displayed = lambda: False
+    for element, answer, expected in [(hidden, {"element": hidden}, hidden), (None, {"value": True}, True)]:
+        answers = [answer] if observed else [JavascriptException("MutationObserver is not defined")]
+        driver = FakeObservingDriver(answers, element=element)
+        condition = waits.invisibility_of_element_located((By.ID, "loading"))
+        assert ObserverWait(driver, 1, poll_frequency=0.01).until(condition) is expected
+        assert condition.polling is not observed
+
+
+def test_bad_locator_is_reported():
+    driver = FakeObservingDriver([{"error": "not a valid XPath expression"}])
+    with pytest.raises(InvalidSelectorException):
+        ObserverWait(driver, 1).until(waits.presence_of_element_located((By.XPATH, "//[")))
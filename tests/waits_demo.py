@@ -6,15 +6,20 @@ Copy-paste into VS Code and run:
 Make sure your virtualenv is active and selenium + webdriver-manager are installed.
 """
 
-import time
 import traceback
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # repo root, for selenium_lab
+from selenium_lab.artifacts import save_debug
+from selenium_lab.driver_factory import create_chrome_driver
+from selenium_lab import waits
+from selenium_lab.urls import url_for
+from selenium_lab.waits import ObserverWait
 
 # -------------------------
 # Configuration / Defaults
@@ -22,33 +27,14 @@ import os
 DEFAULT_IMPLICIT_WAIT = 5    # seconds (if you use implicit waits at all)
 DEFAULT_EXPLICIT_TIMEOUT = 15
 DEBUG_DIR = os.path.join(os.getcwd(), "debug_waits")
-os.makedirs(DEBUG_DIR, exist_ok=True)
-
-
-def save_debug(driver, name="debug"):
-    """Save screenshot and page source for debugging."""
-    ts = time.strftime("%Y%m%d-%H%M%S")
-    png = os.path.join(DEBUG_DIR, f"{name}-{ts}.png")
-    html = os.path.join(DEBUG_DIR, f"{name}-{ts}.html")
-    try:
-        driver.save_screenshot(png)
-        with open(html, "w", encoding="utf-8") as f:
-            f.write(driver.page_source)
-        print(f"[debug saved] {png}")
-        print(f"[debug saved] {html}")
-    except Exception as e:
-        print("Failed to save debug:", e)
 
 
-def init_driver(implicit_wait=None, headless=False):
-    """Initialize Chrome driver with optional implicit wait."""
-    service = Service(ChromeDriverManager().install())
+def init_driver(implicit_wait=None, headless=None):
+    """Initialize Chrome driver with optional implicit wait (headless=None follows SELENIUM_LAB_HEADLESS)."""
     options = webdriver.ChromeOptions()
     if headless:
-        options.add_argument("--headless=new")
         options.add_argument("--disable-gpu")
-    driver = webdriver.Chrome(service=service, options=options)
-    driver.maximize_window()
+    driver = create_chrome_driver(headless=headless, options=options)
     if implicit_wait is not None:
         driver.implicitly_wait(implicit_wait)
         print(f"[init] implicit wait set to {implicit_wait}s")
@@ -125,37 +111,38 @@ def demo_explicit_waits():
     except Exception as e:
         print("Exception during explicit waits demo:", e)
         traceback.print_exc()
-        save_debug(driver, "explicit_waits_failure")
+        save_debug(driver, "explicit_waits_failure", root=DEBUG_DIR)
         raise
     finally:
         driver.quit()
 
 
 # -------------------------
-# DEMO: fluent wait (custom poll frequency)
+# DEMO: fluent wait (observed instead of polled)
 # -------------------------
 def demo_fluent_wait():
     """
-    Fluent-style wait using WebDriverWait with a custom poll_frequency.
-    WebDriverWait already supports poll_frequency; this is the 'fluent' style.
+    Fluent-style wait. WebDriverWait(driver, 20, poll_frequency=0.5) would ask the
+    browser every 0.5s; ObserverWait + selenium_lab.waits conditions watch the page
+    with a MutationObserver and answer in one round trip as soon as #finish shows.
+    poll_frequency is only used if the observer cannot run and it falls back to polling.
     """
     print("\n--- demo_fluent_wait ---")
     driver = init_driver(implicit_wait=0)
-    # poll every 0.5s, timeout 20s
-    wait = WebDriverWait(driver, 20, poll_frequency=0.5, ignored_exceptions=[Exception])
+    wait = ObserverWait(driver, 20, poll_frequency=0.5, ignored_exceptions=[Exception])
 
     try:
-        driver.get("https://the-internet.herokuapp.com/dynamic_loading/1")
+        driver.get(url_for("/dynamic_loading/1"))
         print("Page opened:", driver.title)
         # Click the start button which begins a dynamic load
         driver.find_element(By.CSS_SELECTOR, "#start button").click()
         # Wait until the loading finishes and the element with id 'finish' is visible
-        finish = wait.until(EC.visibility_of_element_located((By.ID, "finish")))
+        finish = wait.until(waits.visibility_of_element_located((By.ID, "finish")))
         print("Fluent wait: found text ->", finish.text)
     except Exception as e:
         print("Exception in fluent wait demo:", e)
         traceback.print_exc()
-        save_debug(driver, "fluent_waits_failure")
+        save_debug(driver, "fluent_waits_failure", root=DEBUG_DIR)
         raise
     finally:
         driver.quit()
@@ -169,6 +156,9 @@ class element_has_non_empty_text:
     Example of creating a custom ExpectedCondition that checks for non-empty text inside element.
     WebDriverWait will call this until it returns a truthy value or times out.
     Usage: WebDriverWait(driver, timeout).until(element_has_non_empty_text((By.ID, 'msg')))
+
+    Each poll is a find_element + .text round trip; waits.element_has_non_empty_text
+    is the observed version used in demo_custom_expected_condition below.
     """
 
     def __init__(self, locator):
@@ -188,16 +178,16 @@ class element_has_non_empty_text:
 def demo_custom_expected_condition():
     print("\n--- demo_custom_expected_condition ---")
     driver = init_driver(implicit_wait=0)
-    wait = WebDriverWait(driver, 20, poll_frequency=0.5)
+    wait = ObserverWait(driver, 20, poll_frequency=0.5)
     try:
-        driver.get("https://the-internet.herokuapp.com/dynamic_loading/2")
+        driver.get(url_for("/dynamic_loading/2"))
         driver.find_element(By.CSS_SELECTOR, "#start button").click()
-        # Wait until #finish has non-empty text
-        el = wait.until(element_has_non_empty_text((By.ID, "finish")))
+        # Wait until #finish has non-empty text (one round trip, not one per 0.5s)
+        el = wait.until(waits.element_has_non_empty_text((By.ID, "finish")))
         print("Custom condition: text is ->", el.text)
     except Exception as e:
         print("Custom condition failed:", e)
-        save_debug(driver, "custom_condition_failure")
+        save_debug(driver, "custom_condition_failure", root=DEBUG_DIR)
         raise
     finally:
         driver.quit()
@@ -214,3 +204,4 @@ if __name__ == "__main__":
     demo_fluent_wait()
     demo_custom_expected_condition()
     print("\nAll demos complete. Check debug directory if any failures:", DEBUG_DIR)
+    print("(list with: python -m selenium_lab.artifacts --root", DEBUG_DIR + ")")